@@ -1,5 +1,7 @@
 """Testing module for :py:mod:`core.views` views related to contributions."""
 
+import asyncio
+
 import pytest
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -822,6 +824,37 @@ class TestContributionInvalidateViewDb:
             for msg in ["Failed to add reaction", "All operations failed"]
         )
 
+    def test_contributioninvalidateview_form_valid_closes_telegram_updater(
+        self, client, superuser, contribution, invalidate_url, mocker
+    ):
+        """Test Telegram reply leaves neither event loop nor client open."""
+        contribution.platform.name = "Telegram"
+        contribution.platform.save()
+        contribution.url = "https://t.me/c/1234/567"
+        contribution.save()
+        client.force_login(superuser)
+        mocker.patch(
+            "updaters.telegram.telegram_config",
+            return_value={"api_id": "api_id", "api_hash": "api_hash"},
+        )
+        telegram_client = mocker.patch("updaters.telegram.TelegramClient").return_value
+        telegram_client.connect = mocker.AsyncMock()
+        telegram_client.is_user_authorized = mocker.AsyncMock(return_value=True)
+        telegram_client.send_message = mocker.AsyncMock()
+        telegram_client.disconnect = mocker.AsyncMock()
+        mock_new_event_loop = mocker.spy(asyncio, "new_event_loop")
+        mocker.patch("asyncio.set_event_loop")
+        mocker.patch("core.models.Profile.log_action")
+
+        response = client.post(invalidate_url, {"reply": "Test reply"})
+
+        assert response.status_code == 302
+        telegram_client.send_message.assert_awaited_once_with(
+            entity=1234, message="Test reply", reply_to=567
+        )
+        telegram_client.disconnect.assert_awaited_once_with()
+        assert mock_new_event_loop.spy_return.is_closed()
+
     @pytest.mark.parametrize("reaction", ["duplicate", "wontfix"])
     def test_contributioninvalidateview_different_types(
         self, client, superuser, contribution, reaction, mocker
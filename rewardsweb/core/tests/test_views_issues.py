@@ -1204,6 +1204,57 @@ class TestIssueDetailViewSubmissionHandlers:
         call_args = mock_close_issue.call_args[1]
         assert call_args["comment"] == ""
 
+    def test_issuedetailview_handle_close_submission_reuses_platform_updater(
+        self, client, superuser, issue, contribution, mocker
+    ):
+        provider = settings.ISSUE_TRACKER_PROVIDER.lower()
+        name = provider.capitalize()
+        mocker.patch(f"issues.{provider}.{name}Provider._get_client")
+        mocker.patch(f"issues.{provider}.{name}Provider._get_repository")
+        mock_get_issue = mocker.patch(
+            f"issues.{provider}.BaseIssueProvider.issue_by_number"
+        )
+        mock_close_issue = mocker.patch(
+            f"issues.{provider}.BaseIssueProvider.close_issue_with_labels"
+        )
+        mock_update_provider = mocker.patch("core.views.UpdateProvider")
+        mocker.patch("core.models.Profile.log_action")
+        mock_get_issue.return_value = {
+            "success": True,
+            "issue": {"number": 123, "state": "open", "labels": ["bug"]},
+        }
+        mock_close_issue.return_value = {"success": True}
+        contribution.issue = issue
+        contribution.save()
+        other = Contribution.objects.create(
+            contributor=contribution.contributor,
+            cycle=contribution.cycle,
+            platform=contribution.platform,
+            reward=contribution.reward,
+            percentage=100.0,
+            url="https://example.com/contribution2",
+            confirmed=False,
+            issue=issue,
+        )
+
+        client.force_login(superuser)
+        response = client.post(
+            reverse("issue_detail", kwargs={"pk": issue.pk}),
+            {
+                "close_action": "wontfix",
+                "close_comment": "",
+                "submit_close": "Confirm Close",
+            },
+        )
+
+        assert response.status_code == 302
+        mock_update_provider.assert_called_once_with(contribution.platform.name)
+        add_reaction = mock_update_provider.return_value.add_reaction_to_message
+        assert sorted(call.args for call in add_reaction.call_args_list) == [
+            (contribution.url, "wontfix"),
+            (other.url, "wontfix"),
+        ]
+
     def test_issuedetailview_handle_close_submission_wontfix_success(
         self, client, superuser, issue, mocker
     ):
@@ -860,9 +860,15 @@ class IssueDetailView(DetailView):
             if result["success"]:
                 self.request.user.profile.log_action("issue_closed", success_message)
                 messages.success(request, success_message)
-                for contribution in self.get_object().contribution_set.all():
-                    updater = UpdateProvider(contribution.platform.name)
-                    updater.add_reaction_to_message(contribution.url, action)
+                updaters = {}
+                for contribution in self.get_object().contribution_set.select_related(
+                    "platform"
+                ):
+                    name = contribution.platform.name
+                    if name not in updaters:
+                        updaters[name] = UpdateProvider(name)
+
+                    updaters[name].add_reaction_to_message(contribution.url, action)
 
                 issue.status = (
                     IssueStatus.ADDRESSED
@@ -102,6 +102,17 @@ class BaseMentionTracker:
 
             time.sleep(1)
 
+    def poll_delay(self, poll_interval_minutes):
+        """Return number of seconds to sleep before the next poll.
+
+        Subclasses may extend the delay, e.g. to respect platform rate limits.
+
+        :param poll_interval_minutes: how often to check for mentions
+        :type poll_interval_minutes: int or float
+        :return: int or float
+        """
+        return poll_interval_minutes * 60
+
     # # processing
     def check_mentions(self):
         """Check for new mentions - to be implemented by subclasses.
@@ -121,6 +132,16 @@ class BaseMentionTracker:
         """
         return Mention.objects.is_processed(item_id, self.platform_name)
 
+    def already_processed_ids(self, item_ids):
+        """Return IDs of provided items that have already been processed.
+
+        :param item_ids: unique identifiers for the social media items
+        :type item_ids: list
+        :return: processed items' IDs as strings
+        :rtype: frozenset
+        """
+        return Mention.objects.processed_ids(item_ids, self.platform_name)
+
     def mark_processed(self, item_id, data):
         """Mark item as processed in database.
 
@@ -305,7 +326,7 @@ class BaseMentionTracker:
                     f"{self.platform_name} tracker sleeping for "
                     f"{poll_interval_minutes} minutes"
                 )
-                self._interruptible_sleep(poll_interval_minutes * 60)
+                self._interruptible_sleep(self.poll_delay(poll_interval_minutes))
 
         except KeyboardInterrupt:
             self.logger.info(f"{self.platform_name} tracker stopped by user")
@@ -111,6 +111,7 @@ def telegram_config():
         ),
         "bot_username": get_env_variable("TRACKER_TELEGRAM_BOT_USERNAME", "").lower(),
         "poll_interval": int(get_env_variable("TRACKER_TELEGRAM_POLL_INTERVAL", 10)),
+        "max_rate": float(get_env_variable("TRACKER_TELEGRAM_MAX_RATE", 0.5)),
     }
 
 
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from django.db import models
 from django.db.models import Max
 from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast
 
 
 class MentionManager(models.Manager):
@@ -35,6 +36,41 @@ class MentionManager(models.Manager):
         """
         return self.filter(item_id=item_id, platform=platform_name).exists()
 
+    def processed_ids(self, item_ids, platform_name):
+        """Return IDs of provided items that have already been processed.
+
+        :param item_ids: unique identifiers for the social media items
+        :type item_ids: list
+        :param platform_name: name of the social media platform
+        :type platform_name: str
+        :return: processed items' IDs
+        :rtype: frozenset
+        """
+        return frozenset(
+            self.filter(
+                item_id__in=[str(item_id) for item_id in item_ids],
+                platform=platform_name,
+            ).values_list("item_id", flat=True)
+        )
+
+    def last_processed_item_id(self, platform_name):
+        """Get the highest numeric item ID of processed mentions for a platform.
+
+        Used by trackers whose APIs accept the last seen item ID to return only
+        newer items, such as Twitter's `since_id`.
+
+        :param platform_name: The name of the social media platform.
+        :type platform_name: str
+        :var max_item_id: highest item ID cast to integer
+        :type max_item_id: int or None
+        :return: highest item ID, or None if no mentions are found
+        :rtype: str or None
+        """
+        max_item_id = self.filter(platform=platform_name).aggregate(
+            max_item_id=Max(Cast("item_id", models.BigIntegerField()))
+        )["max_item_id"]
+        return str(max_item_id) if max_item_id is not None else None
+
     def last_processed_timestamp(self, platform_name):
         """Get the timestamp of the last processed mention for a platform.
 
@@ -2,6 +2,7 @@
 
 import asyncio
 import math
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -11,6 +12,69 @@ from telethon.errors import SessionPasswordNeededError
 from trackers.base import BaseAsyncMentionTracker
 
 
+class AsyncTokenBucket:
+    """Asynchronous token bucket rate limiter.
+
+    Tokens are refilled continuously at `max_rate` tokens per `time_period`
+    seconds. Acquiring a token from an empty bucket reserves it in advance and
+    waits only for the time needed to refill it.
+
+    :var AsyncTokenBucket.max_rate: number of tokens refilled per time period
+    :type AsyncTokenBucket.max_rate: float
+    :var AsyncTokenBucket.time_period: duration of the time period in seconds
+    :type AsyncTokenBucket.time_period: float
+    :var AsyncTokenBucket.capacity: maximum number of tokens in the bucket
+    :type AsyncTokenBucket.capacity: float
+    :var AsyncTokenBucket._tokens: currently available tokens, negative if reserved
+    :type AsyncTokenBucket._tokens: float
+    :var AsyncTokenBucket._updated_at: monotonic time of the last refill
+    :type AsyncTokenBucket._updated_at: float
+    """
+
+    def __init__(self, max_rate, time_period=1.0):
+        """Initialize full token bucket.
+
+        :param max_rate: number of tokens refilled per time period
+        :type max_rate: float
+        :param time_period: duration of the time period in seconds
+        :type time_period: float
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.capacity = max(max_rate, 1)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    async def __aenter__(self):
+        """Acquire a token when entering the context."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Leave the context without suppressing exceptions."""
+        return False
+
+    def _refill(self):
+        """Add tokens refilled since the last update up to bucket capacity.
+
+        :var now: current monotonic time
+        :type now: float
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated_at) * self.max_rate / self.time_period,
+        )
+        self._updated_at = now
+
+    async def acquire(self):
+        """Take a token from the bucket, waiting until one is refilled."""
+        self._refill()
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens * self.time_period / self.max_rate)
+
+
 class TelegramTracker(BaseAsyncMentionTracker):
     """Tracker for Telegram mentions in specified groups/channels.
 
@@ -22,6 +86,14 @@ class TelegramTracker(BaseAsyncMentionTracker):
     :type TelegramTracker.tracked_chats: list
     :var TelegramTracker._is_connected: is client connected or not
     :type TelegramTracker._is_connected: Boolean
+    :var TelegramTracker.connect_retries: number of connection attempts
+    :type TelegramTracker.connect_retries: int
+    :var TelegramTracker._entity_cache: resolved chat entities by identifier
+    :type TelegramTracker._entity_cache: dict
+    :var TelegramTracker.concurrent_chat_checks: maximum number of concurrent checks
+    :type TelegramTracker.concurrent_chat_checks: int
+    :var TelegramTracker._limiter: limiter of the chat checks rate
+    :type TelegramTracker._limiter: :class:`AsyncTokenBucket`
     """
 
     def __init__(self, parse_message_callback, config, chats_collection):
@@ -59,6 +131,12 @@ class TelegramTracker(BaseAsyncMentionTracker):
             f"Telegram tracker initialized for {len(self.tracked_chats)} chats"
         )
         self._is_connected = False
+        self.connect_retries = 3
+        self._entity_cache = {}
+
+        # Rate limiting
+        self.concurrent_chat_checks = 3
+        self._limiter = AsyncTokenBucket(config.get("max_rate", 0.5))
 
     async def _post_init_setup(self, chats_collection):
         """Perform asynchronous setup tasks after initialization."""
@@ -66,9 +144,32 @@ class TelegramTracker(BaseAsyncMentionTracker):
             "initialized", f"Tracking {len(chats_collection)} chats"
         )
 
+    async def _connect(self):
+        """Connect Telegram client, retrying network errors with exponential backoff.
+
+        :var attempt: zero-based number of the connection attempt
+        :type attempt: int
+        """
+        for attempt in range(self.connect_retries):
+            try:
+                await self.client.connect()
+                return
+
+            except OSError as e:
+                if attempt == self.connect_retries - 1:
+                    raise
+
+                self.logger.warning(
+                    f"Telegram connection attempt {attempt + 1} failed: {e}"
+                )
+                await asyncio.sleep(2**attempt)
+
     async def _ensure_connected(self):
         """Ensure Telegram client is connected.
 
+        Authorization is checked only when connecting, as the connected
+        client stays authorized for the whole session.
+
         :var phone: app creator's phone number
         :type phone: str
         :var code: code received via Telegram app
@@ -78,7 +179,7 @@ class TelegramTracker(BaseAsyncMentionTracker):
         """
         if not self._is_connected:
             try:
-                await self.client.connect()
+                await self._connect()
                 if not await self.client.is_user_authorized():
                     phone = input("Please enter your phone number: ")
                     await self.client.send_code_request(phone)
@@ -97,43 +198,55 @@ class TelegramTracker(BaseAsyncMentionTracker):
                 raise
 
     async def cleanup(self):
-        """Perform graceful cleanup of the Telegram client."""
+        """Perform graceful cleanup of the Telegram client.
+
+        Client is marked as disconnected before awaiting the disconnect, so
+        concurrent or repeated cleanups disconnect it only once.
+        """
         if self.client and self._is_connected:
+            self._is_connected = False
             self.logger.info("Disconnecting Telegram client")
             await self.client.disconnect()
-            self._is_connected = False
 
     async def _get_chat_entity(self, chat_identifier):
         """Get chat entity from identifier.
 
+        Numeric identifiers are converted to integer IDs before the lookup and
+        resolved entities are cached, so every tracked chat is looked up
+        through Telegram's API only once.
+
         :param chat_identifier: username or ID of the chat
         :type chat_identifier: str or int
+        :var lookup: identifier passed to Telegram's API
+        :type lookup: str or int
+        :var entity: resolved chat entity
+        :type entity: :class:`telethon.tl.types.Chat` or None
         :return: chat entity object
         :rtype: :class:`telethon.tl.types.Chat` or None
         """
+        if chat_identifier in self._entity_cache:
+            return self._entity_cache[chat_identifier]
+
+        lookup = chat_identifier
+        if isinstance(chat_identifier, str) and chat_identifier.lstrip("-").isdigit():
+            lookup = int(chat_identifier)
+
         try:
-            # First try to get by username
-            entity = await self.client.get_entity(chat_identifier)
-            return entity
+            entity = await self.client.get_entity(lookup)
 
         except ValueError:
-            try:
-                # If it's an integer ID, try getting by ID
-                if (
-                    isinstance(chat_identifier, int)
-                    or chat_identifier.lstrip("-").isdigit()
-                ):
-                    chat_id = int(chat_identifier)
-                    entity = await self.client.get_entity(chat_id)
-                    return entity
-
-            except Exception:
-                pass
+            # Telethon couldn't resolve the username or ID
+            return None
 
         except Exception as e:
             self.logger.error(f"Error getting chat entity for {chat_identifier}: {e}")
+            return None
 
-        return None
+        if entity is not None:
+            self._entity_cache[chat_identifier] = entity
+            self._entity_cache[lookup] = entity
+
+        return entity
 
     async def _get_sender_info(self, message):
         """Get sender information from message.
@@ -159,11 +272,13 @@ class TelegramTracker(BaseAsyncMentionTracker):
 
         return {"user_id": message.sender_id, "username": None, "display_name": None}
 
-    async def _get_replied_message_info(self, message):
+    async def _get_replied_message_info(self, message, replied_messages=None):
         """Get information about the message being replied to.
 
         :param message: Telegram message object with reply
         :type message: :class:`telethon.tl.types.Message`
+        :param replied_messages: already fetched replied messages by their IDs
+        :type replied_messages: dict or None
         :var replied_message: the message that this message replies to
         :type replied_message: :class:`telethon.tl.types.Message` or None
         :var replied_sender: sender information of the replied message
@@ -175,9 +290,14 @@ class TelegramTracker(BaseAsyncMentionTracker):
             return None
 
         try:
-            replied_message = await self.client.get_messages(
-                message.chat_id, ids=message.reply_to_msg_id
-            )
+            if replied_messages is not None:
+                replied_message = replied_messages.get(message.reply_to_msg_id)
+
+            else:
+                replied_message = await self.client.get_messages(
+                    message.chat_id, ids=message.reply_to_msg_id
+                )
+
             if replied_message:
                 replied_sender = await self._get_sender_info(replied_message)
                 return {
@@ -190,6 +310,39 @@ class TelegramTracker(BaseAsyncMentionTracker):
 
         return None
 
+    async def _get_replied_messages(self, chat, messages):
+        """Fetch all the messages replied to by given messages in a single request.
+
+        :param chat: Telegram chat object
+        :type chat: :class:`telethon.tl.types.Chat`
+        :param messages: Telegram messages from the chat
+        :type messages: list of :class:`telethon.tl.types.Message`
+        :var reply_ids: unique IDs of the replied messages
+        :type reply_ids: list
+        :var replied: fetched replied messages, None for deleted ones
+        :type replied: list
+        :return: replied messages by their IDs or None if fetching failed
+        :rtype: dict or None
+        """
+        reply_ids = list(
+            dict.fromkeys(
+                message.reply_to_msg_id
+                for message in messages
+                if message.reply_to_msg_id
+            )
+        )
+        if not reply_ids:
+            return {}
+
+        try:
+            replied = await self.client.get_messages(chat, ids=reply_ids)
+
+        except Exception as e:
+            self.logger.debug(f"Error getting replied messages: {e}")
+            return None
+
+        return {message.id: message for message in replied if message}
+
     def _generate_message_url(self, chat, message_id):
         """Generate URL for a message.
 
@@ -202,7 +355,7 @@ class TelegramTracker(BaseAsyncMentionTracker):
         """
         return f"https://t.me/c/-{chat.id}/{message_id}"
 
-    async def extract_mention_data(self, message):
+    async def extract_mention_data(self, message, replied_messages=None):
         """Extract standardized data from a Telegram message.
 
         This method processes a Telegram message to extract structured information
@@ -210,6 +363,8 @@ class TelegramTracker(BaseAsyncMentionTracker):
 
         :param message: The Telegram message object to be processed.
         :type message: :class:`telethon.tl.types.Message`
+        :param replied_messages: Already fetched replied messages by their IDs.
+        :type replied_messages: dict or None
         :return: A dictionary containing standardized mention data.
         :var chat: The chat where the message was sent.
         :type chat: :class:`telethon.tl.types.Chat` or :class:`telethon.tl.types.Channel`
@@ -228,15 +383,15 @@ class TelegramTracker(BaseAsyncMentionTracker):
         chat = message.chat
         chat_title = getattr(chat, "title", "Private Chat")
 
-        # Get sender information
-        sender_info = await self._get_sender_info(message)
+        # Get sender and replied message information concurrently
+        sender_info, replied_info = await asyncio.gather(
+            self._get_sender_info(message),
+            self._get_replied_message_info(message, replied_messages),
+        )
 
         # Generate URLs
         suggestion_url = self._generate_message_url(chat, message.id)
 
-        # Get replied message information if this is a reply
-        replied_info = await self._get_replied_message_info(message)
-
         if replied_info:
             contribution_url = self._generate_message_url(
                 chat, replied_info["message_id"]
@@ -291,8 +446,10 @@ class TelegramTracker(BaseAsyncMentionTracker):
         :type mention_count: int
         :var chat: chat entity object
         :type chat: :class:`telethon.tl.types.Chat` or None
-        :var messages: recent messages from the chat
+        :var messages: recent unprocessed messages mentioning the bot
         :type messages: list of :class:`telethon.tl.types.Message`
+        :var replied_messages: messages replied to by the mentions
+        :type replied_messages: dict or None
         :var message: individual message from chat
         :type message: :class:`telethon.tl.types.Message`
         :var data: extracted mention data
@@ -308,6 +465,7 @@ class TelegramTracker(BaseAsyncMentionTracker):
             return 0
 
         try:
+            messages = []
             # Get recent messages (last 50)
             async for message in self.client.iter_messages(chat, limit=50):
                 # Check if message mentions the bot
@@ -319,14 +477,17 @@ class TelegramTracker(BaseAsyncMentionTracker):
                         f"telegram_{chat.id}_{message.id}"
                     )
                 ):
-
-                    data = await self.extract_mention_data(message)
-                    if await self.process_mention_async(
-                        f"telegram_{chat.id}_{message.id}",
-                        data,
-                        f"@{self.bot_username}",
-                    ):
-                        mention_count += 1
+                    messages.append(message)
+
+            replied_messages = await self._get_replied_messages(chat, messages)
+            for message in messages:
+                data = await self.extract_mention_data(message, replied_messages)
+                if await self.process_mention_async(
+                    f"telegram_{chat.id}_{message.id}",
+                    data,
+                    f"@{self.bot_username}",
+                ):
+                    mention_count += 1
 
         except Exception as e:
             self.logger.error(f"Error checking chat {chat_identifier}: {e}")
@@ -339,12 +500,15 @@ class TelegramTracker(BaseAsyncMentionTracker):
     async def check_mentions_async(self):
         """Asynchronously check for new mentions across all tracked chats.
 
-        :var total_mentions: total number of new mentions found
-        :type total_mentions: int
-        :var chat: chat identifier from tracked chats
-        :type chat: str or int
-        :var chat_mentions: mentions found in current chat
-        :type chat_mentions: int
+        Chats are checked concurrently, limited by a semaphore created for this
+        check, as `check_mentions` runs every check in a new event loop.
+
+        :var semaphore: semaphore limiting concurrent chat checks
+        :type semaphore: :class:`asyncio.Semaphore`
+        :var tasks: list of chat check coroutines
+        :type tasks: list
+        :var results: mentions count or exception from individual chat checks
+        :type results: list
         :return: total number of new mentions processed
         :rtype: int
         """
@@ -355,13 +519,46 @@ class TelegramTracker(BaseAsyncMentionTracker):
         # async for dialog in self.client.iter_dialogs():
         #     print(f"Name: {dialog.name}, ID: {dialog.id}, Type: {dialog.entity}")
 
+        semaphore = asyncio.Semaphore(self.concurrent_chat_checks)
+        tasks = [
+            self._check_chat_with_semaphore(chat, semaphore)
+            for chat in self.tracked_chats
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return self._process_check_results(results)
+
+    async def _check_chat_with_semaphore(self, chat_identifier, semaphore):
+        """Check chat for mentions within the concurrency and rate limits.
+
+        :param chat_identifier: username or ID of the chat to check
+        :type chat_identifier: str or int
+        :param semaphore: semaphore limiting concurrent chat checks
+        :type semaphore: :class:`asyncio.Semaphore`
+        :return: number of new mentions processed in the chat
+        :rtype: int
+        """
+        async with semaphore, self._limiter:
+            return await self._check_chat_mentions(chat_identifier)
+
+    def _process_check_results(self, results):
+        """Sum mentions from chat check results, logging failed checks.
+
+        :param results: list of results from chat checks
+        :type results: list
+        :var total_mentions: running total of mentions found
+        :type total_mentions: int
+        :var result: individual result from chat check
+        :type result: int or BaseException
+        :return: total number of mentions processed
+        :rtype: int
+        """
         total_mentions = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                self.logger.error(f"Error processing chat: {result}")
 
-        for chat in self.tracked_chats:
-            chat_mentions = await self._check_chat_mentions(chat)
-            total_mentions += chat_mentions
-            # Short delay between chat checks
-            await asyncio.sleep(2)
+            else:
+                total_mentions += result
 
         return total_mentions
 
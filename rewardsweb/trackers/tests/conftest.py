@@ -1,7 +1,21 @@
 """Pytest configuration for trackers package tests."""
 
+import logging
+from pathlib import Path
+from unittest import mock
+
 import pytest
 
+TELEGRAM_CLIENT_ASYNC_METHODS = (
+    "connect",
+    "disconnect",
+    "get_entity",
+    "get_messages",
+    "is_user_authorized",
+    "send_code_request",
+    "sign_in",
+)
+
 
 @pytest.fixture
 def discord_config():
@@ -31,7 +45,7 @@ def reddit_subreddits():
     return ["python", "test"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def telegram_config():
     return {
         "api_id": "test_api_id",
@@ -39,14 +53,118 @@ def telegram_config():
         "session_name": "test_session",
         "bot_username": "test_bot",
         "poll_interval": 15,
+        "max_rate": 0.5,
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def telegram_chats():
     return ["group1", "group2"]
 
 
+@pytest.fixture(scope="module")
+def telegram_session_path():
+    """Return the session file path Telegram tracker builds from test config.
+
+    :return: :class:`pathlib.Path`
+    """
+    import trackers.telegram
+
+    return (
+        Path(trackers.telegram.__file__).resolve().parent.parent
+        / "fixtures"
+        / "test_session.session"
+    )
+
+
+@pytest.fixture
+def no_sleep(mocker):
+    """Replace `asyncio.sleep` with a no-op that records requested delays.
+
+    :return: list of delays passed to `asyncio.sleep`
+    :rtype: list
+    """
+    calls = []
+
+    async def _sleep(delay, *args, **kwargs):
+        calls.append(delay)
+
+    mocker.patch("asyncio.sleep", side_effect=_sleep)
+    return calls
+
+
+@pytest.fixture
+def patched_event_loop(mocker):
+    """Make `asyncio.new_event_loop` return a mocked loop.
+
+    `asyncio.set_event_loop` is patched too, so the mocked loop is never
+    installed as the current event loop.
+
+    :return: mocked event loop
+    :rtype: :class:`unittest.mock.MagicMock`
+    """
+    loop = mocker.MagicMock()
+    mocker.patch("asyncio.new_event_loop", return_value=loop)
+    mocker.patch("asyncio.set_event_loop")
+    return loop
+
+
+@pytest.fixture(scope="module")
+def telegram_tracker_state(telegram_config, telegram_chats):
+    """Build a single Telegram tracker per module and snapshot its initial state.
+
+    :return: tracker instance and a copy of its initial attributes
+    :rtype: tuple
+    """
+    from trackers.telegram import TelegramTracker
+
+    with mock.patch("trackers.telegram.TelegramClient"):
+        instance = TelegramTracker(
+            lambda x, y=None: None, telegram_config, telegram_chats
+        )
+
+    return instance, dict(vars(instance))
+
+
+@pytest.fixture
+def telegram_tracker(telegram_tracker_state, telegram_config, telegram_chats):
+    """Return the shared Telegram tracker reset to its initial state.
+
+    Attributes assigned by previous tests are dropped, the entity cache is
+    emptied, the rate limiter is refilled, and the client, logger and
+    `log_action_async` are replaced with fresh mocks. The client is a plain
+    mock with awaitable Telethon methods the tracker uses, as autospeccing
+    `TelegramClient` for every test takes most of the module's run time.
+
+    :return: :class:`trackers.telegram.TelegramTracker`
+    """
+    from trackers.telegram import AsyncTokenBucket
+
+    instance, initial_state = telegram_tracker_state
+    instance.__dict__.clear()
+    instance.__dict__.update(initial_state)
+    instance.client = mock.MagicMock()
+    for name in TELEGRAM_CLIENT_ASYNC_METHODS:
+        setattr(instance.client, name, mock.AsyncMock())
+
+    instance.logger = mock.MagicMock(spec=logging.Logger)
+    instance._entity_cache = {}
+    instance._limiter = AsyncTokenBucket(telegram_config["max_rate"])
+    instance.tracked_chats = list(telegram_chats)
+    instance.log_action_async = mock.AsyncMock()
+    return instance
+
+
+@pytest.fixture
+def connected_telegram_tracker(telegram_tracker):
+    """Return the shared Telegram tracker marked as connected.
+
+    :return: :class:`trackers.telegram.TelegramTracker`
+    """
+    telegram_tracker._is_connected = True
+    return telegram_tracker
+
+
 @pytest.fixture
 def twitter_config():
     return {
@@ -60,6 +178,25 @@ def twitter_config():
     }
 
 
+@pytest.fixture
+def twitter_tracker(mocker, twitter_config):
+    """Return a Twitter tracker built with a mocked `tweepy.Client`.
+
+    `log_action` and the last processed item ID lookup are mocked too, so the
+    tracker never touches the database.
+
+    :return: :class:`trackers.twitter.TwitterTracker`
+    """
+    from trackers.twitter import TwitterTracker
+
+    mocker.patch("tweepy.Client")
+    mocker.patch.object(TwitterTracker, "log_action")
+    mocker.patch(
+        "trackers.models.Mention.objects.last_processed_item_id", return_value=None
+    )
+    return TwitterTracker(lambda x: None, twitter_config)
+
+
 @pytest.fixture
 def twitterapiio_config():
     return {
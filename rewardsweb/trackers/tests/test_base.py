@@ -92,6 +92,18 @@ class TestTrackersBaseMentionTracker:
         assert result is False
         mock_is_processed_orm.assert_called_once_with("test_item_id", "test_platform")
 
+    # already_processed_ids
+    def test_trackers_base_basementiontracker_already_processed_ids(self, mocker):
+        mocker.patch.object(BaseMentionTracker, "setup_logging")
+        mock_processed_ids_orm = mocker.patch(
+            "trackers.models.Mention.objects.processed_ids",
+            return_value=frozenset({"1"}),
+        )
+        instance = BaseMentionTracker("test_platform", lambda x: None)
+        result = instance.already_processed_ids([1, 2])
+        assert result == frozenset({"1"})
+        mock_processed_ids_orm.assert_called_once_with([1, 2], "test_platform")
+
     # mark_processed
     @pytest.mark.asyncio
     async def test_trackers_base_basementiontracker_mark_processed_success(
@@ -459,6 +471,12 @@ class TestTrackersBaseMentionTracker:
         # Should call sleep only once because exit_signal becomes True
         assert mock_sleep.call_count == 5
 
+    # poll_delay
+    def test_trackers_base_basementiontracker_poll_delay(self, mocker):
+        mocker.patch.object(BaseMentionTracker, "setup_logging")
+        instance = BaseMentionTracker("test_platform", lambda x: None)
+        assert instance.poll_delay(0.5) == 30
+
     # check_mentions
     def test_trackers_base_basementiontracker_check_mentions_not_implemented(
         self, mocker
@@ -491,6 +509,7 @@ class TestTrackersBaseMentionTracker:
         assert mock_register_signals.call_count == 1
         assert mock_check_mentions.call_count == 2
         assert mock_sleep.call_count == 2
+        mock_sleep.assert_called_with(instance.poll_delay(0.1))
         mock_log_action.assert_any_call("started", "Poll interval: 0.1 minutes")
 
     def test_trackers_base_basementiontracker_run_keyboard_interrupt(self, mocker):
@@ -185,6 +185,8 @@ class TestTrackersConfig:
                 return "telegram_tracker"
             if key == "TRACKER_TELEGRAM_POLL_INTERVAL":
                 return 30
+            if key == "TRACKER_TELEGRAM_MAX_RATE":
+                return 0.5
             return ""
 
         mocker.patch(
@@ -197,6 +199,7 @@ class TestTrackersConfig:
             "session_name": "telegram_tracker",
             "bot_username": "",
             "poll_interval": 30,
+            "max_rate": 0.5,
         }
         assert result == expected_config
 
@@ -208,6 +211,7 @@ class TestTrackersConfig:
             "TRACKER_TELEGRAM_SESSION_NAME": "test_session",
             "TRACKER_TELEGRAM_BOT_USERNAME": "TestBot",
             "TRACKER_TELEGRAM_POLL_INTERVAL": "20",
+            "TRACKER_TELEGRAM_MAX_RATE": "1.5",
         }.get(key, default)
         result = telegram_config()
         expected_config = {
@@ -216,6 +220,7 @@ class TestTrackersConfig:
             "session_name": "test_session",
             "bot_username": "testbot",
             "poll_interval": 20,
+            "max_rate": 1.5,
         }
         assert result == expected_config
         calls = [
@@ -224,9 +229,10 @@ class TestTrackersConfig:
             mocker.call("TRACKER_TELEGRAM_SESSION_NAME", "telegram_tracker"),
             mocker.call("TRACKER_TELEGRAM_BOT_USERNAME", ""),
             mocker.call("TRACKER_TELEGRAM_POLL_INTERVAL", 10),
+            mocker.call("TRACKER_TELEGRAM_MAX_RATE", 0.5),
         ]
         mock_env.assert_has_calls(calls, any_order=True)
-        assert mock_env.call_count == 5
+        assert mock_env.call_count == 6
 
     # twitter_config
     def test_trackers_config_twitter_config_for_empty_environment_variables(
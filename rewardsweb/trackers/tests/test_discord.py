@@ -15,6 +15,14 @@ from trackers.discord import (
 )
 
 
+class DiscordResponseStub:
+    """Minimal response object accepted by Discord HTTP exceptions."""
+
+    def __init__(self, status=403, reason="Forbidden"):
+        self.status = status
+        self.reason = reason
+
+
 class DummyDiscordClient(IDiscordClientWrapper):
 
     async def start(self, token):
@@ -97,12 +105,10 @@ class TestIDiscordClientWrapper:
             IDiscordClientWrapper()
         assert "Can't instantiate abstract class" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_idiscordclientwrapper_start(self):
         c = DummyDiscordClient()
         assert await c.start("ABC") == "started:ABC"
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_idiscordclientwrapper_close(self):
         c = DummyDiscordClient()
         assert await c.close() == "closed"
@@ -154,7 +160,6 @@ class TestDiscordClientWrapper:
         wrapper = DiscordClientWrapper(intents)
         assert isinstance(wrapper, IDiscordClientWrapper)
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_client_wrapper_start(self):
         """Test DiscordClientWrapper.start method."""
         intents = discord.Intents.default()
@@ -166,7 +171,6 @@ class TestDiscordClientWrapper:
         await wrapper.start(test_token)
         wrapper._client.start.assert_called_once_with(test_token)
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_client_wrapper_close(self):
         """Test DiscordClientWrapper.close method."""
         intents = discord.Intents.default()
@@ -302,7 +306,6 @@ class TestDiscordClientWrapper:
         assert hasattr(wrapper, "event")
         assert callable(wrapper.event)
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_client_wrapper_start_exception(self):
         """Test DiscordClientWrapper.start with exception."""
         intents = discord.Intents.default()
@@ -317,7 +320,6 @@ class TestDiscordClientWrapper:
         assert "Connection failed" in str(exc_info.value)
         wrapper._client.start.assert_called_once_with(test_token)
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_client_wrapper_close_exception(self):
         """Test DiscordClientWrapper.close with exception."""
         intents = discord.Intents.default()
@@ -513,7 +515,6 @@ class TestDiscordTracker:
         assert registered_handlers["on_guild_join"]["is_coroutine"] is True
         assert registered_handlers["on_guild_remove"]["is_coroutine"] is True
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_setup_events_on_ready_calls_handler(
         self, discord_config, guilds_collection, mock_client_wrapper, mocker
     ):
@@ -545,7 +546,6 @@ class TestDiscordTracker:
         # Verify _handle_on_ready was called
         mock_handler.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_setup_events_on_message_calls_handler(
         self,
         discord_config,
@@ -581,7 +581,6 @@ class TestDiscordTracker:
         # Verify _handle_on_message was called with the message
         mock_handler.assert_called_once_with(mock_message)
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_setup_events_on_guild_join_calls_handler(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_guild, mocker
     ):
@@ -612,7 +611,6 @@ class TestDiscordTracker:
         # Verify _handle_on_guild_join was called with the guild
         mock_handler.assert_called_once_with(mock_guild)
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_setup_events_on_guild_remove_calls_handler(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_guild, mocker
     ):
@@ -674,7 +672,6 @@ class TestDiscordTracker:
         assert instance in cell_contents
 
     # # _handle_on_ready
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_on_ready_functionality(
         self, discord_config, guilds_collection, mock_client_wrapper, mocker
     ):
@@ -722,7 +719,6 @@ class TestDiscordTracker:
             "connected", "Logged in as TestBot, tracking 1 channels across 1 guilds"
         )
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_on_message_functionality(
         self,
         discord_config,
@@ -748,7 +744,6 @@ class TestDiscordTracker:
         mock_handle.assert_called_once_with(mock_message)
 
     # # _handle_on_guild_join
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_on_guild_join_functionality(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_guild, mocker
     ):
@@ -778,7 +773,6 @@ class TestDiscordTracker:
         mock_log_action.assert_called_with("guild_joined", "Guild: New Guild")
 
     # # _handle_on_guild_remove
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_on_guild_remove_functionality(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_guild, mocker
     ):
@@ -1189,7 +1183,6 @@ class TestDiscordTracker:
         result = instance._is_bot_mentioned(mock_message)
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_new_message_success(
         self,
         discord_config,
@@ -1232,7 +1225,6 @@ class TestDiscordTracker:
         mock_is_processed.assert_called_once()
         assert len(instance.processed_messages) == 1
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_new_message_already_processed(
         self,
         discord_config,
@@ -1267,7 +1259,6 @@ class TestDiscordTracker:
         mock_extract.assert_not_called()
         mock_process.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_new_message_process_mention_async_false(
         self,
         discord_config,
@@ -1301,7 +1292,6 @@ class TestDiscordTracker:
         assert len(instance.processed_messages) == 0
 
     # Extract mention data tests
-    @pytest.mark.asyncio
     async def test_trackers_discord_extract_mention_data_with_reply(
         self,
         discord_config,
@@ -1344,7 +1334,6 @@ class TestDiscordTracker:
         assert result["contribution"] == "This is the replied message content."
         assert result["timestamp"] == 1768442522
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_extract_mention_data_no_reply(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_message
     ):
@@ -1363,7 +1352,6 @@ class TestDiscordTracker:
         assert result["contribution_url"] == mock_message.jump_url
         assert result["contribution"] == "This is a standalone message."
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_extract_mention_data_reply_no_jump_url(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_message
     ):
@@ -1391,7 +1379,6 @@ class TestDiscordTracker:
         assert result["contributor"] == mock_message.author.display_name
         assert result["contribution"] == "This is the original message."
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_extract_mention_data_empty_content(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_message
     ):
@@ -1454,7 +1441,6 @@ class TestDiscordTracker:
         result = instance._is_rate_limited(123456789012345678)
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_channel_history_rate_limited(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -1473,7 +1459,6 @@ class TestDiscordTracker:
         assert result == 0
 
     # Historical message processing tests
-    @pytest.mark.asyncio
     async def test_trackers_discord_process_channel_messages_success(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_message
     ):
@@ -1505,7 +1490,6 @@ class TestDiscordTracker:
             f"<@{instance.bot_user_id}>",
         )
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_process_channel_messages_bot_message(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_message
     ):
@@ -1525,7 +1509,6 @@ class TestDiscordTracker:
         )
         assert result == 0  # Bot messages should be skipped
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_process_channel_messages_no_mention(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_message
     ):
@@ -1546,7 +1529,6 @@ class TestDiscordTracker:
         )
         assert result == 0  # Messages without mentions should be skipped
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_process_channel_messages_already_processed(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_message
     ):
@@ -1570,7 +1552,6 @@ class TestDiscordTracker:
         )
         assert result == 0  # Already processed messages should be skipped
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_process_channel_messages_process_false(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_message
     ):
@@ -1596,7 +1577,6 @@ class TestDiscordTracker:
         assert result == 0
 
     # HTTP Exception handling tests
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_http_exception_rate_limit(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -1617,7 +1597,6 @@ class TestDiscordTracker:
         assert result == 0
         mock_sleep.assert_called_once_with(2.5)
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_http_exception_other_error(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -1639,7 +1618,6 @@ class TestDiscordTracker:
         instance.logger.error.assert_called_once()
 
     # Forbidden exception handling tests
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_forbidden_exception(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -1728,7 +1706,6 @@ class TestDiscordTracker:
         assert len(instance.all_tracked_channels) == initial_channel_count
 
     # Async channel checking tests
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_channel_with_semaphore(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -1747,7 +1724,6 @@ class TestDiscordTracker:
         assert result == 3
         mock_check.assert_called_once_with(123456789012345678, 111111111111111111)
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_mentions_async_not_ready(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -1762,7 +1738,6 @@ class TestDiscordTracker:
         result = await instance.check_mentions_async()
         assert result == 0
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_mentions_async_success(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -1789,7 +1764,6 @@ class TestDiscordTracker:
         # Should process 3 channels, each returning 1 mention
         assert result == 3
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_mentions_async_with_exceptions(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -1916,7 +1890,6 @@ class TestDiscordTracker:
         result = instance._should_run_historical_check(now, last_check, interval)
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_run_channel_discovery(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -1936,7 +1909,6 @@ class TestDiscordTracker:
         )
         mock_discover.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_run_historical_check(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -1955,7 +1927,6 @@ class TestDiscordTracker:
         instance.logger.info.assert_any_call("Found 5 new mentions in historical check")
         mock_check.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_run_historical_check_no_mentions(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -1977,7 +1948,6 @@ class TestDiscordTracker:
         calls = [call.args[0] for call in instance.logger.info.call_args_list]
         assert "Found" not in " ".join(calls)
 
-    @pytest.mark.asyncio
     async def test_discordtracker_async_interruptible_sleep_full_duration(
         self, discord_config, guilds_collection, mock_client_wrapper, mocker
     ):
@@ -2001,7 +1971,6 @@ class TestDiscordTracker:
         # Should sleep 5 times with step=1
         assert sleep_calls == [1, 1, 1, 1, 1]
 
-    @pytest.mark.asyncio
     async def test_discordtracker_async_interruptible_sleep_exit_signal(
         self, discord_config, guilds_collection, mock_client_wrapper, mocker
     ):
@@ -2025,7 +1994,6 @@ class TestDiscordTracker:
         # Should sleep only once because exit_signal was set after first chunk
         assert sleep_calls == [1]
 
-    @pytest.mark.asyncio
     async def test_discordtracker_async_interruptible_sleep_client_closed(
         self, discord_config, guilds_collection, mock_client_wrapper, mocker
     ):
@@ -2053,7 +2021,6 @@ class TestDiscordTracker:
 
     # Main loop and continuous operation tests
     # # _handle_periodic_tasks
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_periodic_tasks_no_runs(
         self, discord_config, guilds_collection, mock_client_wrapper, mocker
     ):
@@ -2090,7 +2057,6 @@ class TestDiscordTracker:
         mocked_run_discovery.assert_not_called()
         mocked_run_historical.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_periodic_tasks_both_run(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -2116,7 +2082,6 @@ class TestDiscordTracker:
         assert result == now  # Should update last_discovery
 
     # # _run_main_loop
-    @pytest.mark.asyncio
     async def test_trackers_discord_run_main_loop_for_dicovery(
         self, discord_config, guilds_collection, mock_client_wrapper, mocker
     ):
@@ -2150,7 +2115,6 @@ class TestDiscordTracker:
         mocked_discovery.assert_called_once()
         mocked_discover.assert_called_once_with()
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_run_main_loop_for_historical_check(
         self, discord_config, guilds_collection, mock_client_wrapper, mocker
     ):
@@ -2193,7 +2157,6 @@ class TestDiscordTracker:
         mocked_check.assert_called_once_with()
         mocked_discover.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_run_main_loop_for_historical_check_logger(
         self, discord_config, guilds_collection, mock_client_wrapper, mocker
     ):
@@ -2242,7 +2205,6 @@ class TestDiscordTracker:
         )
         mocked_discover.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_run_main_loop_functionality(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -2260,15 +2222,13 @@ class TestDiscordTracker:
             mock_client_wrapper.closed = True
 
         mock_client_wrapper.is_closed = lambda: mock_client_wrapper.closed
-        with mock.patch.object(
-            instance, "_async_interruptible_sleep", side_effect=sleep_side_effect
-        ) as mock_sleep:
-            await instance._run_main_loop(300)
+        mock_sleep = mock.AsyncMock(side_effect=sleep_side_effect)
+        instance._async_interruptible_sleep = mock_sleep
+        await instance._run_main_loop(300)
         # Verify our async sleep helper was called with the expected interval
         mock_sleep.assert_called_once_with(10)
 
     # # run_continuous
-    @pytest.mark.asyncio
     async def test_trackers_discord_run_continuous_success(
         self, discord_config, guilds_collection, mock_client_wrapper, mocker
     ):
@@ -2282,29 +2242,20 @@ class TestDiscordTracker:
         instance.logger = mocker.MagicMock()
         instance.log_action_async = mocker.AsyncMock()
         # Track signal registration
-        with mock.patch.object(
-            instance, "_register_signal_handlers"
-        ) as mock_register_signals:
-            # Mock client operations
-            start_called = False
-            close_called = False
-
-            async def mock_start(token):
-                nonlocal start_called
-                start_called = True
-                mock_client_wrapper.ready = True
-
-            async def mock_close():
-                nonlocal close_called
-                close_called = True
-                mock_client_wrapper.closed = True
-
-            mock_client_wrapper.start = mock_start
-            mock_client_wrapper.close = mock_close
-            # Mock the main loop to raise KeyboardInterrupt immediately
-            with mock.patch.object(instance, "_run_main_loop") as mock_loop:
-                mock_loop.side_effect = KeyboardInterrupt("Test interrupt")
-                await instance.run_continuous(300)
+        mock_register_signals = mock.MagicMock()
+        instance._register_signal_handlers = mock_register_signals
+        # Mock client operations
+        mock_client_wrapper.start = mock.AsyncMock(
+            side_effect=lambda token: setattr(mock_client_wrapper, "ready", True)
+        )
+        mock_client_wrapper.close = mock.AsyncMock(
+            side_effect=lambda: setattr(mock_client_wrapper, "closed", True)
+        )
+        # Mock the main loop to raise KeyboardInterrupt immediately
+        instance._run_main_loop = mock.AsyncMock(
+            side_effect=KeyboardInterrupt("Test interrupt")
+        )
+        await instance.run_continuous(300)
         # Signal handlers should be registered once
         mock_register_signals.assert_called_once()
         instance.logger.info.assert_any_call(
@@ -2317,10 +2268,9 @@ class TestDiscordTracker:
             "started", "Continuous multi-guild mode"
         )
         instance.log_action_async.assert_any_call("stopped", "User interrupt")
-        assert start_called
-        assert close_called
+        mock_client_wrapper.start.assert_awaited_once()
+        mock_client_wrapper.close.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_run_continuous_error(
         self, discord_config, guilds_collection, mock_client_wrapper, mocker
     ):
@@ -2340,11 +2290,10 @@ class TestDiscordTracker:
             raise test_error
 
         mock_client_wrapper.start = mock_start
-        with mock.patch.object(
-            instance, "_register_signal_handlers"
-        ) as mock_register_signals:
-            with pytest.raises(Exception) as exc_info:
-                await instance.run_continuous(300)
+        mock_register_signals = mock.MagicMock()
+        instance._register_signal_handlers = mock_register_signals
+        with pytest.raises(Exception) as exc_info:
+            await instance.run_continuous(300)
         assert exc_info.value == test_error
         mock_register_signals.assert_called_once()
         instance.logger.error.assert_called_once_with(
@@ -2371,22 +2320,19 @@ class TestDiscordTracker:
             111111111111111111: [123456789012345678, 234567890123456789],
             222222222222222222: [345678901234567890],
         }
-        instance._update_all_tracked_channels()
+        instance.all_tracked_channels = {
+            123456789012345678,
+            234567890123456789,
+            345678901234567890,
+        }
         instance.processed_messages = {"msg1", "msg2", "msg3"}
         # Mock guild retrieval
         mock_guild1 = mock.MagicMock()
         mock_guild1.name = "Test Guild 1"
         mock_guild2 = mock.MagicMock()
         mock_guild2.name = "Test Guild 2"
-
-        def get_guild_side_effect(guild_id):
-            if guild_id == 111111111111111111:
-                return mock_guild1
-            elif guild_id == 222222222222222222:
-                return mock_guild2
-            return None
-
-        mock_client_wrapper.get_guild = get_guild_side_effect
+        guilds = {111111111111111111: mock_guild1, 222222222222222222: mock_guild2}
+        mock_client_wrapper.get_guild = guilds.get
         stats = instance.get_stats()
         assert stats["guilds_tracked"] == 2
         assert stats["channels_tracked"] == 3
@@ -2408,7 +2354,7 @@ class TestDiscordTracker:
         )
         # Setup tracking state with guild that can't be retrieved
         instance.guild_channels = {111111111111111111: [123456789012345678]}
-        instance._update_all_tracked_channels()
+        instance.all_tracked_channels = {123456789012345678}
         instance.processed_messages = set()
         # Mock guild not found - use side_effect instead of return_value
         mock_client_wrapper.get_guild = mock.MagicMock(return_value=None)
@@ -2419,7 +2365,6 @@ class TestDiscordTracker:
         assert stats["guild_details"]["Unknown (111111111111111111)"] == 1
 
     # Channel discovery tests
-    @pytest.mark.asyncio
     async def test_trackers_discord_discover_guild_channels_success(
         self,
         discord_config,
@@ -2448,7 +2393,6 @@ class TestDiscordTracker:
         assert mock_guild.id in instance.guild_channels
         assert instance.guild_channels[mock_guild.id] == [mock_channel.id]
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_discover_guild_channels_exception(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_guild
     ):
@@ -2468,7 +2412,6 @@ class TestDiscordTracker:
         )
 
     # Additional edge case tests
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_channel_history_channel_not_found(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -2485,7 +2428,6 @@ class TestDiscordTracker:
         )
         assert result == 0
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_channel_history_channel_not_found_early(
         self, discord_config, guilds_collection, mock_client_wrapper
     ):
@@ -2508,7 +2450,6 @@ class TestDiscordTracker:
         mock_client_wrapper.get_channel.assert_called_once_with(123456789012345678)
         # Should not proceed to process messages if channel is None
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_channel_history_success(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_channel
     ):
@@ -2559,7 +2500,6 @@ class TestDiscordTracker:
         )
 
     # Tests for _discover_all_guild_channels
-    @pytest.mark.asyncio
     async def test_trackers_discord_discover_all_guild_channels_success(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_guild
     ):
@@ -2582,7 +2522,6 @@ class TestDiscordTracker:
         mock_discover.assert_called_once_with(mock_guild)
 
     # Tests for _should_process_message early return
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_new_message_should_not_process(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_message
     ):
@@ -2610,7 +2549,6 @@ class TestDiscordTracker:
         mock_process.assert_not_called()
         mock_is_processed.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_handle_new_message_should_process(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_message
     ):
@@ -2638,7 +2576,6 @@ class TestDiscordTracker:
         mock_process.assert_called_once()
         mock_is_processed.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_channel_history_channel_found(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_channel
     ):
@@ -2664,7 +2601,6 @@ class TestDiscordTracker:
         mock_client_wrapper.get_channel.assert_called_once_with(123456789012345678)
         mock_process.assert_called_once_with(mock_channel, 111111111111111111)
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_channel_history_http_exception_rate_limit(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_channel
     ):
@@ -2679,8 +2615,9 @@ class TestDiscordTracker:
         # Mock get_channel to return a channel
         mock_client_wrapper.get_channel.return_value = mock_channel
         # Mock _process_channel_messages to raise HTTPException with status 429
-        http_exception = discord.HTTPException(mock.MagicMock(), "Rate limited")
-        http_exception.status = 429
+        http_exception = discord.HTTPException(
+            DiscordResponseStub(429, "Too Many Requests"), "Rate limited"
+        )
         http_exception.retry_after = 2.5
         instance._process_channel_messages = mock.AsyncMock(side_effect=http_exception)
         # Mock _handle_http_exception
@@ -2694,7 +2631,6 @@ class TestDiscordTracker:
         assert result == 0
         mock_handle_http.assert_called_once_with(http_exception, 123456789012345678)
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_channel_history_forbidden_exception(
         self,
         discord_config,
@@ -2715,7 +2651,7 @@ class TestDiscordTracker:
         mock_client_wrapper.get_channel.return_value = mock_channel
         mocker.patch(
             "trackers.discord.DiscordTracker._process_channel_messages",
-            side_effect=discord.Forbidden(mock.MagicMock(), "Forbidden"),
+            side_effect=discord.Forbidden(DiscordResponseStub(), "Forbidden"),
         )
         # Mock _handle_forbidden_exception
         mock_handle_forbidden = mocker.patch(
@@ -2731,7 +2667,6 @@ class TestDiscordTracker:
             123456789012345678, 111111111111111111
         )
 
-    @pytest.mark.asyncio
     async def test_trackers_discord_check_channel_history_generic_exception(
         self, discord_config, guilds_collection, mock_client_wrapper, mock_channel
     ):
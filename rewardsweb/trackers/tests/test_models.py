@@ -10,8 +10,9 @@ from trackers.models import Mention, MentionLog
 class TestTrackersModelsMentionManager:
     """Testing class for :class:`trackers.models.MentionManager`."""
 
-    def setup_method(self):
-        """Set up test method."""
+    @pytest.fixture(scope="class", autouse=True)
+    def seed_mentions(self, django_db_setup, django_db_blocker):
+        """Create the seed mentions once for the whole class."""
         test_data_1 = {
             "item_id": "1",
             "platform": "twitter",
@@ -34,51 +35,97 @@ class TestTrackersModelsMentionManager:
             "timestamp": 1678886500,
             "contributor": "userB",
         }
-        Mention.objects.create(item_id="1", platform="twitter", raw_data=test_data_1)
-        Mention.objects.create(item_id="2", platform="reddit", raw_data=test_data_2)
+        with django_db_blocker.unblock():
+            Mention.objects.bulk_create(
+                [
+                    Mention(item_id="1", platform="twitter", raw_data=test_data_1),
+                    Mention(item_id="2", platform="reddit", raw_data=test_data_2),
+                ]
+            )
+        yield
+        with django_db_blocker.unblock():
+            Mention.objects.filter(item_id__in=["1", "2"]).delete()
 
     # # is_processed
-    def test_trackers_models_mentionmanager_is_processed_true(self):
-        """Test is_processed method for a processed mention."""
-        Mention.objects.create(
-            item_id="test_item_id",
-            platform="test_platform",
-            raw_data={"key": "value"},
+    @pytest.mark.parametrize(
+        "rows,expected",
+        [
+            (["test_item_id"], True),
+            ([], False),
+        ],
+    )
+    def test_trackers_models_mentionmanager_is_processed(self, rows, expected):
+        """Test is_processed method for processed and unprocessed mentions."""
+        Mention.objects.bulk_create(
+            [
+                Mention(item_id=item_id, platform="test_platform", raw_data={"k": "v"})
+                for item_id in rows
+            ]
         )
-        assert Mention.objects.is_processed("test_item_id", "test_platform") is True
+        assert Mention.objects.is_processed("test_item_id", "test_platform") is expected
 
-    def test_trackers_models_mentionmanager_is_processed_false(self):
-        """Test is_processed method for an unprocessed mention."""
-        assert Mention.objects.is_processed("test_item_id", "test_platform") is False
+    # # processed_ids
+    @pytest.mark.parametrize(
+        "item_ids,platform_name,expected",
+        [
+            ([1, 2, 3], "twitter", frozenset({"1"})),
+            (["1", "2"], "reddit", frozenset({"2"})),
+            (["3"], "twitter", frozenset()),
+            ([], "twitter", frozenset()),
+        ],
+    )
+    def test_trackers_models_mentionmanager_processed_ids(
+        self, item_ids, platform_name, expected
+    ):
+        """Test processed_ids method for processed and unprocessed mentions."""
+        assert Mention.objects.processed_ids(item_ids, platform_name) == expected
 
-    # # last_processed_timestamp
-    def test_trackers_models_mentionmanager_last_processed_timestamp_found(self):
-        """Test last_processed_timestamp method when a timestamp is found."""
-        Mention.objects.create(
-            item_id="201",
-            platform="test_platform",
-            raw_data={"timestamp": 1672531199},
-        )
-        Mention.objects.create(
-            item_id="202",
-            platform="test_platform",
-            raw_data={"timestamp": 1672531200},
+    # # last_processed_item_id
+    @pytest.mark.parametrize(
+        "rows,expected",
+        [
+            (["9", "10", "1999999999999999999"], "1999999999999999999"),
+            (["9", "10"], "10"),
+            ([], None),
+        ],
+    )
+    def test_trackers_models_mentionmanager_last_processed_item_id(
+        self, rows, expected
+    ):
+        """Test last_processed_item_id method compares IDs numerically."""
+        Mention.objects.bulk_create(
+            [
+                Mention(item_id=item_id, platform="test_platform", raw_data={"k": "v"})
+                for item_id in rows
+            ]
         )
-        result = Mention.objects.last_processed_timestamp("test_platform")
-        assert result == 1672531200
+        assert Mention.objects.last_processed_item_id("test_platform") == expected
 
-    def test_trackers_models_mentionmanager_last_processed_timestamp_not_found(self):
-        """Test last_processed_timestamp method when no timestamp is found."""
-        Mention.objects.create(
-            item_id="101", platform="test_platform", raw_data={"key": "value"}
+    # # last_processed_timestamp
+    @pytest.mark.parametrize(
+        "rows,expected",
+        [
+            ([(201, 1672531199), (202, 1672531200)], 1672531200),
+            ([(101, None)], None),
+            ([], None),
+        ],
+    )
+    def test_trackers_models_mentionmanager_last_processed_timestamp(
+        self, rows, expected
+    ):
+        """Test last_processed_timestamp method for found, missing and no rows."""
+        Mention.objects.bulk_create(
+            [
+                Mention(
+                    item_id=str(item_id),
+                    platform="test_platform",
+                    raw_data={"timestamp": timestamp} if timestamp else {"k": "v"},
+                )
+                for item_id, timestamp in rows
+            ]
         )
         result = Mention.objects.last_processed_timestamp("test_platform")
-        assert result is None
-
-    def test_trackers_models_mentionmanager_last_processed_timestamp_no_mentions(self):
-        """Test last_processed_timestamp method when there are no mentions."""
-        result = Mention.objects.last_processed_timestamp("test_platform")
-        assert result is None
+        assert result == expected
 
     # # mark_processed
     def test_trackers_models_mentionmanager_mark_processed(self):
@@ -126,6 +173,11 @@ class TestTrackersModelsMentionManager:
 class TestTrackersModelsMention:
     """Testing class for :class:`trackers.models.Mention` model."""
 
+    @pytest.fixture(scope="class")
+    def mention_fields(self):
+        """Return mapping of Mention field names to their field instances."""
+        return {field.name: field for field in Mention._meta.get_fields()}
+
     # # field characteristics
     @pytest.mark.parametrize(
         "name,typ",
@@ -137,9 +189,9 @@ class TestTrackersModelsMention:
             ("raw_data", models.JSONField),
         ],
     )
-    def test_trackers_mention_model_fields(self, name, typ):
+    def test_trackers_mention_model_fields(self, mention_fields, name, typ):
         assert hasattr(Mention, name)
-        assert isinstance(Mention._meta.get_field(name), typ)
+        assert isinstance(mention_fields[name], typ)
 
     # # Meta
     @pytest.mark.django_db
@@ -173,6 +225,11 @@ class TestTrackersModelsMentionLogManager:
 class TestTrackersModelsMentionLog:
     """Testing class for :class:`trackers.models.MentionLog` model."""
 
+    @pytest.fixture(scope="class")
+    def mentionlog_fields(self):
+        """Return mapping of MentionLog field names to their field instances."""
+        return {field.name: field for field in MentionLog._meta.get_fields()}
+
     # # field characteristics
     @pytest.mark.parametrize(
         "name,typ",
@@ -183,9 +240,9 @@ class TestTrackersModelsMentionLog:
             ("details", models.TextField),
         ],
     )
-    def test_trackers_mentionlog_model_fields(self, name, typ):
+    def test_trackers_mentionlog_model_fields(self, mentionlog_fields, name, typ):
         assert hasattr(MentionLog, name)
-        assert isinstance(MentionLog._meta.get_field(name), typ)
+        assert isinstance(mentionlog_fields[name], typ)
 
     # # Meta
     @pytest.mark.django_db
@@ -1,14 +1,126 @@
 """Testing module for :py:mod:`trackers.telegram` module."""
 
 import asyncio
-from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 from telethon.errors import SessionPasswordNeededError
 
-import trackers.telegram
 from trackers.base import BaseAsyncMentionTracker
-from trackers.telegram import TelegramTracker
+from trackers.telegram import AsyncTokenBucket, TelegramTracker
+
+pytestmark = pytest.mark.usefixtures("no_sleep")
+
+SESSION_PASSWORD_ERROR = SessionPasswordNeededError(request=None)
+
+
+@pytest.fixture(scope="module")
+def fake_date():
+    """Return lightweight stand-in for a Telegram message date."""
+    return SimpleNamespace(timestamp=lambda: 1768496527.571459)
+
+
+def _make_chat(id=67890, title="Test Group", username="testgroup"):
+    """Return lightweight stand-in for a Telegram chat entity."""
+    return SimpleNamespace(id=id, title=title, username=username)
+
+
+def _iter_messages_factory(*messages, raise_exc=None):
+    """Return async generator function standing in for `client.iter_messages`.
+
+    :param messages: messages to yield
+    :type messages: tuple
+    :param raise_exc: exception to raise instead of yielding messages
+    :type raise_exc: :class:`Exception` or None
+    :return: async generator function
+    :rtype: callable
+    """
+
+    async def _iter_messages(*args, **kwargs):
+        if raise_exc:
+            raise raise_exc
+
+        for message in messages:
+            yield message
+
+    return _iter_messages
+
+
+def _chat_case(
+    chat_found=True,
+    message_text="@test_bot hello",
+    bot_username="test_bot",
+    is_processed=False,
+    process_return=True,
+    raise_api=False,
+    expect=0,
+    expect_process_called=False,
+    expect_logger_error=False,
+):
+    """Return scenario dictionary for `_check_chat_mentions` tests."""
+    return {
+        "chat_found": chat_found,
+        "message_text": message_text,
+        "bot_username": bot_username,
+        "is_processed": is_processed,
+        "process_return": process_return,
+        "raise_api": raise_api,
+        "expect": expect,
+        "expect_process_called": expect_process_called,
+        "expect_logger_error": expect_logger_error,
+    }
+
+
+class TestTrackersTelegramAsyncTokenBucket:
+    """Testing class for :class:`trackers.telegram.AsyncTokenBucket`."""
+
+    # __init__
+    @pytest.mark.parametrize(
+        "max_rate,capacity", [(0.5, 1), (1, 1), (5, 5)], ids=["slow", "one", "fast"]
+    )
+    def test_trackers_telegram_asynctokenbucket_init(self, max_rate, capacity):
+        limiter = AsyncTokenBucket(max_rate, time_period=2.0)
+        assert limiter.max_rate == max_rate
+        assert limiter.time_period == 2.0
+        assert limiter.capacity == capacity
+        assert limiter._tokens == capacity
+
+    # acquire
+    async def test_trackers_telegram_asynctokenbucket_acquire_waits_for_refill(
+        self, mocker, no_sleep
+    ):
+        mocker.patch("trackers.telegram.time.monotonic", return_value=100.0)
+        limiter = AsyncTokenBucket(2)
+        for _ in range(4):
+            await limiter.acquire()
+
+        assert no_sleep == [0.5, 1.0]
+        assert limiter._tokens == -2
+
+    async def test_trackers_telegram_asynctokenbucket_acquire_refills_over_time(
+        self, mocker, no_sleep
+    ):
+        mocked_time = mocker.patch(
+            "trackers.telegram.time.monotonic", return_value=100.0
+        )
+        limiter = AsyncTokenBucket(0.5)
+        await limiter.acquire()
+        mocked_time.return_value = 101.0
+        await limiter.acquire()
+        mocked_time.return_value = 110.0
+        await limiter.acquire()
+        assert no_sleep == [1.0]
+        assert limiter._tokens == 0
+
+    # __aenter__
+    async def test_trackers_telegram_asynctokenbucket_context_manager(self, mocker):
+        limiter = AsyncTokenBucket(1)
+        mocked_acquire = mocker.patch.object(limiter, "acquire")
+        async with limiter as entered:
+            assert entered is limiter
+
+        mocked_acquire.assert_awaited_once_with()
 
 
 class TestTrackersTelegram:
@@ -21,7 +133,7 @@ class TestTrackersTelegram:
 
     # __init__
     def test_trackers_telegramtracker_init_success(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_config, telegram_chats, telegram_session_path
     ):
         # Mock TelegramClient to prevent actual API calls
         mock_telegram_client = mocker.patch("trackers.telegram.TelegramClient")
@@ -31,237 +143,181 @@ class TestTrackersTelegram:
             lambda x, y=None: None, telegram_config, telegram_chats
         )
         # Assert TelegramClient was called with correct parameters
-        session_path = (
-            Path(trackers.telegram.__file__).resolve().parent.parent
-            / "fixtures"
-            / "test_session.session"
-        )
         mock_telegram_client.assert_called_once_with(
-            session=session_path, api_id="test_api_id", api_hash="test_api_hash"
+            session=telegram_session_path,
+            api_id="test_api_id",
+            api_hash="test_api_hash",
         )
         assert instance.bot_username == "test_bot"
         assert instance.tracked_chats == telegram_chats
         assert instance._is_connected is False
+        assert instance.concurrent_chat_checks == 3
+        assert instance.connect_retries == 3
+        assert isinstance(instance._limiter, AsyncTokenBucket)
+        assert instance._limiter.max_rate == 0.5
+        assert not hasattr(instance, "_chat_semaphore")
 
     # extract_mention_data
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_extract_mention_data_with_reply(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock the parent init to avoid API calls
-        mocker.patch.object(TelegramTracker, "__init__", return_value=None)
-        mocker.patch.object(TelegramTracker, "log_action_async")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        # Mock the async methods
-        mock_sender_info = {
-            "user_id": 12345,
-            "username": "testuser",
-            "display_name": "Test User",
-        }
-        mocker.patch.object(instance, "_get_sender_info", return_value=mock_sender_info)
-        mock_replied_info = {
-            "message_id": 99,
-            "sender_info": {
-                "user_id": 54321,
-                "username": "replieduser",
-                "display_name": "Replied User",
-            },
-            "text": "This is the original message.",
-        }
+    @pytest.mark.parametrize(
+        "sender_info,replied_info,chat_username,reply_id,expected",
+        [
+            (
+                {"user_id": 12345, "username": "testuser", "display_name": "Test User"},
+                {
+                    "message_id": 99,
+                    "sender_info": {
+                        "user_id": 54321,
+                        "username": "replieduser",
+                        "display_name": "Replied User",
+                    },
+                    "text": "This is the original message.",
+                },
+                "testgroup",
+                99,
+                {
+                    "suggester": "testuser",
+                    "suggestion_url": "https://t.me/c/-67890/100",
+                    "contribution_url": "https://t.me/c/-67890/99",
+                    "contributor": "replieduser",
+                    "type": "message",
+                    "telegram_chat": "Test Group",
+                    "chat_username": "testgroup",
+                    "content": "Hello @test_bot!",
+                    "contribution": "This is the original message.",
+                    "timestamp": 1768496527,
+                },
+            ),
+            (
+                {"user_id": 12345, "username": "testuser", "display_name": "Test User"},
+                None,
+                None,
+                None,
+                {
+                    "suggestion_url": "https://t.me/c/-67890/100",
+                    "contribution_url": "https://t.me/c/-67890/100",
+                    "contributor": "testuser",
+                    "chat_username": None,
+                    "contribution": "Hello @test_bot!",
+                },
+            ),
+            (
+                {"user_id": 12345, "username": None, "display_name": "Test User"},
+                None,
+                "testgroup",
+                None,
+                {"suggester": "Test User", "contributor": "Test User"},
+            ),
+            (
+                {"user_id": 12345, "username": None, "display_name": None},
+                None,
+                "testgroup",
+                None,
+                {"suggester": "12345", "contributor": "12345"},
+            ),
+        ],
+    )
+    async def test_trackers_telegramtracker_extract_mention_data(
+        self,
+        mocker,
+        telegram_tracker,
+        fake_date,
+        sender_info,
+        replied_info,
+        chat_username,
+        reply_id,
+        expected,
+    ):
+        instance = telegram_tracker
+        mocker.patch.object(instance, "_get_sender_info", return_value=sender_info)
         mocker.patch.object(
-            instance, "_get_replied_message_info", return_value=mock_replied_info
+            instance, "_get_replied_message_info", return_value=replied_info
         )
         mock_message = mocker.MagicMock()
         mock_message.sender_id = 12345
         mock_message.id = 100
         mock_message.text = "Hello @test_bot!"
-        mock_message.reply_to_msg_id = 99
-        mock_message.date = mocker.MagicMock()
-        mock_message.date.timestamp.return_value = 1768496527.571459
-        mock_chat = mocker.MagicMock()
-        mock_chat.id = 67890
-        mock_chat.title = "Test Group"
-        mock_chat.username = "testgroup"
-        mock_message.chat = mock_chat
+        mock_message.reply_to_msg_id = reply_id
+        mock_message.date = fake_date
+        mock_message.chat = _make_chat(username=chat_username)
         result = await instance.extract_mention_data(mock_message)
-        # Updated assertions to match new implementation
-        assert result["suggester"] == "testuser"  # Uses username first
-        assert result["suggestion_url"] == "https://t.me/c/-67890/100"
-        assert result["contribution_url"] == "https://t.me/c/-67890/99"
-        assert result["contributor"] == "replieduser"  # Uses username first
-        assert result["type"] == "message"
-        assert result["telegram_chat"] == "Test Group"
-        assert result["chat_username"] == "testgroup"
-        assert result["content"] == "Hello @test_bot!"
-        assert result["contribution"] == "This is the original message."
-        assert result["timestamp"] == 1768496527
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_extract_mention_data_no_reply(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock the parent init to avoid API calls
-        mocker.patch.object(TelegramTracker, "__init__", return_value=None)
-        mocker.patch.object(TelegramTracker, "log_action_async")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        # Mock the async methods
-        mock_sender_info = {
-            "user_id": 12345,
-            "username": "testuser",
-            "display_name": "Test User",
-        }
-        mocker.patch.object(instance, "_get_sender_info", return_value=mock_sender_info)
-        mocker.patch.object(instance, "_get_replied_message_info", return_value=None)
-        mock_message = mocker.MagicMock()
-        mock_message.sender_id = 12345
-        mock_message.id = 100
-        mock_message.text = "Hello @test_bot!"
-        mock_message.reply_to_msg_id = None  # No reply
-        mock_message.date = mocker.MagicMock()
-        mock_message.date.isoformat.return_value = "2023-01-01T00:00:00"
-        mock_chat = mocker.MagicMock()
-        mock_chat.id = 67890
-        mock_chat.title = "Test Group"
-        mock_chat.username = None  # No username
-        mock_message.chat = mock_chat
-        result = await instance.extract_mention_data(mock_message)
-        assert result["suggestion_url"] == "https://t.me/c/-67890/100"
-        assert result["contribution_url"] == "https://t.me/c/-67890/100"
-        assert result["contributor"] == "testuser"  # Uses username first
-        assert result["contribution"] == "Hello @test_bot!"
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_extract_mention_data_no_username(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock the parent init to avoid API calls
-        mocker.patch.object(TelegramTracker, "__init__", return_value=None)
-        mocker.patch.object(TelegramTracker, "log_action_async")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        # Mock the async methods - no username
-        mock_sender_info = {
-            "user_id": 12345,
-            "username": None,
-            "display_name": "Test User",
-        }
-        mocker.patch.object(instance, "_get_sender_info", return_value=mock_sender_info)
-        mocker.patch.object(instance, "_get_replied_message_info", return_value=None)
-        mock_message = mocker.MagicMock()
-        mock_message.sender_id = 12345
-        mock_message.id = 100
-        mock_message.text = "Hello @test_bot!"
-        mock_message.reply_to_msg_id = None
-        mock_message.date = mocker.MagicMock()
-        mock_message.date.isoformat.return_value = "2023-01-01T00:00:00"
-        mock_chat = mocker.MagicMock()
-        mock_chat.id = 67890
-        mock_chat.title = "Test Group"
-        mock_chat.username = "testgroup"
-        mock_message.chat = mock_chat
-        result = await instance.extract_mention_data(mock_message)
-        # Should use display_name when username is None
-        assert result["suggester"] == "Test User"
-        assert result["contributor"] == "Test User"
+        for key, value in expected.items():
+            assert result[key] == value
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_extract_mention_data_no_username_or_display(
-        self, mocker, telegram_config, telegram_chats
+    async def test_trackers_telegramtracker_extract_mention_data_concurrent_lookups(
+        self, mocker, telegram_tracker, fake_date
     ):
-        # Mock the parent init to avoid API calls
-        mocker.patch.object(TelegramTracker, "__init__", return_value=None)
-        mocker.patch.object(TelegramTracker, "log_action_async")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
+        instance = telegram_tracker
+        started = []
+        both_started = asyncio.Event()
+
+        def gated(name, result):
+            async def lookup(message, *args):
+                started.append(name)
+                if len(started) == 2:
+                    both_started.set()
+
+                await both_started.wait()
+                return result
+
+            return lookup
+
+        instance._get_sender_info = gated(
+            "sender", {"user_id": 12345, "username": "testuser", "display_name": None}
         )
-        # Mock the async methods - no username or display_name
-        mock_sender_info = {
-            "user_id": 12345,
-            "username": None,
-            "display_name": None,
-        }
-        mocker.patch.object(instance, "_get_sender_info", return_value=mock_sender_info)
-        mocker.patch.object(instance, "_get_replied_message_info", return_value=None)
+        instance._get_replied_message_info = gated("replied", None)
         mock_message = mocker.MagicMock()
-        mock_message.sender_id = 12345
         mock_message.id = 100
         mock_message.text = "Hello @test_bot!"
-        mock_message.reply_to_msg_id = None
-        mock_message.date = mocker.MagicMock()
-        mock_message.date.isoformat.return_value = "2023-01-01T00:00:00"
-        mock_chat = mocker.MagicMock()
-        mock_chat.id = 67890
-        mock_chat.title = "Test Group"
-        mock_chat.username = "testgroup"
-        mock_message.chat = mock_chat
-        result = await instance.extract_mention_data(mock_message)
-        # Should use user_id when neither username nor display_name
-        assert result["suggester"] == "12345"  # Now converted to string
-        assert result["contributor"] == "12345"  # Now converted to string
+        mock_message.date = fake_date
+        mock_message.chat = _make_chat()
+        result = await asyncio.wait_for(
+            instance.extract_mention_data(mock_message), timeout=1
+        )
+        assert sorted(started) == ["replied", "sender"]
+        assert result["suggester"] == "testuser"
+        assert result["contributor"] == "testuser"
 
     # check_mentions
+    @pytest.mark.parametrize(
+        "is_connected,client_is_none,ensure_raises,expected,expected_error",
+        [
+            (True, False, None, 3, None),
+            (
+                False,
+                False,
+                Exception("Connection failed"),
+                0,
+                "Error in Telegram mention check: Connection failed",
+            ),
+            (True, True, None, 0, "Telegram client not available"),
+        ],
+    )
     def test_trackers_telegramtracker_check_mentions(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        # Mock async methods
-        mocker.patch.object(instance, "_ensure_connected")
-        mocker.patch.object(instance, "check_mentions_async", return_value=3)
-        result = instance.check_mentions()
-        assert result == 3
-
-    def test_trackers_telegramtracker_check_mentions_no_connection(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        mocker.patch("trackers.telegram.TelegramTracker.log_action_async")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = False
-        # Mock _ensure_connected to raise exception
-        mocker.patch.object(
-            instance, "_ensure_connected", side_effect=Exception("Connection failed")
-        )
-        instance.logger = mocker.MagicMock()
-        result = instance.check_mentions()
-        assert result == 0
-        instance.logger.error.assert_called()
-
-    def test_trackers_telegramtracker_check_mentions_no_client(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.logger = mocker.MagicMock()
-        instance.client = None  # Explicitly set client to None
+        self,
+        telegram_tracker,
+        is_connected,
+        client_is_none,
+        ensure_raises,
+        expected,
+        expected_error,
+    ):
+        instance = telegram_tracker
+        instance._is_connected = is_connected
+        if client_is_none:
+            instance.client = None
+
+        instance._ensure_connected = AsyncMock(side_effect=ensure_raises)
+        instance.check_mentions_async = AsyncMock(return_value=3)
         result = instance.check_mentions()
-        assert result == 0
-        instance.logger.error.assert_called_once_with("Telegram client not available")
+        assert result == expected
+        if expected_error:
+            instance.logger.error.assert_called_once_with(expected_error)
+        else:
+            instance.logger.error.assert_not_called()
 
     # run
-    def test_trackers_telegramtracker_run_no_client(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.logger = mocker.MagicMock()
+    def test_trackers_telegramtracker_run_no_client(self, telegram_tracker):
+        instance = telegram_tracker
         # Set client to None
         instance.client = None
         instance.run(poll_interval_minutes=1)
@@ -270,33 +326,18 @@ class TestTrackersTelegram:
             "Cannot start Telegram tracker - client not available"
         )
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_run_async_connect_and_exit(
-        self, mocker, telegram_config, telegram_chats
+        self, telegram_tracker
     ):
-        # Mock TelegramClient (still needed for init)
-        mocker.patch("trackers.telegram.TelegramClient")
-        mocker.patch("trackers.telegram.TelegramTracker.log_action_async")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance._is_connected = False
-        instance.logger = mocker.MagicMock()
+        instance = telegram_tracker
         # Mock async methods - use AsyncMock
-        mock_ensure_connected = mocker.patch.object(
-            instance, "_ensure_connected", new_callable=mocker.AsyncMock
-        )
+        mock_ensure_connected = AsyncMock()
+        instance._ensure_connected = mock_ensure_connected
         # Mock check_mentions_async to stop the polling loop immediately
-        mock_check_mentions = mocker.patch.object(
-            instance,
-            "check_mentions_async",
-            new_callable=mocker.AsyncMock,
-            side_effect=asyncio.CancelledError(),
-        )
-        mock_cleanup = mocker.patch.object(
-            instance, "cleanup", new_callable=mocker.AsyncMock
-        )
+        mock_check_mentions = AsyncMock(side_effect=asyncio.CancelledError())
+        instance.check_mentions_async = mock_check_mentions
+        mock_cleanup = AsyncMock()
+        instance.cleanup = mock_cleanup
         # Run the async method. We expect it to be cancelled almost immediately.
         with pytest.raises(asyncio.CancelledError):
             await instance.run_async(poll_interval_minutes=0.01)
@@ -306,44 +347,26 @@ class TestTrackersTelegram:
         mock_cleanup.assert_called_once()
         instance.logger.info.assert_any_call("Telegram tracker cancelled")
 
-    def test_trackers_telegramtracker_run_no_client_config(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
+    def test_trackers_telegramtracker_run_no_client_config(self, telegram_tracker):
+        instance = telegram_tracker
         instance.client = None
-        instance.logger = mocker.MagicMock()
         instance.run()
         instance.logger.error.assert_called_once_with(
             "Cannot start Telegram tracker - client not available"
         )
 
     def test_trackers_telegramtracker_run_keyboardinterrupt(
-        self, mocker, telegram_config, telegram_chats
+        self, telegram_tracker, patched_event_loop
     ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance.logger = mocker.MagicMock()
-        # Mock event loop related calls
-        mock_loop = mocker.MagicMock()
-        mocker.patch("asyncio.new_event_loop", return_value=mock_loop)
-        mocker.patch("asyncio.set_event_loop")
+        instance = telegram_tracker
+        mock_loop = patched_event_loop
         # Mock run_async (its return value is the coroutine passed to run_until_complete)
-        mocker.patch.object(instance, "run_async", new_callable=mocker.AsyncMock)
-        mock_cleanup = mocker.patch.object(
-            instance, "cleanup", new_callable=mocker.AsyncMock
-        )
+        instance.run_async = AsyncMock()
+        mock_cleanup = AsyncMock()
+        instance.cleanup = mock_cleanup
         # Mock run_until_complete to raise KeyboardInterrupt on the first call (for run_async)
         # and return None on the second call (for cleanup).
         mock_loop.run_until_complete.side_effect = [KeyboardInterrupt(), None]
-        # Reset the logger before running to isolate this test's logging
-        instance.logger.info.reset_mock()
         # run() catches the synchronous KeyboardInterrupt
         instance.run(poll_interval_minutes=0.01)
         # Assert KeyboardInterrupt was caught and logged
@@ -353,739 +376,396 @@ class TestTrackersTelegram:
         mock_loop.close.assert_called_once()
 
     # _check_chat_mentions
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_chat_mentions_no_chat(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        # Mock _get_chat_entity to return None
-        mocker.patch.object(instance, "_get_chat_entity", return_value=None)
-        # Test when chat is not found
-        result = await instance._check_chat_mentions("nonexistent_chat")
-        assert result == 0
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_chat_mentions_success(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
+    @pytest.mark.parametrize(
+        "case",
+        [
+            pytest.param(_chat_case(chat_found=False), id="no_chat"),
+            pytest.param(
+                _chat_case(expect=1, expect_process_called=True), id="success"
+            ),
+            pytest.param(
+                _chat_case(raise_api=True, expect_logger_error=True), id="exception"
+            ),
+            pytest.param(
+                _chat_case(message_text="Hello everyone without mentioning bot"),
+                id="bot_not_mentioned",
+            ),
+            pytest.param(_chat_case(is_processed=True), id="already_processed"),
+            pytest.param(
+                _chat_case(process_return=False, expect_process_called=True),
+                id="process_mention_false",
+            ),
+            pytest.param(
+                _chat_case(message_text="Some message", bot_username=""),
+                id="no_bot_username",
+            ),
+            pytest.param(_chat_case(message_text=None), id="message_no_text"),
+        ],
+    )
+    async def test_trackers_telegramtracker_check_chat_mentions(
+        self, mocker, connected_telegram_tracker, case
+    ):
+        instance = connected_telegram_tracker
+        instance.bot_username = case["bot_username"]
+        mock_chat = _make_chat(id=456)
+        mocker.patch.object(
+            instance,
+            "_get_chat_entity",
+            return_value=mock_chat if case["chat_found"] else None,
         )
-        instance._is_connected = True
-        mock_chat = mocker.MagicMock()
-        mock_chat.id = 456
-        mocker.patch.object(instance, "_get_chat_entity", return_value=mock_chat)
         mock_message = mocker.MagicMock()
-        mock_message.text = "@test_bot hello"
+        mock_message.text = case["message_text"]
         mock_message.id = 123
-        mock_message.date = mocker.MagicMock()
-
-        # Mock async iter_messages properly
-        async def mock_iter_messages(*args, **kwargs):
-            yield mock_message
-
-        instance.client.iter_messages = mock_iter_messages
-        # Mock the async extract_mention_data method
+        mock_message.reply_to_msg_id = None
+        instance.client.iter_messages = _iter_messages_factory(
+            mock_message,
+            raise_exc=Exception("API error") if case["raise_api"] else None,
+        )
         mock_extract_data = mocker.patch.object(
             instance, "extract_mention_data", return_value={}
         )
         mock_process_mention = mocker.patch.object(
-            instance, "process_mention_async", return_value=True
-        )
-        mocker.patch.object(instance, "is_processed_async", return_value=False)
-        # Test successful message processing
-        result = await instance._check_chat_mentions("test_chat")
-        assert result == 1
-        mock_process_mention.assert_called_once_with(
-            f"telegram_456_{mock_message.id}",
-            {},
-            f"@{instance.bot_username}",
-        )
-        mock_extract_data.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_chat_mentions_exception(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        instance.logger = mocker.MagicMock()
-        mock_chat = mocker.MagicMock()
-        mocker.patch.object(instance, "_get_chat_entity", return_value=mock_chat)
-
-        # Mock async method to raise exception
-        async def mock_iter_messages_error(*args, **kwargs):
-            raise Exception("API error")
-
-        instance.client.iter_messages = mock_iter_messages_error
-        mock_log_action = mocker.patch.object(instance, "log_action_async")
-        # Test exception handling
-        result = await instance._check_chat_mentions("problem_chat")
-        assert result == 0
-        instance.logger.error.assert_called_once()
-        mock_log_action.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_chat_mentions_condition_not_met(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        mock_chat = mocker.MagicMock()
-        mocker.patch.object(instance, "_get_chat_entity", return_value=mock_chat)
-        # Message doesn't contain bot username
-        mock_message = mocker.MagicMock()
-        mock_message.text = "Hello everyone!"
-        mock_message.id = 123
-        mock_chat.id = 456
-
-        # Mock async iter_messages
-        async def mock_iter_messages(*args, **kwargs):
-            yield mock_message
-
-        instance.client.iter_messages = mock_iter_messages
-        mock_process_mention = mocker.patch.object(
-            instance, "process_mention_async", new_callable=mocker.AsyncMock
+            instance, "process_mention_async", return_value=case["process_return"]
         )
-        result = await instance._check_chat_mentions("test_chat")
-        # Should return 0 because condition not met
-        assert result == 0
-        mock_process_mention.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_chat_mentions_already_processed(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        mock_chat = mocker.MagicMock()
-        mocker.patch.object(instance, "_get_chat_entity", return_value=mock_chat)
-        mock_message = mocker.MagicMock()
-        mock_message.text = "@test_bot hello"
-        mock_message.id = 123
-        mock_chat.id = 456
-
-        # Mock async iter_messages
-        async def mock_iter_messages(*args, **kwargs):
-            yield mock_message
-
-        instance.client.iter_messages = mock_iter_messages
-        mock_process_mention = mocker.patch.object(instance, "process_mention_async")
-        # Message is already processed
         mock_is_processed = mocker.patch.object(
-            instance, "is_processed_async", return_value=True
+            instance, "is_processed_async", return_value=case["is_processed"]
         )
         result = await instance._check_chat_mentions("test_chat")
-        # Should return 0 because already processed
-        assert result == 0
-        mock_is_processed.assert_called_once_with("telegram_456_123")
-        mock_process_mention.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_chat_mentions_process_mention_false(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        mock_chat = mocker.MagicMock()
+        assert result == case["expect"]
+        if case["is_processed"]:
+            mock_is_processed.assert_called_once_with("telegram_456_123")
+
+        if case["expect_process_called"]:
+            mock_extract_data.assert_called_once_with(mock_message, {})
+            mock_process_mention.assert_called_once_with(
+                "telegram_456_123", {}, "@test_bot"
+            )
+        else:
+            mock_process_mention.assert_not_called()
+
+        if case["expect_logger_error"]:
+            instance.logger.error.assert_called_once()
+            instance.log_action_async.assert_called_once()
+        else:
+            instance.logger.error.assert_not_called()
+
+    async def test_trackers_telegramtracker_check_chat_mentions_batches_replies(
+        self, mocker, telegram_tracker
+    ):
+        instance = telegram_tracker
+        mock_chat = _make_chat(id=456)
         mocker.patch.object(instance, "_get_chat_entity", return_value=mock_chat)
-        mock_message = mocker.MagicMock()
-        mock_message.text = "@test_bot hello"
-        mock_message.id = 123
-        mock_chat.id = 456
-
-        # Mock async iter_messages
-        async def mock_iter_messages(*args, **kwargs):
-            yield mock_message
-
-        instance.client.iter_messages = mock_iter_messages
-        # process_mention returns False
-        mock_process_mention = mocker.patch.object(
-            instance, "process_mention_async", return_value=False
-        )
+        messages = [
+            SimpleNamespace(id=index, text="@test_bot hi", reply_to_msg_id=reply_id)
+            for index, reply_id in ((1, 10), (2, 11), (3, 10), (4, None))
+        ]
+        instance.client.iter_messages = _iter_messages_factory(*messages)
+        replied = [SimpleNamespace(id=10), SimpleNamespace(id=11)]
+        instance.client.get_messages.return_value = replied
         mocker.patch.object(instance, "is_processed_async", return_value=False)
-        result = await instance._check_chat_mentions("test_chat")
-        # Should return 0 because process_mention returned False
-        assert result == 0
-        mock_process_mention.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_chat_mentions_no_bot_username(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        # Set bot_username to empty string
-        instance.bot_username = ""
-        mock_chat = mocker.MagicMock()
-        mocker.patch.object(instance, "_get_chat_entity", return_value=mock_chat)
-        mock_message = mocker.MagicMock()
-        mock_message.text = "Some message"
-        mock_message.id = 123
-        mock_chat.id = 456
-
-        # Mock async iter_messages
-        async def mock_iter_messages(*args, **kwargs):
-            yield mock_message
-
-        instance.client.iter_messages = mock_iter_messages
-        mock_process_mention = mocker.patch.object(
-            instance, "process_mention_async", new_callable=mocker.AsyncMock
+        mocker.patch.object(instance, "process_mention_async", return_value=True)
+        mock_extract_data = mocker.patch.object(
+            instance, "extract_mention_data", return_value={}
         )
         result = await instance._check_chat_mentions("test_chat")
-        # Should return 0 when bot_username is empty
-        assert result == 0
-        mock_process_mention.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_chat_mentions_message_no_text(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        mock_chat = mocker.MagicMock()
-        mocker.patch.object(instance, "_get_chat_entity", return_value=mock_chat)
-        # Message with no text (e.g., photo message)
-        mock_message = mocker.MagicMock()
-        mock_message.text = None
-        mock_message.id = 123
-        mock_chat.id = 456
-
-        # Mock async iter_messages
-        async def mock_iter_messages(*args, **kwargs):
-            yield mock_message
-
-        instance.client.iter_messages = mock_iter_messages
-        mock_process_mention = mocker.patch.object(
-            instance, "process_mention_async", new_callable=mocker.AsyncMock
+        assert result == 4
+        instance.client.get_messages.assert_awaited_once_with(mock_chat, ids=[10, 11])
+        replied_messages = {10: replied[0], 11: replied[1]}
+        mock_extract_data.assert_has_calls(
+            [mocker.call(message, replied_messages) for message in messages]
         )
-        result = await instance._check_chat_mentions("test_chat")
-        # Should return 0 when message has no text
-        assert result == 0
-        mock_process_mention.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_chat_mentions_bot_not_mentioned(
-        self, mocker, telegram_config, telegram_chats
+    async def test_trackers_telegramtracker_check_chat_mentions_filters_mentions(
+        self, mocker, telegram_tracker
     ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        mock_chat = mocker.MagicMock()
+        instance = telegram_tracker
+        mock_chat = _make_chat(id=456)
         mocker.patch.object(instance, "_get_chat_entity", return_value=mock_chat)
-        # Message doesn't mention bot
-        mock_message = mocker.MagicMock()
-        mock_message.text = "Hello everyone without mentioning bot"
-        mock_message.id = 123
-        mock_chat.id = 456
-
-        # Mock async iter_messages
-        async def mock_iter_messages(*args, **kwargs):
-            yield mock_message
-
-        instance.client.iter_messages = mock_iter_messages
-        mock_process_mention = mocker.patch.object(
-            instance, "process_mention_async", new_callable=mocker.AsyncMock
+        messages = [
+            SimpleNamespace(id=1, text="Hi @Test_Bot", reply_to_msg_id=None),
+            SimpleNamespace(id=2, text="Hello everyone", reply_to_msg_id=None),
+            SimpleNamespace(id=3, text=None, reply_to_msg_id=None),
+            SimpleNamespace(id=4, text="@test_bot again", reply_to_msg_id=None),
+            SimpleNamespace(id=5, text="@test_bot processed", reply_to_msg_id=None),
+        ]
+        instance.client.iter_messages = _iter_messages_factory(*messages)
+        mock_is_processed = mocker.patch.object(
+            instance, "is_processed_async", side_effect=[False, False, True]
+        )
+        mocker.patch.object(instance, "process_mention_async", return_value=True)
+        mock_extract_data = mocker.patch.object(
+            instance, "extract_mention_data", return_value={}
         )
         result = await instance._check_chat_mentions("test_chat")
-        # Should return 0 when bot not mentioned
-        assert result == 0
-        mock_process_mention.assert_not_called()
+        assert result == 2
+        mock_is_processed.assert_has_calls(
+            [
+                mocker.call("telegram_456_1"),
+                mocker.call("telegram_456_4"),
+                mocker.call("telegram_456_5"),
+            ]
+        )
+        assert mock_extract_data.call_args_list == [
+            mocker.call(messages[0], {}),
+            mocker.call(messages[3], {}),
+        ]
 
     # check_mentions_async
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_check_mentions_async_no_connection(
-        self, mocker, telegram_config, telegram_chats
+        self, telegram_tracker
     ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = False
+        instance = telegram_tracker
         result = await instance.check_mentions_async()
         # Should return 0 when not connected
         assert result == 0
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_check_mentions_async_success(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, connected_telegram_tracker, telegram_chats
     ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        # Track sleep calls to verify delay between chats
-        sleep_calls = []
-
-        async def mock_sleep(delay):
-            sleep_calls.append(delay)
-
-        mocker.patch("asyncio.sleep", side_effect=mock_sleep)
+        instance = connected_telegram_tracker
+        instance._limiter = mocker.MagicMock()
         # Mock _check_chat_mentions to return different counts for different chats
-        mock_check_chat = mocker.patch.object(
-            instance, "_check_chat_mentions", new_callable=mocker.AsyncMock
-        )
+        mock_check_chat = AsyncMock()
+        instance._check_chat_mentions = mock_check_chat
         mock_check_chat.side_effect = [2, 1]  # Different counts for 2 chats
         result = await instance.check_mentions_async()
         # Should return total mentions (2 + 1 = 3)
         assert result == 3
         # Should call _check_chat_mentions for each tracked chat
         assert mock_check_chat.call_count == len(telegram_chats)
-        # Should sleep after each chat (2 sleeps for 2 chats)
-        assert len(sleep_calls) == len(telegram_chats)
-        assert all(sleep == 2 for sleep in sleep_calls)  # Updated to 2 seconds
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_mentions_async_empty_chats(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        # Set tracked_chats to empty list
-        instance.tracked_chats = []
-        # Track sleep calls
-        sleep_calls = []
-
-        async def mock_sleep(delay):
-            sleep_calls.append(delay)
-
-        mocker.patch("asyncio.sleep", side_effect=mock_sleep)
-        result = await instance.check_mentions_async()
-        # Should return 0 when no chats to track
-        assert result == 0
-        # Should not sleep when there are no chats
-        assert len(sleep_calls) == 0
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_mentions_async_single_chat(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        # Set tracked_chats to single chat
-        instance.tracked_chats = ["single_chat"]
-        # Track sleep calls
-        sleep_calls = []
-
-        async def mock_sleep(delay):
-            sleep_calls.append(delay)
-
-        mocker.patch("asyncio.sleep", side_effect=mock_sleep)
-        mocker.patch.object(
-            instance,
-            "_check_chat_mentions",
-            new_callable=mocker.AsyncMock,
-            return_value=3,
-        )
-        result = await instance.check_mentions_async()
-        # Should return mentions from single chat
-        assert result == 3
-        # Should sleep after the chat
-        assert len(sleep_calls) == 1
-        assert sleep_calls[0] == 2  # Updated to 2 seconds
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_check_mentions_async_three_chats(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        # Set tracked_chats to three chats
-        instance.tracked_chats = ["chat1", "chat2", "chat3"]
-        # Track sleep calls
-        sleep_calls = []
-
-        async def mock_sleep(delay):
-            sleep_calls.append(delay)
-
-        mocker.patch("asyncio.sleep", side_effect=mock_sleep)
-        mock_check_chat = mocker.patch.object(
-            instance, "_check_chat_mentions", new_callable=mocker.AsyncMock
-        )
-        mock_check_chat.side_effect = [1, 2, 3]  # Different counts for 3 chats
-        result = await instance.check_mentions_async()
-        # Should return total mentions (1 + 2 + 3 = 6)
-        assert result == 6
-        # Should call _check_chat_mentions for each tracked chat
-        assert mock_check_chat.call_count == 3
-        # Should sleep after each chat (3 sleeps for 3 chats)
-        assert len(sleep_calls) == 3
-        assert all(sleep == 2 for sleep in sleep_calls)  # Updated to 2 seconds
-
-    # _get_chat_entity
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_success(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        mock_entity = mocker.MagicMock()
-        # Mock the async method properly
-        instance.client.get_entity = mocker.AsyncMock(return_value=mock_entity)
-        # Test successful chat retrieval
-        result = await instance._get_chat_entity("test_chat")
-        instance.client.get_entity.assert_called_once_with("test_chat")
-        assert result == mock_entity
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_exception(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        instance.logger = mocker.MagicMock()
-        # Mock the async method to raise exception
-        instance.client.get_entity = mocker.AsyncMock(
-            side_effect=Exception("Chat not found")
-        )
-        # Test exception handling
-        result = await instance._get_chat_entity("invalid_chat")
-        assert result is None
-        instance.logger.error.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_success_by_username(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        mock_entity = mocker.MagicMock()
-        # Mock get_entity to succeed on first call
-        mock_get_entity = mocker.AsyncMock(return_value=mock_entity)
-        instance.client.get_entity = mock_get_entity
-        username = "@some_channel_name"
-        result = await instance._get_chat_entity(username)
-        mock_get_entity.assert_called_once_with(username)
-        assert result == mock_entity
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_value_error_success(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        mock_entity = mocker.MagicMock()
-        # Mock get_entity: first call raises ValueError, second succeeds
-        mock_get_entity = mocker.AsyncMock()
-        mock_get_entity.side_effect = [
-            ValueError("Not a username"),  # First call
-            mock_entity,  # Second call with int conversion
-        ]
-        instance.client.get_entity = mock_get_entity
-        string_id = "-10012345678"
-        result = await instance._get_chat_entity(string_id)
-        # Should be called twice: first with string, second with int
-        mock_get_entity.assert_has_calls(
-            [
-                mocker.call(string_id),
-                mocker.call(-10012345678),
-            ]
-        )
-        assert result == mock_entity
+        # Should take a rate limiter token for each chat
+        assert instance._limiter.__aenter__.await_count == len(telegram_chats)
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_value_error_int_id(
-        self, mocker, telegram_config, telegram_chats
+    async def test_trackers_telegramtracker_check_mentions_async_empty_chats(
+        self, mocker, connected_telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        mock_entity = mocker.MagicMock()
-        # Mock get_entity: first call raises ValueError, second succeeds
-        mock_get_entity = mocker.AsyncMock()
-        mock_get_entity.side_effect = [
-            ValueError("Not a username"),  # First call
-            mock_entity,  # Second call with same int
-        ]
-        instance.client.get_entity = mock_get_entity
-        int_id = 12345678
-        result = await instance._get_chat_entity(int_id)
-        # Should be called twice: both with the same integer
-        mock_get_entity.assert_has_calls(
-            [
-                mocker.call(int_id),
-                mocker.call(int_id),
-            ]
-        )
-        assert result == mock_entity
+        instance = connected_telegram_tracker
+        instance._limiter = mocker.MagicMock()
+        # Set tracked_chats to empty list
+        instance.tracked_chats = []
+        result = await instance.check_mentions_async()
+        # Should return 0 when no chats to track
+        assert result == 0
+        # Should not touch the rate limiter when there are no chats
+        instance._limiter.__aenter__.assert_not_awaited()
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_value_exception(
-        self, mocker, telegram_config, telegram_chats
+    async def test_trackers_telegramtracker_check_mentions_async_single_chat(
+        self, mocker, connected_telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance.logger = mocker.MagicMock()
-        # Mock get_entity: first raises ValueError, second raises another exception (caught silently)
-        mock_get_entity = mocker.AsyncMock()
-        mock_get_entity.side_effect = [
-            ValueError("Not a username"),  # First call
-            Exception("Peer ID invalid"),  # Second call - caught by inner except
-        ]
-        instance.client.get_entity = mock_get_entity
-        identifier = "-12345"
-        result = await instance._get_chat_entity(identifier)
-        # Should return None
-        assert result is None
-        # Outer exception logger should NOT be called (only for general exceptions)
-        instance.logger.error.assert_not_called()
+        instance = connected_telegram_tracker
+        instance._limiter = mocker.MagicMock()
+        # Set tracked_chats to single chat
+        instance.tracked_chats = ["single_chat"]
+        instance._check_chat_mentions = AsyncMock(return_value=3)
+        result = await instance.check_mentions_async()
+        # Should return mentions from single chat
+        assert result == 3
+        instance._limiter.__aenter__.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_value_error_string(
-        self, mocker, telegram_config, telegram_chats
+    async def test_trackers_telegramtracker_check_mentions_async_three_chats(
+        self, mocker, connected_telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance.logger = mocker.MagicMock()
-        # Mock get_entity to raise ValueError
-        mock_get_entity = mocker.AsyncMock(side_effect=ValueError("Not a username"))
-        instance.client.get_entity = mock_get_entity
-        # Non-digit string that can't be converted to int
-        identifier = "@invalid_chat_name"
-        result = await instance._get_chat_entity(identifier)
-        # Should be called once and return None
-        mock_get_entity.assert_called_once_with(identifier)
-        assert result is None
-        # Outer exception logger should NOT be called
-        instance.logger.error.assert_not_called()
+        instance = connected_telegram_tracker
+        instance._limiter = mocker.MagicMock()
+        # Set tracked_chats to three chats
+        instance.tracked_chats = ["chat1", "chat2", "chat3"]
+        mock_check_chat = AsyncMock()
+        instance._check_chat_mentions = mock_check_chat
+        mock_check_chat.side_effect = [1, 2, 3]  # Different counts for 3 chats
+        result = await instance.check_mentions_async()
+        # Should return total mentions (1 + 2 + 3 = 6)
+        assert result == 6
+        # Should call _check_chat_mentions for each tracked chat
+        assert mock_check_chat.call_count == 3
+        assert instance._limiter.__aenter__.await_count == 3
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_general_exception(
-        self, mocker, telegram_config, telegram_chats
+    async def test_trackers_telegramtracker_check_mentions_async_rate_limited(
+        self, connected_telegram_tracker, no_sleep
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance.logger = mocker.MagicMock()
-        # Mock get_entity to raise a general Exception (not ValueError)
-        mock_get_entity = mocker.AsyncMock(
-            side_effect=Exception("API connection failed")
-        )
-        instance.client.get_entity = mock_get_entity
-        identifier = "@some_username"
-        result = await instance._get_chat_entity(identifier)
-        assert result is None
-        instance.logger.error.assert_called_once_with(
-            f"Error getting chat entity for {identifier}: API connection failed"
-        )
+        instance = connected_telegram_tracker
+        instance.tracked_chats = ["chat1", "chat2", "chat3"]
+        instance._check_chat_mentions = AsyncMock(return_value=1)
+        result = await instance.check_mentions_async()
+        assert result == 3
+        # The first check takes the bucket's token, the next ones wait for refills
+        assert len(no_sleep) == 2
+        assert no_sleep[0] == pytest.approx(2, abs=0.01)
+        assert no_sleep[1] == pytest.approx(4, abs=0.01)
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_empty_string(
-        self, mocker, telegram_config, telegram_chats
+    async def test_trackers_telegramtracker_check_mentions_async_chat_exception(
+        self, connected_telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
+        instance = connected_telegram_tracker
+        instance.tracked_chats = ["chat1", "chat2"]
+        instance._check_chat_mentions = AsyncMock(
+            side_effect=[Exception("Chat error"), 4]
         )
-        instance.client = mocker.MagicMock()
-        instance.logger = mocker.MagicMock()
-        # Mock get_entity to raise ValueError for empty string
-        mock_get_entity = mocker.AsyncMock(side_effect=ValueError("Empty string"))
-        instance.client.get_entity = mock_get_entity
-        identifier = ""
-        result = await instance._get_chat_entity(identifier)
-        mock_get_entity.assert_called_once_with(identifier)
-        assert result is None
+        mocked_error = instance.logger.error
+        result = await instance.check_mentions_async()
+        assert result == 4
+        mocked_error.assert_called_once_with("Error processing chat: Chat error")
+
+    async def test_trackers_telegramtracker_check_mentions_async_limits_concurrency(
+        self, mocker, connected_telegram_tracker
+    ):
+        instance = connected_telegram_tracker
+        instance._limiter = mocker.MagicMock()
+        instance.tracked_chats = [f"chat{index}" for index in range(6)]
+        instance.concurrent_chat_checks = 2
+        running, peak = 0, 0
+
+        async def check_chat(chat):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # asyncio.sleep is patched, so yield to the loop through a future
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            loop.call_soon(future.set_result, None)
+            await future
+            running -= 1
+            return 1
+
+        instance._check_chat_mentions = check_chat
+        result = await instance.check_mentions_async()
+        assert result == 6
+        assert peak == 2
+
+    def test_trackers_telegramtracker_check_mentions_async_in_new_event_loops(
+        self, mocker, connected_telegram_tracker
+    ):
+        instance = connected_telegram_tracker
+        instance._limiter = mocker.MagicMock()
+        instance.tracked_chats = [f"chat{index}" for index in range(4)]
+        instance.concurrent_chat_checks = 1
+
+        async def check_chat(chat):
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            loop.call_soon(future.set_result, None)
+            await future
+            return 1
+
+        instance._check_chat_mentions = check_chat
+        # every check runs in its own loop, like `check_mentions` does
+        for _ in range(2):
+            loop = asyncio.new_event_loop()
+            try:
+                assert loop.run_until_complete(instance.check_mentions_async()) == 4
+            finally:
+                loop.close()
+
+    # _process_check_results
+    def test_trackers_telegramtracker_process_check_results(self, telegram_tracker):
+        instance = telegram_tracker
+        mocked_error = instance.logger.error
+        result = instance._process_check_results([1, Exception("Failed"), 2])
+        assert result == 3
+        mocked_error.assert_called_once_with("Error processing chat: Failed")
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_none_value(
-        self, mocker, telegram_config, telegram_chats
+    def test_trackers_telegramtracker_process_check_results_cancelled(
+        self, telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance.logger = mocker.MagicMock()
-        # Mock get_entity
-        mock_get_entity = mocker.AsyncMock()
-        instance.client.get_entity = mock_get_entity
-        await instance._get_chat_entity(None)
-        # Should call get_entity with None and likely raise an exception
-        mock_get_entity.assert_called_once_with(None)
-        # The exact behavior depends on Telethon's handling of None
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_success_by_string_id(
-        self, mocker, telegram_config, telegram_chats
+        instance = telegram_tracker
+        mocked_error = instance.logger.error
+        result = instance._process_check_results([1, asyncio.CancelledError(), 2])
+        assert result == 3
+        mocked_error.assert_called_once_with("Error processing chat: ")
+
+    # _get_chat_entity
+    @pytest.mark.parametrize(
+        "identifier,error,lookup,logs_error",
+        [
+            ("test_chat", None, "test_chat", False),
+            ("@some_channel_name", None, "@some_channel_name", False),
+            ("-10012345678", None, -10012345678, False),
+            ("12345678", None, 12345678, False),
+            (12345678, None, 12345678, False),
+            (None, None, None, False),
+            ("invalid_chat", Exception("Chat not found"), "invalid_chat", True),
+            ("@some_username", Exception("API failed"), "@some_username", True),
+            ("-12345", Exception("Peer ID invalid"), -12345, True),
+            (12345678, ValueError("Not found"), 12345678, False),
+            ("@invalid_chat", ValueError("Not a username"), "@invalid_chat", False),
+            ("", ValueError("Empty string"), "", False),
+        ],
+        ids=[
+            "username",
+            "at_username",
+            "string_id",
+            "positive_string_id",
+            "int_id",
+            "none",
+            "exception",
+            "at_username_exception",
+            "string_id_exception",
+            "int_id_value_error",
+            "at_username_value_error",
+            "empty_string_value_error",
+        ],
+    )
+    async def test_trackers_telegramtracker_get_chat_entity(
+        self, mocker, connected_telegram_tracker, identifier, error, lookup, logs_error
+    ):
+        instance = connected_telegram_tracker
+        mock_entity = mocker.MagicMock()
+        instance.client.get_entity.return_value = mock_entity
+        instance.client.get_entity.side_effect = error
+        result = await instance._get_chat_entity(identifier)
+        # Numeric strings are converted before the one and only lookup
+        instance.client.get_entity.assert_awaited_once_with(lookup)
+        assert result == (None if error else mock_entity)
+        if logs_error:
+            instance.logger.error.assert_called_once_with(
+                f"Error getting chat entity for {identifier}: {error}"
+            )
+        else:
+            instance.logger.error.assert_not_called()
+
+    async def test_trackers_telegramtracker_get_chat_entity_cached(
+        self, mocker, telegram_tracker
+    ):
+        instance = telegram_tracker
+        mock_entity = mocker.MagicMock()
+        instance.client.get_entity.return_value = mock_entity
+        assert await instance._get_chat_entity("test_chat") == mock_entity
+        assert await instance._get_chat_entity("test_chat") == mock_entity
+        instance.client.get_entity.assert_awaited_once_with("test_chat")
+        assert instance._entity_cache == {"test_chat": mock_entity}
+
+    async def test_trackers_telegramtracker_get_chat_entity_cached_string_id(
+        self, mocker, telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
+        instance = telegram_tracker
         mock_entity = mocker.MagicMock()
-        # Explicitly patch the method as AsyncMock for cleaner side_effect handling
-        mock_get_entity = mocker.patch.object(
-            instance.client, "get_entity", new_callable=mocker.AsyncMock
-        )
-        # Mocking: First get_entity raises ValueError, second call (with int) succeeds
-        mock_get_entity.side_effect = [
-            ValueError("Not a username"),
-            mock_entity,
-        ]
-        result = await instance._get_chat_entity("-10012345678")
-        # Assert the fallthrough logic was executed correctly
-        mock_get_entity.assert_has_calls(
-            [mocker.call("-10012345678"), mocker.call(-10012345678)]
-        )
-        assert result == mock_entity
+        instance.client.get_entity.return_value = mock_entity
+        assert await instance._get_chat_entity("-10012345678") == mock_entity
+        assert await instance._get_chat_entity("-10012345678") == mock_entity
+        assert await instance._get_chat_entity(-10012345678) == mock_entity
+        instance.client.get_entity.assert_awaited_once_with(-10012345678)
+        assert instance._entity_cache == {
+            "-10012345678": mock_entity,
+            -10012345678: mock_entity,
+        }
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_success_by_int_id(
-        self, mocker, telegram_config, telegram_chats
+    async def test_trackers_telegramtracker_get_chat_entity_failure_not_cached(
+        self, mocker, telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
+        instance = telegram_tracker
         mock_entity = mocker.MagicMock()
-        # Explicitly patch the method as AsyncMock for cleaner side_effect handling
-        mock_get_entity = mocker.patch.object(
-            instance.client, "get_entity", new_callable=mocker.AsyncMock
-        )
-        # Mocking: First get_entity raises ValueError, second call succeeds
-        mock_get_entity.side_effect = [
-            ValueError("Not a username"),
+        instance.client.get_entity.side_effect = [
+            Exception("Temporary error"),
             mock_entity,
         ]
-        result = await instance._get_chat_entity(12345678)
-        # Assert the fallthrough logic was executed correctly
-        mock_get_entity.assert_has_calls([mocker.call(12345678), mocker.call(12345678)])
-        assert result == mock_entity
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_failure_by_id_silently_caught(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance.logger = mocker.MagicMock()
-        # Explicitly patch the method as AsyncMock
-        mock_get_entity = mocker.patch.object(
-            instance.client, "get_entity", new_callable=mocker.AsyncMock
-        )
-        # Mocking: First raises ValueError, second raises an Exception (caught by inner except)
-        mock_get_entity.side_effect = [
-            ValueError("Not a username"),
-            Exception(
-                "Peer ID invalid"
-            ),  # This exception is caught by `except Exception: pass`
-        ]
-        result = await instance._get_chat_entity("-12345")
-        assert result is None
-        # Assert the outer exception logger was NOT called
-        instance.logger.error.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_get_chat_entity_failure_by_general_exception(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance.logger = mocker.MagicMock()
-        # Explicitly patch the method as AsyncMock
-        mock_get_entity = mocker.patch.object(
-            instance.client, "get_entity", new_callable=mocker.AsyncMock
-        )
-        # Mocking: The initial get_entity call raises a general Exception (not ValueError)
-        mock_get_entity.side_effect = Exception("API connection failed")
-        result = await instance._get_chat_entity("@some_username")
-        assert result is None
-        instance.logger.error.assert_called_once_with(
-            "Error getting chat entity for @some_username: API connection failed"
-        )
+        assert await instance._get_chat_entity("test_chat") is None
+        assert await instance._get_chat_entity("test_chat") == mock_entity
+        assert instance.client.get_entity.await_count == 2
 
     # # _get_sender_info
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_get_sender_info_success(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
+        instance = telegram_tracker
         mock_message = mocker.MagicMock()
         mock_sender = mocker.MagicMock()
         mock_sender.id = 12345
@@ -1098,15 +778,10 @@ class TestTrackersTelegram:
         assert result["username"] == "testuser"
         assert result["display_name"] == "Test User"
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_get_sender_info_exception(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
+        instance = telegram_tracker
         mock_message = mocker.MagicMock()
         mock_message.sender_id = 12345
         # Mock the async method to raise exception
@@ -1117,15 +792,10 @@ class TestTrackersTelegram:
         assert result["username"] is None
         assert result["display_name"] is None
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_get_sender_info_no_sender(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
+        instance = telegram_tracker
         mock_message = mocker.MagicMock()
         mock_message.sender_id = 12345
         # Mock the async method to return None
@@ -1136,15 +806,10 @@ class TestTrackersTelegram:
         assert result["username"] is None
         assert result["display_name"] is None
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_get_replied_message_info_success(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
+        instance = telegram_tracker
         mock_message = mocker.MagicMock()
         mock_message.reply_to_msg_id = 99
         mock_message.chat_id = 123
@@ -1152,9 +817,7 @@ class TestTrackersTelegram:
         mock_replied_message.id = 99
         mock_replied_message.text = "This is the original message."
         # Mock get_messages
-        instance.client.get_messages = mocker.AsyncMock(
-            return_value=mock_replied_message
-        )
+        instance.client.get_messages.return_value = mock_replied_message
         # Mock _get_sender_info for the replied message
         mock_sender_info = {
             "user_id": 54321,
@@ -1168,82 +831,107 @@ class TestTrackersTelegram:
         assert result["text"] == "This is the original message."
         instance.client.get_messages.assert_called_once_with(123, ids=99)
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_get_replied_message_info_no_reply(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
+        instance = telegram_tracker
         mock_message = mocker.MagicMock()
         mock_message.reply_to_msg_id = None
         result = await instance._get_replied_message_info(mock_message)
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_get_replied_message_info_no_replied_message(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
+        instance = telegram_tracker
         mock_message = mocker.MagicMock()
         mock_message.reply_to_msg_id = 99
         mock_message.chat_id = 123
         # Mock get_messages to return None (message not found)
-        instance.client.get_messages = mocker.AsyncMock(return_value=None)
+        instance.client.get_messages.return_value = None
         result = await instance._get_replied_message_info(mock_message)
         # Should return None when replied message is not found
         assert result is None
         instance.client.get_messages.assert_called_once_with(123, ids=99)
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_get_replied_message_info_exception(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        # Mock TelegramClient
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
+        instance = telegram_tracker
         mock_message = mocker.MagicMock()
         mock_message.reply_to_msg_id = 99
         mock_message.chat_id = 123
         # Mock get_messages to raise exception
-        instance.client.get_messages = mocker.AsyncMock(
-            side_effect=Exception("Message not found")
-        )
+        instance.client.get_messages.side_effect = Exception("Message not found")
         result = await instance._get_replied_message_info(mock_message)
         # Should return None on exception
         assert result is None
         instance.client.get_messages.assert_called_once_with(123, ids=99)
 
+    async def test_trackers_telegramtracker_get_replied_message_info_prefetched(
+        self, mocker, telegram_tracker
+    ):
+        instance = telegram_tracker
+        mock_sender_info = {"user_id": 54321, "username": None, "display_name": None}
+        mocker.patch.object(instance, "_get_sender_info", return_value=mock_sender_info)
+        replied_message = SimpleNamespace(id=99, text=None)
+        message = SimpleNamespace(reply_to_msg_id=99, chat_id=123)
+        result = await instance._get_replied_message_info(
+            message, {99: replied_message}
+        )
+        assert result == {"message_id": 99, "sender_info": mock_sender_info, "text": ""}
+        message.reply_to_msg_id = 98
+        assert await instance._get_replied_message_info(message, {}) is None
+        instance.client.get_messages.assert_not_called()
+
+    # _get_replied_messages
+    async def test_trackers_telegramtracker_get_replied_messages_no_replies(
+        self, telegram_tracker
+    ):
+        instance = telegram_tracker
+        messages = [SimpleNamespace(reply_to_msg_id=None)]
+        assert await instance._get_replied_messages(_make_chat(), messages) == {}
+        instance.client.get_messages.assert_not_called()
+
+    async def test_trackers_telegramtracker_get_replied_messages_skips_missing(
+        self, telegram_tracker
+    ):
+        instance = telegram_tracker
+        replied_message = SimpleNamespace(id=7)
+        instance.client.get_messages.return_value = [None, replied_message]
+        chat = _make_chat()
+        messages = [
+            SimpleNamespace(reply_to_msg_id=6),
+            SimpleNamespace(reply_to_msg_id=7),
+        ]
+        result = await instance._get_replied_messages(chat, messages)
+        assert result == {7: replied_message}
+        instance.client.get_messages.assert_awaited_once_with(chat, ids=[6, 7])
+
+    async def test_trackers_telegramtracker_get_replied_messages_exception(
+        self, telegram_tracker
+    ):
+        instance = telegram_tracker
+        instance.client.get_messages.side_effect = Exception("API error")
+        messages = [SimpleNamespace(reply_to_msg_id=6)]
+        assert await instance._get_replied_messages(_make_chat(), messages) is None
+        instance.logger.debug.assert_called_once_with(
+            "Error getting replied messages: API error"
+        )
+
     # # _generate_message_url
     def test_trackers_telegramtracker_generate_message_url_functionailty(
-        self, mocker, telegram_config, telegram_chats
+        self, telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        mock_chat = mocker.MagicMock()
-        mock_chat.id = 12345
-        result = instance._generate_message_url(mock_chat, 100)
+        instance = telegram_tracker
+        result = instance._generate_message_url(_make_chat(id=12345), 100)
         assert result == "https://t.me/c/-12345/100"
 
     # # _post_init_setup
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_post_init_setup(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker, telegram_chats
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
+        instance = telegram_tracker
         mock_log_action = mocker.patch.object(instance, "log_action_async")
         await instance._post_init_setup(telegram_chats)
         mock_log_action.assert_called_once_with(
@@ -1251,76 +939,42 @@ class TestTrackersTelegram:
         )
 
     # # cleanup
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_cleanup_connected(
-        self, mocker, telegram_config, telegram_chats
+        self, connected_telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance._is_connected = True
-        instance.client.disconnect = mocker.AsyncMock()
-        instance.logger = mocker.MagicMock()
+        instance = connected_telegram_tracker
         await instance.cleanup()
-        instance.client.disconnect.assert_called_once()
+        instance.client.disconnect.assert_awaited_once_with()
         instance.logger.info.assert_called_with("Disconnecting Telegram client")
         assert instance._is_connected is False
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_cleanup_success(
-        self, mocker, telegram_config, telegram_chats
+    async def test_trackers_telegramtracker_cleanup_concurrent_calls(
+        self, connected_telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance._is_connected = True
-        instance.logger = mocker.MagicMock()
-        # Mock disconnect as AsyncMock
-        mock_disconnect = mocker.AsyncMock()
-        instance.client.disconnect = mock_disconnect
+        instance = connected_telegram_tracker
+        await asyncio.gather(instance.cleanup(), instance.cleanup())
         await instance.cleanup()
-        mock_disconnect.assert_called_once()
+        instance.client.disconnect.assert_awaited_once_with()
         assert instance._is_connected is False
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_cleanup_not_connected(
-        self, mocker, telegram_config, telegram_chats
+        self, telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance._is_connected = False
+        instance = telegram_tracker
         await instance.cleanup()
         instance.client.disconnect.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_cleanup_no_client(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
+    async def test_trackers_telegramtracker_cleanup_no_client(self, telegram_tracker):
+        instance = telegram_tracker
         instance.client = None
-        instance._is_connected = False
         await instance.cleanup()
         # Should not raise an error
 
     # # is_processed_async
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_is_processed_async(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
+        instance = telegram_tracker
         mock_is_processed = mocker.patch.object(
             instance, "is_processed", return_value=True
         )
@@ -1329,14 +983,11 @@ class TestTrackersTelegram:
         mock_is_processed.assert_called_once_with("some_id")
 
     # # process_mention_async
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_process_mention_async(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: {"parsed": "data"}, telegram_config, telegram_chats
-        )
+        instance = telegram_tracker
+        instance.parse_message_callback = lambda x, y=None: {"parsed": "data"}
         # Mock the parent class's process_mention method which is called by process_mention_async
         mocker.patch.object(
             BaseAsyncMentionTracker, "process_mention", return_value=True
@@ -1355,355 +1006,228 @@ class TestTrackersTelegram:
         assert result is True
 
     # # _ensure_connected
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_ensure_connected_success(
-        self, mocker, telegram_config, telegram_chats
+        self, telegram_tracker
     ):
-        # 1. Patch the TelegramClient class and capture its mock return value
-        mock_client_class = mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        # 2. Get the mock instance assigned to instance.client
-        mock_client_instance = mock_client_class.return_value
-        # 3. Setup and assign the dedicated AsyncMock for the methods
-        mock_connect = mocker.AsyncMock()
-        mock_is_user_authorized = mocker.AsyncMock(return_value=True)
-        mock_client_instance.connect = mock_connect
-        mock_client_instance.is_user_authorized = mock_is_user_authorized
-        instance._is_connected = False
-        # Mock _get_chat_entity
-        mock_entity = mocker.MagicMock(id=1234)
-        mocker.patch.object(
-            instance,
-            "_get_chat_entity",
-            new_callable=mocker.AsyncMock,
-            return_value=mock_entity,
-        )
+        instance = telegram_tracker
+        instance.client.is_user_authorized.return_value = True
         await instance._ensure_connected()
-        # Assertions
-        mock_connect.assert_called_once()
-        mock_is_user_authorized.assert_called_once()
+        instance.client.connect.assert_awaited_once_with()
+        instance.client.is_user_authorized.assert_awaited_once_with()
+        instance.client.sign_in.assert_not_called()
         assert instance._is_connected is True
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_ensure_connected_password_error(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        mock_client_class = mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.logger = mocker.MagicMock()
-        # Get the mock instance
-        mock_client_instance = mock_client_class.return_value
-        # Setup and assign the dedicated AsyncMock for methods
-        mock_connect = mocker.AsyncMock()
-        mock_is_user_authorized = mocker.AsyncMock(return_value=False)
-        mock_send_code_request = mocker.AsyncMock()
+        instance = telegram_tracker
+        instance.client.is_user_authorized.return_value = False
         # First sign_in raises SessionPasswordNeededError, second succeeds
-        mock_sign_in = mocker.AsyncMock()
-        mock_sign_in.side_effect = [
-            SessionPasswordNeededError("Need password"),  # First call
-            None,  # Second call with password
-        ]
-        mock_client_instance.connect = mock_connect
-        mock_client_instance.is_user_authorized = mock_is_user_authorized
-        mock_client_instance.send_code_request = mock_send_code_request
-        mock_client_instance.sign_in = mock_sign_in
-        instance._is_connected = False
+        instance.client.sign_in.side_effect = [SESSION_PASSWORD_ERROR, None]
         # Mock input to avoid hanging - need two inputs (phone/code) then password
         input_calls = ["123456789", "123456", "2fapassword"]
-        mocker.patch("builtins.input", side_effect=input_calls)
+        mocker.patch("trackers.telegram.input", create=True, side_effect=input_calls)
         await instance._ensure_connected()
-        # Assertions
-        mock_connect.assert_called_once()
-        mock_is_user_authorized.assert_called_once()
-        mock_send_code_request.assert_called_once()
-        # Check sign_in was called twice
-        assert mock_sign_in.call_count == 2
-        # First call with phone and code
-        mock_sign_in.assert_any_call("123456789", "123456")
-        # Second call with password only
-        mock_sign_in.assert_any_call(password="2fapassword")
+        instance.client.connect.assert_awaited_once_with()
+        instance.client.is_user_authorized.assert_awaited_once_with()
+        instance.client.send_code_request.assert_awaited_once_with("123456789")
+        # First call with phone and code, second call with password only
+        assert instance.client.sign_in.await_args_list == [
+            mocker.call("123456789", "123456"),
+            mocker.call(password="2fapassword"),
+        ]
         assert instance._is_connected is True
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_ensure_connected_general_error(
-        self, mocker, telegram_config, telegram_chats
+        self, telegram_tracker
     ):
-        mock_client_class = mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.logger = mocker.MagicMock()
-        # Get the mock instance
-        mock_client_instance = mock_client_class.return_value
-        # Setup and assign the dedicated AsyncMock for connect
-        mock_connect = mocker.AsyncMock(side_effect=Exception("General API error"))
-        mock_client_instance.connect = mock_connect
-        instance._is_connected = False
+        instance = telegram_tracker
+        instance.client.connect.side_effect = Exception("General API error")
         # The method should raise the exception
         with pytest.raises(Exception, match="General API error"):
             await instance._ensure_connected()
-        # Assertions
-        mock_connect.assert_called_once()
+
+        instance.client.connect.assert_awaited_once_with()
         instance.logger.error.assert_called_once_with(
             "Error connecting Telegram client: General API error"
         )
         assert instance._is_connected is False
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_ensure_connected_already_connected(
-        self, mocker, telegram_config, telegram_chats
+        self, connected_telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = True
-        instance.client = mocker.MagicMock()
-        mock_connect = mocker.AsyncMock()
-        instance.client.connect = mock_connect
+        instance = connected_telegram_tracker
         await instance._ensure_connected()
-        mock_connect.assert_not_called()
+        instance.client.connect.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_ensure_connected_authorization_needed(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance.client.connect = mocker.AsyncMock()
-        instance.client.is_user_authorized = mocker.AsyncMock(return_value=False)
-        instance.client.send_code_request = mocker.AsyncMock()
-        instance.client.sign_in = mocker.AsyncMock()
+        instance = telegram_tracker
+        instance.client.is_user_authorized.return_value = False
         # Mock input to avoid hanging in tests
-        mocker.patch("builtins.input", side_effect=["123456789", "12345"])
+        mocker.patch(
+            "trackers.telegram.input", create=True, side_effect=["123456789", "12345"]
+        )
         await instance._ensure_connected()
         assert instance._is_connected is True
-        instance.client.connect.assert_called_once()
-        instance.client.is_user_authorized.assert_called_once()
+        instance.client.connect.assert_awaited_once_with()
+        instance.client.is_user_authorized.assert_awaited_once_with()
+        instance.client.sign_in.assert_awaited_once_with("123456789", "12345")
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_ensure_connected_session_password(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance.client.connect = mocker.AsyncMock()
-        instance.client.is_user_authorized = mocker.AsyncMock(return_value=False)
-        instance.client.send_code_request = mocker.AsyncMock()
-        # Create a proper SessionPasswordNeededError instance
-        session_error = SessionPasswordNeededError(request=mocker.MagicMock())
-        instance.client.sign_in = mocker.AsyncMock(side_effect=[session_error, None])
+        instance = telegram_tracker
+        instance.client.is_user_authorized.return_value = False
+        instance.client.sign_in.side_effect = [SESSION_PASSWORD_ERROR, None]
         # Mock input to avoid hanging in tests
         mocker.patch(
-            "builtins.input", side_effect=["123456789", "12345", "2fapassword"]
+            "trackers.telegram.input",
+            create=True,
+            side_effect=["123456789", "12345", "2fapassword"],
         )
         await instance._ensure_connected()
         assert instance._is_connected is True
-        instance.client.connect.assert_called_once()
+        instance.client.connect.assert_awaited_once_with()
 
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_ensure_connected_exception(
-        self, mocker, telegram_config, telegram_chats
+        self, telegram_tracker
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.client = mocker.MagicMock()
-        instance.client.connect = mocker.AsyncMock(
-            side_effect=Exception("Connection failed")
-        )
-        instance.logger = mocker.MagicMock()
+        instance = telegram_tracker
+        instance.client.connect.side_effect = Exception("Connection failed")
         with pytest.raises(Exception, match="Connection failed"):
             await instance._ensure_connected()
+
         assert instance._is_connected is False
         instance.logger.error.assert_called_once()
 
+    async def test_trackers_telegramtracker_ensure_connected_authorizes_once(
+        self, telegram_tracker
+    ):
+        instance = telegram_tracker
+        instance.client.is_user_authorized.return_value = True
+        await instance._ensure_connected()
+        await instance._ensure_connected()
+        instance.client.connect.assert_awaited_once()
+        instance.client.is_user_authorized.assert_awaited_once()
+
+    # _connect
+    async def test_trackers_telegramtracker_connect_retries_network_errors(
+        self, mocker, telegram_tracker, no_sleep
+    ):
+        instance = telegram_tracker
+        instance.client.connect.side_effect = [
+            ConnectionError("Reset"),
+            OSError("Unreachable"),
+            None,
+        ]
+        await instance._connect()
+        assert instance.client.connect.await_count == 3
+        assert no_sleep == [1, 2]
+        instance.logger.warning.assert_has_calls(
+            [
+                mocker.call("Telegram connection attempt 1 failed: Reset"),
+                mocker.call("Telegram connection attempt 2 failed: Unreachable"),
+            ]
+        )
+
+    async def test_trackers_telegramtracker_connect_gives_up(
+        self, telegram_tracker, no_sleep
+    ):
+        instance = telegram_tracker
+        instance.client.connect.side_effect = ConnectionError("Reset")
+        with pytest.raises(ConnectionError, match="Reset"):
+            await instance._connect()
+
+        assert instance.client.connect.await_count == instance.connect_retries
+        assert no_sleep == [1, 2]
+
     # run_async
-    @pytest.mark.asyncio
     async def test_trackers_telegramtracker_run_async_success(
-        self, mocker, telegram_config, telegram_chats
+        self, mocker, telegram_tracker, telegram_chats, no_sleep
     ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = False
+        instance = telegram_tracker
         # Mock dependencies
         mock_ensure = mocker.patch.object(instance, "_ensure_connected")
         mock_log_action = mocker.patch.object(instance, "log_action_async")
-        mock_check = mocker.patch.object(
-            instance,
-            "check_mentions_async",
-            new_callable=mocker.AsyncMock,
-            return_value=2,
-        )
-        mock_sleep = mocker.patch("asyncio.sleep")
 
-        # Set exit_signal after first iteration
-        def set_exit_signal(*args, **kwargs):
-            instance.exit_signal = True
+        # Set exit_signal on the second check
+        async def check_mentions():
+            if mock_check.await_count > 1:
+                instance.exit_signal = True
 
-        mock_sleep.side_effect = set_exit_signal
-        await instance.run_async(
-            poll_interval_minutes=1
-        )  # Use integer to avoid float issues
+            return 2
+
+        mock_check = AsyncMock(side_effect=check_mentions)
+        instance.check_mentions_async = mock_check
+        await instance.run_async(poll_interval_minutes=1)
         mock_ensure.assert_called_once()
         mock_log_action.assert_called_with(
             "started", f"Tracking {len(telegram_chats)} chats"
         )
-        mock_check.assert_called_once()
-        mock_sleep.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_run_async_mentions_found(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = False
-        instance.logger = mocker.MagicMock()
-        # Mock dependencies
-        mocker.patch.object(instance, "_ensure_connected")
-        mocker.patch.object(instance, "log_action_async")
-        # Return 3 mentions on first check, then set exit_signal
-        check_count = 0
-
-        async def mock_check():
-            nonlocal check_count
-            check_count += 1
-            if check_count == 1:
-                return 3
-            instance.exit_signal = True
-            return 0
-
-        mocker.patch.object(instance, "check_mentions_async", side_effect=mock_check)
-        mocker.patch("asyncio.sleep")
-        await instance.run_async(
-            poll_interval_minutes=1
-        )  # Use integer to avoid float issues
-        # Should log that mentions were found
-        instance.logger.info.assert_any_call("Found 3 new mentions")
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_run_async_cancelled(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = False
-        instance.client = mocker.MagicMock()
-        instance.logger = mocker.MagicMock()
-        # Mock _ensure_connected to avoid actual connection
-        mocker.patch.object(
-            instance, "_ensure_connected", new_callable=mocker.AsyncMock
-        )
-        # Mock log_action_async
-        mocker.patch.object(instance, "log_action_async", new_callable=mocker.AsyncMock)
-        # Mock check_mentions_async to raise CancelledError immediately
-        mocker.patch.object(
-            instance,
-            "check_mentions_async",
-            new_callable=mocker.AsyncMock,
-            side_effect=asyncio.CancelledError(),
-        )
-        # Mock cleanup
-        mocker.patch.object(instance, "cleanup", new_callable=mocker.AsyncMock)
-        # Should raise CancelledError (due to re-raise in run_async's except block)
-        with pytest.raises(asyncio.CancelledError):
+        assert mock_check.await_count == 2
+        # Slept in one second chunks between the checks
+        assert no_sleep == [1] * 60
+
+    @pytest.mark.parametrize(
+        "results,raises,level,message",
+        [
+            ([3, 0], None, "info", "Found 3 new mentions"),
+            (
+                [asyncio.CancelledError()],
+                asyncio.CancelledError,
+                "info",
+                "Telegram tracker cancelled",
+            ),
+            (
+                [Exception("Test error")],
+                Exception,
+                "error",
+                "Telegram tracker error: Test error",
+            ),
+            ([KeyboardInterrupt()], None, "info", "Telegram tracker stopped by user"),
+        ],
+        ids=["mentions_found", "cancelled", "exception", "keyboardinterrupt"],
+    )
+    async def test_trackers_telegramtracker_run_async_outcomes(
+        self, telegram_tracker, results, raises, level, message
+    ):
+        instance = telegram_tracker
+        instance._ensure_connected = AsyncMock()
+        instance.cleanup = AsyncMock()
+        results = list(results)
+
+        # Return or raise the next result, requesting exit after the last one
+        async def check_mentions():
+            result = results.pop(0)
+            if not results:
+                instance.exit_signal = True
+
+            if isinstance(result, BaseException):
+                raise result
+
+            return result
+
+        instance.check_mentions_async = check_mentions
+        if raises:
+            with pytest.raises(raises):
+                await instance.run_async(poll_interval_minutes=1)
+
+        else:
             await instance.run_async(poll_interval_minutes=1)
-        instance.logger.info.assert_any_call("Telegram tracker cancelled")
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_run_async_exception(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = False
-        instance.logger = mocker.MagicMock()
-        # Mock dependencies
-        mocker.patch.object(instance, "_ensure_connected")
-        mocker.patch.object(instance, "log_action_async")
-        mock_cleanup = mocker.patch.object(
-            instance, "cleanup", new_callable=mocker.AsyncMock
-        )
-        mocker.patch.object(
-            instance,
-            "check_mentions_async",
-            new_callable=mocker.AsyncMock,
-            side_effect=Exception("Test error"),
-        )
-        with pytest.raises(Exception, match="Test error"):
-            await instance.run_async(poll_interval_minutes=1)
-        instance.logger.error.assert_called_once_with(
-            "Telegram tracker error: Test error"
-        )
-        mock_cleanup.assert_called_once()
+        getattr(instance.logger, level).assert_any_call(message)
+        instance._ensure_connected.assert_awaited_once_with()
+        # cleanup always runs in the finally block
+        instance.cleanup.assert_awaited_once_with()
 
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_run_async_no_client(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance.logger = mocker.MagicMock()
+    async def test_trackers_telegramtracker_run_async_no_client(self, telegram_tracker):
+        instance = telegram_tracker
         instance.client = None  # Explicitly set client to None
-        mock_cleanup = mocker.patch.object(
-            instance, "cleanup", new_callable=mocker.AsyncMock
-        )
+        mock_cleanup = AsyncMock()
+        instance.cleanup = mock_cleanup
         await instance.run_async(poll_interval_minutes=1)
         # Should log error and return immediately, skipping the cleanup finally block
         instance.logger.error.assert_called_once_with("Telegram client not available")
         mock_cleanup.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_trackers_telegramtracker_run_async_keyboardinterrupt(
-        self, mocker, telegram_config, telegram_chats
-    ):
-        mocker.patch("trackers.telegram.TelegramClient")
-        instance = TelegramTracker(
-            lambda x, y=None: None, telegram_config, telegram_chats
-        )
-        instance._is_connected = False
-        instance.client = mocker.MagicMock()
-        instance.logger = mocker.MagicMock()
-        # Mock dependencies
-        mocker.patch.object(
-            instance, "_ensure_connected", new_callable=mocker.AsyncMock
-        )
-        mocker.patch.object(instance, "log_action_async", new_callable=mocker.AsyncMock)
-        # Mock check_mentions_async to raise KeyboardInterrupt immediately
-        mocker.patch.object(
-            instance,
-            "check_mentions_async",
-            new_callable=mocker.AsyncMock,
-            side_effect=KeyboardInterrupt(),
-        )
-        mock_cleanup = mocker.patch.object(
-            instance, "cleanup", new_callable=mocker.AsyncMock
-        )
-        # run_async catches KeyboardInterrupt and logs it
-        await instance.run_async(poll_interval_minutes=1)
-        # Assert the KeyboardInterrupt was caught and logged
-        instance.logger.info.assert_any_call("Telegram tracker stopped by user")
-        # Assert cleanup was called in the finally block
-        mock_cleanup.assert_called_once()
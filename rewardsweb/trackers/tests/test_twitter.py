@@ -1,23 +1,68 @@
 """Testing module for :py:mod:`trackers.twitter` module."""
 
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
 import pytest
+import tweepy
 
 from trackers.base import BaseMentionTracker
-from trackers.twitter import TwitterTracker
+from trackers.twitter import (
+    ORIGINAL_TWEETS_CACHE_TTL,
+    TWEET_FIELDS_MENTIONS,
+    TWEET_FIELDS_ORIGINAL,
+    TwitterTracker,
+)
+
+CREATED_AT = datetime(2023, 1, 1, 12, 0, 0)
+CREATED_AT_TIMESTAMP = 1672574400
+ORIGINAL_URL = "https://twitter.com/i/web/status/original_123"
+ORIGINAL_TWEET_URL = "https://twitter.com/i/web/status/original_tweet_123"
+TWEET_URL = "https://twitter.com/i/web/status/tweet123"
+
+
+def _make_reply(replied_to_id, **kwargs):
+    """Return lightweight stand-in for a tweet replying to given tweet."""
+    return SimpleNamespace(
+        referenced_tweets=[SimpleNamespace(type="replied_to", id=replied_to_id)],
+        **kwargs,
+    )
+
+
+def _make_response(data=None, includes=None, **kwargs):
+    """Return lightweight stand-in for a Twitter API response."""
+    return SimpleNamespace(data=data, includes=includes or {}, **kwargs)
+
+
+def _make_rate_limit_error(headers):
+    """Return rate limit error raised for a response with provided headers."""
+    response = SimpleNamespace(
+        status_code=429, reason="Too Many Requests", headers=headers, json=dict
+    )
+    return tweepy.errors.TooManyRequests(response)
 
 
-@pytest.mark.django_db
 class TestTrackersTwitter:
     """Testing class for :class:`trackers.twitter.TwitterTracker`."""
 
     def test_trackers_twitter_twittertracker_is_subclass_of_basementiontracker(self):
         assert issubclass(TwitterTracker, BaseMentionTracker)
 
+    def test_trackers_twitter_tweet_fields_constants(self):
+        assert TWEET_FIELDS_MENTIONS == [
+            "created_at",
+            "conversation_id",
+            "author_id",
+            "text",
+            "referenced_tweets",
+        ]
+        assert TWEET_FIELDS_ORIGINAL == ["created_at", "author_id", "text"]
+
     # __init__
     def test_trackers_twittertracker_init_success(self, mocker, twitter_config):
         mock_client = mocker.patch("tweepy.Client")
+        mock_log_action = mocker.patch.object(TwitterTracker, "log_action")
         instance = TwitterTracker(lambda x: None, twitter_config)
         mock_client.assert_called_once_with(
             bearer_token="test_bearer_token",
@@ -27,105 +72,194 @@ class TestTrackersTwitter:
             access_token_secret="test_access_token_secret",
         )
         assert instance.target_user_id == twitter_config["target_user_id"]
+        mock_log_action.assert_called_once_with(
+            "initialized", "Tracking mentions for user ID: test_user_id"
+        )
+        assert instance._original_tweets_cache == {}
+        assert instance._since_id is None
+        assert instance._rate_limit_delay == 0
+        assert instance._rate_limit_attempts == 0
+
+    # _rate_limit_delay_seconds
+    def test_trackers_twittertracker_rate_limit_delay_seconds_uses_reset_header(
+        self, mocker, twitter_tracker
+    ):
+        mocker.patch("trackers.twitter.time.time", return_value=1000.0)
+        error = _make_rate_limit_error({"x-rate-limit-reset": "1450"})
+        assert twitter_tracker._rate_limit_delay_seconds(error) == 450
+
+    def test_trackers_twittertracker_rate_limit_delay_seconds_for_passed_reset(
+        self, mocker, twitter_tracker
+    ):
+        mocker.patch("trackers.twitter.time.time", return_value=2000.0)
+        error = _make_rate_limit_error({"x-rate-limit-reset": "1450"})
+        assert twitter_tracker._rate_limit_delay_seconds(error) == 0
+
+    @pytest.mark.parametrize(
+        "attempts,expected",
+        [(0, 60.25), (1, 120.25), (2, 240.25), (5, 240.25)],
+    )
+    def test_trackers_twittertracker_rate_limit_delay_seconds_backs_off(
+        self, attempts, expected, mocker, twitter_tracker
+    ):
+        mocker.patch("trackers.twitter.random.uniform", return_value=0.25)
+        twitter_tracker._rate_limit_attempts = attempts
+        error = _make_rate_limit_error({})
+        assert twitter_tracker._rate_limit_delay_seconds(error) == expected
+
+    # _user_map
+    @pytest.mark.parametrize(
+        "includes,result",
+        [
+            (None, {}),
+            ({}, {}),
+            (
+                {
+                    "users": [
+                        SimpleNamespace(id="user1", username="first_user"),
+                        SimpleNamespace(id="user2", username="second_user"),
+                    ]
+                },
+                {"user1": "first_user", "user2": "second_user"},
+            ),
+        ],
+    )
+    def test_trackers_twittertracker_user_map_functionality(
+        self, includes, result, twitter_tracker
+    ):
+        assert twitter_tracker._user_map(includes) == result
+
+    # _get_cached_original_tweet_info
+    def test_trackers_twittertracker_get_cached_original_tweet_info_miss(
+        self, twitter_tracker
+    ):
+        assert twitter_tracker._get_cached_original_tweet_info("ref_tweet_1") is None
+
+    def test_trackers_twittertracker_get_cached_original_tweet_info_hit(
+        self, twitter_tracker
+    ):
+        instance = twitter_tracker
+        instance._cache_original_tweet_info("ref_tweet_1", ("url1", "user1", "text1"))
+        instance._cache_original_tweet_info("ref_tweet_2", ("url2", "user2", "text2"))
+        result = instance._get_cached_original_tweet_info("ref_tweet_1")
+        assert result == ("url1", "user1", "text1")
+        assert list(instance._original_tweets_cache) == ["ref_tweet_2", "ref_tweet_1"]
+
+    def test_trackers_twittertracker_get_cached_original_tweet_info_expired(
+        self, mocker, twitter_tracker
+    ):
+        instance = twitter_tracker
+        mock_monotonic = mocker.patch("trackers.twitter.time.monotonic")
+        mock_monotonic.return_value = 1000.0
+        instance._cache_original_tweet_info("ref_tweet_1", ("url1", "user1", "text1"))
+        mock_monotonic.return_value = 1000.0 + ORIGINAL_TWEETS_CACHE_TTL
+        result = instance._get_cached_original_tweet_info("ref_tweet_1")
+        assert result == ("url1", "user1", "text1")
+        mock_monotonic.return_value = 1001.0 + ORIGINAL_TWEETS_CACHE_TTL
+        assert instance._get_cached_original_tweet_info("ref_tweet_1") is None
+        assert instance._original_tweets_cache == {}
+
+    # _cache_original_tweet_info
+    def test_trackers_twittertracker_cache_original_tweet_info_evicts_oldest(
+        self, mocker, twitter_tracker
+    ):
+        instance = twitter_tracker
+        mocker.patch("trackers.twitter.ORIGINAL_TWEETS_CACHE_SIZE", 2)
+        instance._cache_original_tweet_info("ref_tweet_1", ("url1", "user1", "text1"))
+        instance._cache_original_tweet_info("ref_tweet_2", ("url2", "user2", "text2"))
+        instance._get_cached_original_tweet_info("ref_tweet_1")
+        instance._cache_original_tweet_info("ref_tweet_3", ("url3", "user3", "text3"))
+        assert list(instance._original_tweets_cache) == ["ref_tweet_1", "ref_tweet_3"]
 
     # _get_original_tweet_info
-    def test_trackers_twittertracker_get_original_tweet_info_success(
-        self, mocker, twitter_config
+    @pytest.mark.parametrize(
+        "tweet_data,users,expected",
+        [
+            (
+                {
+                    "id": "original_tweet_123",
+                    "author_id": "original_user_id",
+                    "text": "This is the original tweet.",
+                },
+                [{"id": "original_user_id", "username": "original_user"}],
+                (
+                    ORIGINAL_TWEET_URL,
+                    "original_user",
+                    "This is the original tweet.",
+                ),
+            ),
+            (None, None, ("", "", "")),
+            (
+                {
+                    "id": "original_tweet_123",
+                    "author_id": "original_user_id",
+                    "text": "Original tweet text.",
+                },
+                None,
+                (
+                    ORIGINAL_TWEET_URL,
+                    "",
+                    "Original tweet text.",
+                ),
+            ),
+            (
+                {
+                    "id": "original_tweet_123",
+                    "author_id": "different_user_id",
+                    "text": "Another tweet.",
+                },
+                [{"id": "some_other_user_id", "username": "other_user"}],
+                (
+                    ORIGINAL_TWEET_URL,
+                    "",
+                    "Another tweet.",
+                ),
+            ),
+        ],
+    )
+    def test_trackers_twittertracker_get_original_tweet_info_functionality(
+        self, tweet_data, users, expected, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet_data = mocker.MagicMock()
-        mock_tweet_data.id = "original_tweet_123"
-        mock_tweet_data.author_id = "original_user_id"
-        mock_tweet_data.text = "This is the original tweet."
-        mock_user = mocker.MagicMock()
-        mock_user.id = "original_user_id"
-        mock_user.username = "original_user"
-        mock_includes = {"users": [mock_user]}
-        mock_response = mocker.MagicMock()
-        mock_response.data = mock_tweet_data
-        mock_response.includes = mock_includes
-        instance.client.get_tweet.return_value = mock_response
-        contribution_url, contributor, contribution = instance._get_original_tweet_info(
-            "ref_tweet_123"
+        instance = twitter_tracker
+        mock_response = _make_response(
+            SimpleNamespace(**tweet_data) if tweet_data else None,
+            {"users": [SimpleNamespace(**user) for user in users]} if users else None,
         )
-        assert contribution_url == "https://twitter.com/i/web/status/original_tweet_123"
-        assert contributor == "original_user"
-        assert contribution == "This is the original tweet."
+        instance.client.get_tweet.return_value = mock_response
+        result = instance._get_original_tweet_info("ref_tweet_123")
+        assert result == expected
         instance.client.get_tweet.assert_called_once_with(
             "ref_tweet_123",
-            tweet_fields=["created_at", "author_id", "text"],
+            tweet_fields=TWEET_FIELDS_ORIGINAL,
             expansions=["author_id"],
         )
 
-    def test_trackers_twittertracker_get_original_tweet_info_no_data(
-        self, mocker, twitter_config
+    def test_trackers_twittertracker_get_original_tweet_info_cached(
+        self, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_response = mocker.MagicMock()
-        mock_response.data = None
-        instance.client.get_tweet.return_value = mock_response
-        contribution_url, contributor, contribution = instance._get_original_tweet_info(
-            "ref_tweet_123"
+        instance = twitter_tracker
+        original_tweet = SimpleNamespace(
+            id="original_tweet_123", author_id="user1", text="Original."
         )
-        assert contribution_url == ""
-        assert contributor == ""
-        assert contribution == ""
+        instance.client.get_tweet.return_value = _make_response(original_tweet)
+        first = instance._get_original_tweet_info("ref_tweet_123")
+        assert instance._get_original_tweet_info("ref_tweet_123") == first
+        assert instance.client.get_tweet.call_count == 1
 
-    def test_trackers_twittertracker_get_original_tweet_info_no_users(
-        self, mocker, twitter_config
+    def test_trackers_twittertracker_get_original_tweet_info_no_data_not_cached(
+        self, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet_data = mocker.MagicMock()
-        mock_tweet_data.id = "original_tweet_123"
-        mock_tweet_data.author_id = "original_user_id"
-        mock_tweet_data.text = "Original tweet text."
-        mock_response = mocker.MagicMock()
-        mock_response.data = mock_tweet_data
-        mock_response.includes = {}
-        instance.client.get_tweet.return_value = mock_response
-        (
-            contribution_url,
-            contributor,
-            contribution,
-        ) = instance._get_original_tweet_info("ref_tweet_123")
-        assert contribution_url == "https://twitter.com/i/web/status/original_tweet_123"
-        assert contributor == ""
-        assert contribution == "Original tweet text."
-
-    def test_trackers_twittertracker_get_original_tweet_info_user_not_found(
-        self, mocker, twitter_config
-    ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet_data = mocker.MagicMock()
-        mock_tweet_data.id = "original_tweet_123"
-        mock_tweet_data.author_id = "different_user_id"  # Different from included user
-        mock_tweet_data.text = "Another tweet."
-        mock_user = mocker.MagicMock()
-        mock_user.id = "some_other_user_id"
-        mock_user.username = "other_user"
-        mock_includes = {"users": [mock_user]}
-        mock_response = mocker.MagicMock()
-        mock_response.data = mock_tweet_data
-        mock_response.includes = mock_includes
-        instance.client.get_tweet.return_value = mock_response
-        (
-            contribution_url,
-            contributor,
-            contribution,
-        ) = instance._get_original_tweet_info("ref_tweet_123")
-        assert contribution_url == "https://twitter.com/i/web/status/original_tweet_123"
-        assert contributor == ""  # Author not found in users
-        assert contribution == "Another tweet."
+        instance = twitter_tracker
+        instance.client.get_tweet.return_value = _make_response()
+        instance._get_original_tweet_info("ref_tweet_123")
+        instance._get_original_tweet_info("ref_tweet_123")
+        assert instance.client.get_tweet.call_count == 2
+        assert instance._original_tweets_cache == {}
 
     def test_trackers_twittertracker_get_original_tweet_info_exception(
-        self, mocker, twitter_config
+        self, mocker, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
+        instance = twitter_tracker
         instance.logger = mocker.MagicMock()
         instance.client.get_tweet.side_effect = Exception("API error")
         (
@@ -140,22 +274,107 @@ class TestTrackersTwitter:
             "Failed to get original tweet ref_tweet_123: API error"
         )
 
+    # _get_original_tweets_info
+    def test_trackers_twittertracker_get_original_tweets_info_no_replies(
+        self, twitter_tracker
+    ):
+        instance = twitter_tracker
+        tweets = [
+            SimpleNamespace(referenced_tweets=None),
+            SimpleNamespace(
+                referenced_tweets=[SimpleNamespace(type="quoted", id="ref_tweet_1")]
+            ),
+        ]
+        assert instance._get_original_tweets_info(tweets) == {}
+        instance.client.get_tweets.assert_not_called()
+
+    def test_trackers_twittertracker_get_original_tweets_info_functionality(
+        self, twitter_tracker
+    ):
+        instance = twitter_tracker
+        tweets = [
+            _make_reply(ref_id)
+            for ref_id in ("ref_tweet_1", "ref_tweet_2", "ref_tweet_1")
+        ]
+        instance.client.get_tweets.return_value = _make_response(
+            data=[
+                SimpleNamespace(id="ref_tweet_1", author_id="user1", text="First."),
+                SimpleNamespace(id="ref_tweet_2", author_id="user2", text=None),
+            ],
+            includes={"users": [SimpleNamespace(id="user1", username="first_user")]},
+        )
+        result = instance._get_original_tweets_info(tweets)
+        assert result == {
+            "ref_tweet_1": (
+                "https://twitter.com/i/web/status/ref_tweet_1",
+                "first_user",
+                "First.",
+            ),
+            "ref_tweet_2": ("https://twitter.com/i/web/status/ref_tweet_2", "", ""),
+        }
+        instance.client.get_tweets.assert_called_once_with(
+            ids=["ref_tweet_1", "ref_tweet_2"],
+            tweet_fields=TWEET_FIELDS_ORIGINAL,
+            expansions=["author_id"],
+        )
+
+    def test_trackers_twittertracker_get_original_tweets_info_in_batches(
+        self, twitter_tracker
+    ):
+        instance = twitter_tracker
+        ref_ids = [f"ref_tweet_{index}" for index in range(150)]
+        tweets = [_make_reply(ref_id) for ref_id in ref_ids]
+        instance.client.get_tweets.return_value = _make_response()
+        assert instance._get_original_tweets_info(tweets) == {}
+        assert [
+            call.kwargs["ids"] for call in instance.client.get_tweets.call_args_list
+        ] == [ref_ids[:100], ref_ids[100:]]
+
+    def test_trackers_twittertracker_get_original_tweets_info_uses_cache(
+        self, twitter_tracker
+    ):
+        instance = twitter_tracker
+        instance._cache_original_tweet_info("ref_tweet_1", ("url1", "user1", "text1"))
+        tweets = [_make_reply(ref_id) for ref_id in ("ref_tweet_1", "ref_tweet_2")]
+        instance.client.get_tweets.return_value = _make_response(
+            [SimpleNamespace(id="ref_tweet_2", author_id="user2", text="Second.")]
+        )
+        result = instance._get_original_tweets_info(tweets)
+        assert result == {
+            "ref_tweet_1": ("url1", "user1", "text1"),
+            "ref_tweet_2": (
+                "https://twitter.com/i/web/status/ref_tweet_2",
+                "",
+                "Second.",
+            ),
+        }
+        assert instance.client.get_tweets.call_args.kwargs["ids"] == ["ref_tweet_2"]
+        _, cached_info = instance._original_tweets_cache["ref_tweet_2"]
+        assert cached_info == result["ref_tweet_2"]
+
+    def test_trackers_twittertracker_get_original_tweets_info_exception(
+        self, mocker, twitter_tracker
+    ):
+        instance = twitter_tracker
+        instance.logger = mocker.MagicMock()
+        tweets = [_make_reply("ref_tweet_1")]
+        instance.client.get_tweets.side_effect = Exception("API error")
+        assert instance._get_original_tweets_info(tweets) is None
+        instance.logger.warning.assert_called_once_with(
+            "Failed to get original tweets: API error"
+        )
+
     # _extract_reply_mention_data
     def test_trackers_twittertracker_extract_reply_mention_data_with_reply(
-        self, mocker, twitter_config
+        self, mocker, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_ref_tweet = mocker.MagicMock()
-        mock_ref_tweet.type = "replied_to"
-        mock_ref_tweet.id = "ref_tweet_123"
-        mock_tweet.referenced_tweets = [mock_ref_tweet]
+        instance = twitter_tracker
+        mock_tweet = _make_reply("ref_tweet_123")
         mock_get_original_info = mocker.patch.object(
             instance, "_get_original_tweet_info"
         )
         mock_get_original_info.return_value = (
-            "https://twitter.com/i/web/status/original_123",
+            ORIGINAL_URL,
             "original_user",
             "Original tweet text.",
         )
@@ -165,18 +384,41 @@ class TestTrackersTwitter:
             contributor,
             contribution,
         ) = instance._extract_reply_mention_data(mock_tweet, user_map)
-        assert contribution_url == "https://twitter.com/i/web/status/original_123"
+        assert contribution_url == ORIGINAL_URL
         assert contributor == "original_user"
         assert contribution == "Original tweet text."
         mock_get_original_info.assert_called_once_with("ref_tweet_123")
 
+    def test_trackers_twittertracker_extract_reply_mention_data_fetched_originals(
+        self, mocker, twitter_tracker
+    ):
+        instance = twitter_tracker
+        mock_get_original_info = mocker.patch.object(
+            instance, "_get_original_tweet_info"
+        )
+        original_tweets = {
+            "ref_tweet_123": (
+                "https://twitter.com/i/web/status/ref_tweet_123",
+                "original_user",
+                "Original tweet text.",
+            )
+        }
+        mock_tweet = _make_reply("ref_tweet_123")
+        assert (
+            instance._extract_reply_mention_data(mock_tweet, {}, original_tweets)
+            == original_tweets["ref_tweet_123"]
+        )
+        mock_tweet = _make_reply("deleted")
+        assert instance._extract_reply_mention_data(
+            mock_tweet, {}, original_tweets
+        ) == ("", "", "")
+        mock_get_original_info.assert_not_called()
+
     def test_trackers_twittertracker_extract_reply_mention_data_no_referenced_tweets(
-        self, mocker, twitter_config
+        self, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.referenced_tweets = None
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(referenced_tweets=None)
         user_map = {"user123": "test_user"}
         (
             contribution_url,
@@ -188,15 +430,12 @@ class TestTrackersTwitter:
         assert contribution == ""
 
     def test_trackers_twittertracker_extract_reply_mention_data_no_reply_type(
-        self, mocker, twitter_config
+        self, mocker, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_ref_tweet = mocker.MagicMock()
-        mock_ref_tweet.type = "quoted"  # Not a reply
-        mock_ref_tweet.id = "ref_tweet_123"
-        mock_tweet.referenced_tweets = [mock_ref_tweet]
+        instance = twitter_tracker
+        # Not a reply
+        mock_ref_tweet = SimpleNamespace(type="quoted", id="ref_tweet_123")
+        mock_tweet = SimpleNamespace(referenced_tweets=[mock_ref_tweet])
         mock_get_original_info = mocker.patch.object(
             instance, "_get_original_tweet_info"
         )
@@ -212,115 +451,103 @@ class TestTrackersTwitter:
         mock_get_original_info.assert_not_called()
 
     # _get_content
-    def test_trackers_twittertracker_get_content_with_text(
-        self, mocker, twitter_config
-    ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.text = (
+    def test_trackers_twittertracker_get_content_with_text(self, twitter_tracker):
+        instance = twitter_tracker
+        text = (
             "This is a test tweet with some content that might be longer than 200 characters. "
             * 10
         )
+        mock_tweet = SimpleNamespace(text=text)
         result = instance._get_content(mock_tweet)
         assert result == mock_tweet.text
 
-    def test_trackers_twittertracker_get_content_no_text(self, mocker, twitter_config):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.text = None
+    def test_trackers_twittertracker_get_content_no_text(self, twitter_tracker):
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(text=None)
         result = instance._get_content(mock_tweet)
         assert result == ""
 
-    def test_trackers_twittertracker_get_content_empty_text(
-        self, mocker, twitter_config
-    ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.text = ""
+    def test_trackers_twittertracker_get_content_empty_text(self, twitter_tracker):
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(text="")
         result = instance._get_content(mock_tweet)
         assert result == ""
 
-    def test_trackers_twittertracker_get_content_no_text_attr(
-        self, mocker, twitter_config
-    ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-
-        # Create a simple mock without MagicMock's automatic attribute creation
-        class SimpleMock:
-            pass
-
-        mock_tweet = SimpleMock()
+    def test_trackers_twittertracker_get_content_no_text_attr(self, twitter_tracker):
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace()
         result = instance._get_content(mock_tweet)
         assert result == ""
 
     # _get_timestamp
     def test_trackers_twittertracker_get_timestamp_with_created_at(
-        self, mocker, twitter_config
+        self, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.created_at = datetime(2023, 1, 1, 12, 0, 0)
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(created_at=CREATED_AT)
         result = instance._get_timestamp(mock_tweet)
-        assert result == 1672574400
+        assert result == CREATED_AT_TIMESTAMP
 
-    def test_trackers_twittertracker_get_timestamp_no_created_at(
-        self, mocker, twitter_config
+    @pytest.mark.parametrize("tz", ["UTC", "America/Los_Angeles", "Asia/Tokyo"])
+    def test_trackers_twittertracker_get_timestamp_independent_of_local_timezone(
+        self, tz, monkeypatch, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.created_at = None
+        mock_tweet = SimpleNamespace(created_at=CREATED_AT)
+        monkeypatch.setenv("TZ", tz)
+        time.tzset()
+        try:
+            assert twitter_tracker._get_timestamp(mock_tweet) == CREATED_AT_TIMESTAMP
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_trackers_twittertracker_get_timestamp_aware_created_at(
+        self, twitter_tracker
+    ):
+        created_at = datetime(2023, 1, 1, 14, 0, 0, tzinfo=timezone(timedelta(hours=2)))
+        mock_tweet = SimpleNamespace(created_at=created_at)
+        assert twitter_tracker._get_timestamp(mock_tweet) == CREATED_AT_TIMESTAMP
+
+    def test_trackers_twittertracker_get_timestamp_no_created_at(self, twitter_tracker):
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(created_at=None)
         result = instance._get_timestamp(mock_tweet)
         assert isinstance(result, int)
         assert result > 1768496527
 
     def test_trackers_twittertracker_get_timestamp_no_created_at_attr(
-        self, mocker, twitter_config
+        self, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-
-        # Create a simple mock without MagicMock's automatic attribute creation
-        class SimpleMock:
-            pass
-
-        mock_tweet = SimpleMock()
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace()
         result = instance._get_timestamp(mock_tweet)
         assert isinstance(result, int)
         assert result > 1768496527
 
     # extract_mention_data
     def test_trackers_twittertracker_extract_mention_data_reply(
-        self, mocker, twitter_config
+        self, mocker, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.author_id = "user123"
-        mock_tweet.id = "tweet123"
-        mock_tweet.text = "Hello @test_bot!"
-        mock_tweet.created_at = datetime(2023, 1, 1, 12, 0, 0)
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(
+            author_id="user123",
+            id="tweet123",
+            text="Hello @test_bot!",
+            created_at=CREATED_AT,
+        )
         mock_extract_reply_data = mocker.patch.object(
             instance, "_extract_reply_mention_data"
         )
         mock_extract_reply_data.return_value = (
-            "https://twitter.com/i/web/status/original_123",
+            ORIGINAL_URL,
             "original_user",
             "This is the contribution.",
         )
         user_map = {"user123": "suggester_user"}
         result = instance.extract_mention_data(mock_tweet, user_map)
         assert result["suggester"] == "suggester_user"
-        assert result["suggestion_url"] == "https://twitter.com/i/web/status/tweet123"
-        assert (
-            result["contribution_url"]
-            == "https://twitter.com/i/web/status/original_123"
-        )
+        assert result["suggestion_url"] == TWEET_URL
+        assert result["contribution_url"] == ORIGINAL_URL
         assert result["contributor"] == "original_user"
         assert result["type"] == "tweet"
         assert result["content"] == "Hello @test_bot!"
@@ -328,15 +555,15 @@ class TestTrackersTwitter:
         assert result["item_id"] == "tweet123"
 
     def test_trackers_twittertracker_extract_mention_data_no_reply(
-        self, mocker, twitter_config
+        self, mocker, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.author_id = "user123"
-        mock_tweet.id = "tweet123"
-        mock_tweet.text = "Hello @test_bot!"
-        mock_tweet.created_at = datetime(2023, 1, 1, 12, 0, 0)
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(
+            author_id="user123",
+            id="tweet123",
+            text="Hello @test_bot!",
+            created_at=CREATED_AT,
+        )
         mock_extract_reply_data = mocker.patch.object(
             instance, "_extract_reply_mention_data"
         )
@@ -344,24 +571,24 @@ class TestTrackersTwitter:
         user_map = {"user123": "suggester_user"}
         result = instance.extract_mention_data(mock_tweet, user_map)
         assert result["suggester"] == "suggester_user"
-        assert result["contribution_url"] == "https://twitter.com/i/web/status/tweet123"
+        assert result["contribution_url"] == TWEET_URL
         assert result["contributor"] == "suggester_user"  # Falls back to suggester
 
     def test_trackers_twittertracker_extract_mention_data_no_contributor_in_reply(
-        self, mocker, twitter_config
+        self, mocker, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.author_id = "user123"
-        mock_tweet.id = "tweet123"
-        mock_tweet.text = "Hello @test_bot!"
-        mock_tweet.created_at = datetime(2023, 1, 1, 12, 0, 0)
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(
+            author_id="user123",
+            id="tweet123",
+            text="Hello @test_bot!",
+            created_at=CREATED_AT,
+        )
         mock_extract_reply_data = mocker.patch.object(
             instance, "_extract_reply_mention_data"
         )
         mock_extract_reply_data.return_value = (
-            "https://twitter.com/i/web/status/original_123",
+            ORIGINAL_URL,
             "",
             "Original tweet text.",
         )  # No contributor
@@ -371,15 +598,15 @@ class TestTrackersTwitter:
         assert result["contribution"] == "Original tweet text."
 
     def test_trackers_twittertracker_extract_mention_data_no_suggester_in_user_map(
-        self, mocker, twitter_config
+        self, mocker, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.author_id = "unknown_user"
-        mock_tweet.id = "tweet123"
-        mock_tweet.text = "Hello @test_bot!"
-        mock_tweet.created_at = datetime(2023, 1, 1, 12, 0, 0)
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(
+            author_id="unknown_user",
+            id="tweet123",
+            text="Hello @test_bot!",
+            created_at=CREATED_AT,
+        )
         mock_extract_reply_data = mocker.patch.object(
             instance, "_extract_reply_mention_data"
         )
@@ -390,15 +617,15 @@ class TestTrackersTwitter:
         assert result["contributor"] == ""  # Falls back to empty suggester
 
     def test_trackers_twittertracker_extract_mention_data_no_text(
-        self, mocker, twitter_config
+        self, mocker, twitter_tracker
     ):
-        mocker.patch("tweepy.Client")
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.author_id = "user123"
-        mock_tweet.id = "tweet123"
-        mock_tweet.text = None  # No text attribute
-        mock_tweet.created_at = None  # No created_at
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(
+            author_id="user123",
+            id="tweet123",
+            text=None,
+            created_at=None,
+        )
         mock_extract_reply_data = mocker.patch.object(
             instance, "_extract_reply_mention_data"
         )
@@ -410,24 +637,24 @@ class TestTrackersTwitter:
         assert result["suggester"] == "suggester_user"
         assert result["contribution"] == ""
 
+    # # poll_delay
+    @pytest.mark.parametrize(
+        "rate_limit_delay,expected", [(0, 900), (450, 900), (1200, 1200)]
+    )
+    def test_trackers_twittertracker_poll_delay(
+        self, rate_limit_delay, expected, twitter_tracker
+    ):
+        twitter_tracker._rate_limit_delay = rate_limit_delay
+        assert twitter_tracker.poll_delay(15) == expected
+
     # # run
     def test_trackers_twittertracker_run_wrapper_calls_base_run(
-        self, mocker, twitter_config
+        self, mocker, twitter_tracker
     ):
-        mock_client = mocker.patch("tweepy.Client")
-        mock_user = mocker.MagicMock()
-        mock_user_data = mocker.MagicMock()
-        mock_user_data.id = "12345"
-        mock_user.data = mock_user_data
-        mock_client.return_value.get_me.return_value = mock_user
         # Patch BaseMentionTracker.run so no real loop runs
         mocked_base_run = mocker.patch("trackers.twitter.BaseMentionTracker.run")
-        # Create instance (MessageParser.parse mocked out)
-        tracker = TwitterTracker(
-            parse_message_callback=lambda x: x, config=twitter_config
-        )
         # Call the wrapper
-        tracker.run(poll_interval_minutes=10, max_iterations=5)
+        twitter_tracker.run(poll_interval_minutes=10, max_iterations=5)
         # Ensure BaseMentionTracker.run was called once with correct args
         mocked_base_run.assert_called_once_with(
             poll_interval_minutes=10,
@@ -435,93 +662,223 @@ class TestTrackersTwitter:
         )
 
     # check_mentions
-    def test_trackers_twittertracker_check_mentions_found(self, mocker, twitter_config):
-        mock_client = mocker.patch("tweepy.Client")
-        mock_user = mocker.MagicMock()
-        mock_user_data = mocker.MagicMock()
-        mock_user_data.id = "12345"
-        mock_user.data = mock_user_data
-        mock_client.return_value.get_me.return_value = mock_user
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.id = "tweet123"
-        mock_user_obj = mocker.MagicMock()
-        mock_user_obj.id = "user123"
-        mock_user_obj.username = "test_user"
-        mock_response = mocker.MagicMock()
-        mock_response.data = [mock_tweet]
-        mock_response.includes = {"users": [mock_user_obj]}
-        instance.client.get_users_mentions.return_value = mock_response
-        mock_process_mention = mocker.patch.object(instance, "process_mention")
-        mock_process_mention.return_value = True
-        mock_is_processed = mocker.patch.object(instance, "is_processed")
-        mock_is_processed.return_value = False
-        result = instance.check_mentions()
-        assert result == 1
+    @pytest.mark.parametrize(
+        "includes,already_processed,processed,result",
+        [
+            (
+                {"users": [SimpleNamespace(id="user123", username="test_user")]},
+                False,
+                True,
+                1,
+            ),
+            ({}, False, True, 1),  # No users in includes
+            ({"users": []}, True, True, 0),  # Already processed
+            ({"users": []}, False, False, 0),  # process_mention fails
+        ],
+    )
+    def test_trackers_twittertracker_check_mentions_functionality(
+        self, includes, already_processed, processed, result, mocker, twitter_tracker
+    ):
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(
+            id="tweet123", author_id="user123", referenced_tweets=None
+        )
+        instance.client.get_users_mentions.return_value = _make_response(
+            data=[mock_tweet], includes=includes, meta={"newest_id": "tweet123"}
+        )
+        mock_processed_ids = mocker.patch.object(
+            instance,
+            "already_processed_ids",
+            return_value=frozenset({"tweet123"} if already_processed else ()),
+        )
+        mock_process_mention = mocker.patch.object(
+            instance, "process_mention", return_value=processed
+        )
+        assert instance.check_mentions() == result
         instance.client.get_users_mentions.assert_called_once_with(
-            twitter_config["target_user_id"],
-            tweet_fields=[
-                "created_at",
-                "conversation_id",
-                "author_id",
-                "text",
-                "referenced_tweets",
-            ],
+            "test_user_id",
+            since_id=None,
+            tweet_fields=TWEET_FIELDS_MENTIONS,
             expansions=["author_id"],
             max_results=20,
         )
-        mock_process_mention.assert_called_once()
+        mock_processed_ids.assert_called_once_with(["tweet123"])
+        assert mock_process_mention.call_count == (0 if already_processed else 1)
+        instance.client.get_tweets.assert_not_called()
+        assert instance._since_id == "tweet123"
 
-    def test_trackers_twittertracker_check_mentions_no_data(
-        self, mocker, twitter_config
+    def test_trackers_twittertracker_check_mentions_uses_since_id_after_first_call(
+        self, mocker, twitter_tracker
     ):
-        mock_client = mocker.patch("tweepy.Client")
-        mock_user = mocker.MagicMock()
-        mock_user_data = mocker.MagicMock()
-        mock_user_data.id = "12345"
-        mock_user.data = mock_user_data
-        mock_client.return_value.get_me.return_value = mock_user
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_response = mocker.MagicMock()
-        mock_response.data = None
-        instance.client.get_users_mentions.return_value = mock_response
-        result = instance.check_mentions()
-        assert result == 0
+        instance = twitter_tracker
+        mock_tweet = SimpleNamespace(
+            id="tweet123", author_id="user123", referenced_tweets=None
+        )
+        instance.client.get_users_mentions.side_effect = [
+            _make_response([mock_tweet], meta={"newest_id": "tweet123"}),
+            _make_response(meta={"result_count": 0}),
+        ]
+        mocker.patch.object(instance, "already_processed_ids", return_value=frozenset())
+        mocker.patch.object(instance, "process_mention", return_value=True)
+        assert instance.check_mentions() == 1
+        assert instance.check_mentions() == 0
+        first_call, second_call = instance.client.get_users_mentions.call_args_list
+        assert first_call.kwargs["since_id"] is None
+        assert second_call.kwargs["since_id"] == "tweet123"
+        assert instance._since_id == "tweet123"
+
+    def test_trackers_twittertracker_check_mentions_retries_failed_mention(
+        self, mocker, twitter_tracker
+    ):
+        instance = twitter_tracker
+        failing = SimpleNamespace(id=101, author_id="user1", referenced_tweets=None)
+        succeeding = SimpleNamespace(id=102, author_id="user1", referenced_tweets=None)
+        instance.client.get_users_mentions.side_effect = [
+            _make_response([succeeding, failing], meta={"newest_id": "102"}),
+            _make_response([failing], meta={"newest_id": "101"}),
+        ]
+        mocker.patch.object(instance, "already_processed_ids", return_value=frozenset())
+        mocker.patch.object(
+            instance,
+            "extract_mention_data",
+            return_value={"contributor": "user1", "content": "@user1 suggestion"},
+        )
+        mock_process_mention = mocker.patch.object(
+            instance, "process_mention", side_effect=[True, False, True]
+        )
+        assert instance.check_mentions() == 1
+        assert instance._since_id == "100"
+        assert instance.check_mentions() == 1
+        second_call = instance.client.get_users_mentions.call_args_list[1]
+        assert second_call.kwargs["since_id"] == "100"
+        assert [call.args[0] for call in mock_process_mention.call_args_list] == [
+            102,
+            101,
+            101,
+        ]
+        assert instance._since_id == "101"
+
+    def test_trackers_twittertracker_check_mentions_skipped_mention_not_retried(
+        self, mocker, twitter_tracker
+    ):
+        instance = twitter_tracker
+        tweet = SimpleNamespace(id=101, author_id="user1", referenced_tweets=None)
+        instance.client.get_users_mentions.return_value = _make_response(
+            [tweet], meta={"newest_id": "101"}
+        )
+        mocker.patch.object(instance, "already_processed_ids", return_value=frozenset())
+        mocker.patch.object(
+            instance,
+            "extract_mention_data",
+            return_value={"contributor": "user1", "content": "unrelated"},
+        )
+        mocker.patch.object(instance, "process_mention", return_value=False)
+        assert instance.check_mentions() == 0
+        assert instance._since_id == "101"
 
-    def test_trackers_twittertracker_check_mentions_no_users_in_includes(
-        self, mocker, twitter_config
+    def test_trackers_twittertracker_check_mentions_seeds_since_id_from_database(
+        self, mocker, twitter_tracker
     ):
-        mock_client = mocker.patch("tweepy.Client")
-        mock_user = mocker.MagicMock()
-        mock_user_data = mocker.MagicMock()
-        mock_user_data.id = "12345"
-        mock_user.data = mock_user_data
-        mock_client.return_value.get_me.return_value = mock_user
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.id = "tweet123"
-        mock_response = mocker.MagicMock()
-        mock_response.data = [mock_tweet]
-        mock_response.includes = {}  # No users in includes
+        instance = twitter_tracker
+        mock_last_id = mocker.patch(
+            "trackers.models.Mention.objects.last_processed_item_id",
+            return_value="tweet100",
+        )
+        instance.client.get_users_mentions.return_value = _make_response(
+            meta={"result_count": 0}
+        )
+        assert instance.check_mentions() == 0
+        assert instance.check_mentions() == 0
+        mock_last_id.assert_called_once_with("twitter")
+        assert all(
+            call.kwargs["since_id"] == "tweet100"
+            for call in instance.client.get_users_mentions.call_args_list
+        )
+        assert instance._since_id == "tweet100"
+
+    def test_trackers_twittertracker_check_mentions_fetches_replied_tweets_once(
+        self, mocker, twitter_tracker
+    ):
+        instance = twitter_tracker
+        tweets = [
+            _make_reply(ref_id, id=tweet_id, author_id="user123")
+            for tweet_id, ref_id in (
+                ("tweet1", "ref_tweet_1"),
+                ("tweet2", "ref_tweet_2"),
+            )
+        ]
+        instance.client.get_users_mentions.return_value = _make_response(
+            data=tweets,
+            includes={"users": [SimpleNamespace(id="user123", username="suggester")]},
+            meta={"newest_id": "tweet2"},
+        )
+        instance.client.get_tweets.return_value = _make_response(
+            data=[
+                SimpleNamespace(id="ref_tweet_1", author_id="user1", text="First."),
+                SimpleNamespace(id="ref_tweet_2", author_id="user2", text="Second."),
+            ],
+            includes={
+                "users": [
+                    SimpleNamespace(id="user1", username="first_user"),
+                    SimpleNamespace(id="user2", username="second_user"),
+                ]
+            },
+        )
+        mocker.patch.object(instance, "already_processed_ids", return_value=frozenset())
+        mock_process_mention = mocker.patch.object(
+            instance, "process_mention", return_value=True
+        )
+        assert instance.check_mentions() == 2
+        instance.client.get_tweets.assert_called_once()
+        instance.client.get_tweet.assert_not_called()
+        assert [call.args[2] for call in mock_process_mention.call_args_list] == [
+            "@first_user",
+            "@second_user",
+        ]
+        assert (
+            mock_process_mention.call_args_list[1].args[1]["contribution"] == "Second."
+        )
+
+    def test_trackers_twittertracker_check_mentions_rate_limited(
+        self, mocker, twitter_tracker
+    ):
+        instance = twitter_tracker
+        error = _make_rate_limit_error({})
+        instance.client.get_users_mentions.side_effect = error
+        mocker.patch.object(instance, "_rate_limit_delay_seconds", return_value=450)
+        mock_logger_warning = mocker.patch.object(instance.logger, "warning")
+        assert instance.check_mentions() == 0
+        assert instance._rate_limit_delay == 450
+        assert instance._rate_limit_attempts == 1
+        mock_logger_warning.assert_called_once_with(
+            "Twitter rate limit reached, next poll in at least 450 seconds"
+        )
+        instance.log_action.assert_called_with(
+            "twitter_rate_limited", f"Error: {str(error)}"
+        )
+
+    def test_trackers_twittertracker_check_mentions_resets_rate_limit_delay(
+        self, twitter_tracker
+    ):
+        instance = twitter_tracker
+        instance._rate_limit_delay, instance._rate_limit_attempts = 450, 2
+        instance.client.get_users_mentions.return_value = _make_response()
+        assert instance.check_mentions() == 0
+        assert instance._rate_limit_delay == 0
+        assert instance._rate_limit_attempts == 0
+
+    def test_trackers_twittertracker_check_mentions_no_data(self, twitter_tracker):
+        instance = twitter_tracker
+        mock_response = _make_response()
         instance.client.get_users_mentions.return_value = mock_response
-        mock_is_processed = mocker.patch.object(instance, "is_processed")
-        mock_is_processed.return_value = False
-        mock_process_mention = mocker.patch.object(instance, "process_mention")
-        mock_process_mention.return_value = True
         result = instance.check_mentions()
-        assert result == 1
-        # Should still process even without user map
+        assert result == 0
+        assert instance._since_id is None
 
     def test_trackers_twittertracker_check_mentions_exception(
-        self, mocker, twitter_config
+        self, mocker, twitter_tracker
     ):
-        mock_client = mocker.patch("tweepy.Client")
-        mock_user = mocker.MagicMock()
-        mock_user_data = mocker.MagicMock()
-        mock_user_data.id = "12345"
-        mock_user.data = mock_user_data
-        mock_client.return_value.get_me.return_value = mock_user
-        instance = TwitterTracker(lambda x: None, twitter_config)
+        instance = twitter_tracker
         instance.client.get_users_mentions.side_effect = Exception("API error")
         mock_log_action = mocker.patch.object(instance, "log_action")
         mock_logger_error = mocker.patch.object(instance.logger, "error")
@@ -531,68 +888,12 @@ class TestTrackersTwitter:
             "Error checking Twitter mentions: API error"
         )
         mock_log_action.assert_called_with("twitter_check_error", "Error: API error")
-
-    def test_trackers_twittertracker_check_mentions_already_processed(
-        self, mocker, twitter_config
-    ):
-        mock_client = mocker.patch("tweepy.Client")
-        mock_user = mocker.MagicMock()
-        mock_user_data = mocker.MagicMock()
-        mock_user_data.id = "12345"
-        mock_user.data = mock_user_data
-        mock_client.return_value.get_me.return_value = mock_user
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.id = "tweet123"
-        mock_response = mocker.MagicMock()
-        mock_response.data = [mock_tweet]
-        mock_response.includes = {"users": []}
-        instance.client.get_users_mentions.return_value = mock_response
-        mock_is_processed = mocker.patch.object(instance, "is_processed")
-        mock_is_processed.return_value = True
-        mock_process_mention = mocker.patch.object(instance, "process_mention")
-        result = instance.check_mentions()
-        assert result == 0
-        mock_is_processed.assert_called_with("tweet123")
-        mock_process_mention.assert_not_called()
-
-    def test_trackers_twittertracker_check_mentions_process_mention_false(
-        self, mocker, twitter_config
-    ):
-        mock_client = mocker.patch("tweepy.Client")
-        mock_user = mocker.MagicMock()
-        mock_user_data = mocker.MagicMock()
-        mock_user_data.id = "12345"
-        mock_user.data = mock_user_data
-        mock_client.return_value.get_me.return_value = mock_user
-        instance = TwitterTracker(lambda x: None, twitter_config)
-        mock_tweet = mocker.MagicMock()
-        mock_tweet.id = "tweet123"
-        mock_response = mocker.MagicMock()
-        mock_response.data = [mock_tweet]
-        mock_response.includes = {"users": []}
-        instance.client.get_users_mentions.return_value = mock_response
-        mock_is_processed = mocker.patch.object(
-            instance, "is_processed", return_value=False
-        )
-        mock_process_mention = mocker.patch.object(
-            instance, "process_mention", new=mocker.MagicMock(return_value=False)
-        )
-        result = instance.check_mentions()
-        assert result == 0
-        mock_is_processed.assert_called_once()
-        mock_process_mention.assert_called_once()
+        assert instance._since_id is None
 
     def test_trackers_twittertracker_run_mentions_found_logging(
-        self, mocker, twitter_config
+        self, mocker, twitter_tracker
     ):
-        mock_client = mocker.patch("tweepy.Client")
-        mock_user = mocker.MagicMock()
-        mock_user_data = mocker.MagicMock()
-        mock_user_data.id = "12345"
-        mock_user.data = mock_user_data
-        mock_client.return_value.get_me.return_value = mock_user
-        instance = TwitterTracker(lambda x: None, twitter_config)
+        instance = twitter_tracker
         mocker.patch.object(
             instance, "check_mentions", new=mocker.MagicMock(return_value=5)
         )
@@ -1,10 +1,30 @@
 """Module containing class for tracking mentions on X/Twitter."""
 
-from datetime import datetime
+import calendar
+import operator
+import random
+import time
+from collections import OrderedDict
 
 import tweepy
 
 from trackers.base import BaseMentionTracker
+from trackers.models import Mention
+
+TWEET_FIELDS_MENTIONS = [
+    "created_at",
+    "conversation_id",
+    "author_id",
+    "text",
+    "referenced_tweets",
+]
+TWEET_FIELDS_ORIGINAL = ["created_at", "author_id", "text"]
+TWEETS_LOOKUP_LIMIT = 100
+ORIGINAL_TWEETS_CACHE_SIZE = 1024
+ORIGINAL_TWEETS_CACHE_TTL = 24 * 60 * 60
+RATE_LIMIT_BACKOFF_BASE = 60
+RATE_LIMIT_BACKOFF_MAX = 240
+USER_ID_AND_USERNAME = operator.attrgetter("id", "username")
 
 
 class TwitterTracker(BaseMentionTracker):
@@ -14,6 +34,18 @@ class TwitterTracker(BaseMentionTracker):
     :type TwitterTracker.client: :class:`tweepy.Client`
     :var TwitterTracker.target_user_id: Twitter user ID to track
     :type TwitterTracker.target_user_id: str`
+    :var TwitterTracker._original_tweets_cache: recently fetched original tweets
+                                              information and fetching time
+                                              by their IDs
+    :type TwitterTracker._original_tweets_cache: :class:`collections.OrderedDict`
+    :var TwitterTracker._since_id: ID of the newest mention already fetched
+    :type TwitterTracker._since_id: str or None
+    :var TwitterTracker._rate_limit_delay: seconds to wait before the next poll
+                                           because of rate limiting
+    :type TwitterTracker._rate_limit_delay: int or float
+    :var TwitterTracker._rate_limit_attempts: number of consecutive rate limited
+                                              mentions checks
+    :type TwitterTracker._rate_limit_attempts: int
     """
 
     def __init__(self, parse_message_callback, config):
@@ -35,55 +67,137 @@ class TwitterTracker(BaseMentionTracker):
         )
 
         self.target_user_id = config["target_user_id"]
+        self._original_tweets_cache = OrderedDict()
+        self._since_id = None
+        self._rate_limit_delay = 0
+        self._rate_limit_attempts = 0
 
         self.logger.info("Twitter tracker initialized")
         self.log_action(
             "initialized", f"Tracking mentions for user ID: {self.target_user_id}"
         )
 
-    def _get_original_tweet_info(self, referenced_tweet_id):
-        """Get original tweet information for reply mentions.
+    def _rate_limit_delay_seconds(self, error):
+        """Return number of seconds to wait after provided rate limit `error`.
 
-        :param referenced_tweet_id: ID of the referenced tweet
-        :type referenced_tweet_id: str
-        :var original_tweet: response from Twitter API for the referenced tweet
-        :type original_tweet: :class:`tweepy.models.Response`
+        Twitter's rate limit reset time is used when available, otherwise the
+        delay backs off exponentially with consecutive rate limited checks.
+
+        :param error: rate limit error raised by Twitter client
+        :type error: :class:`tweepy.errors.TooManyRequests`
+        :var reset: epoch time when the rate limit window resets
+        :type reset: str or None
+        :var delay: exponential backoff delay without jitter
+        :type delay: int
+        :return: int or float
+        """
+        reset = error.response.headers.get("x-rate-limit-reset")
+        if reset:
+            return max(0, int(reset) - time.time())
+
+        delay = RATE_LIMIT_BACKOFF_BASE * 2**self._rate_limit_attempts
+        return min(RATE_LIMIT_BACKOFF_MAX, delay) + random.uniform(0, 0.5)
+
+    def _user_map(self, includes):
+        """Build mapping of user IDs to usernames from Twitter API response includes.
+
+        :param includes: expansions included in Twitter API response
+        :type includes: dict or None
+        :return: mapping of user IDs to usernames
+        :rtype: dict
+        """
+        return dict(map(USER_ID_AND_USERNAME, (includes or {}).get("users", ())))
+
+    def _original_tweet_info(self, original_tweet, original_user_map):
+        """Build original tweet information from the tweet and its author.
+
+        :param original_tweet: original Twitter tweet object
+        :type original_tweet: :class:`tweepy.models.Tweet`
+        :param original_user_map: mapping of user IDs to usernames
+        :type original_user_map: dict
         :var contribution_url: URL to the original tweet
         :type contribution_url: str
         :var contributor: username of the original tweet author
         :type contributor: str
         :var contribution: text of the original tweet
         :type contribution: str
-        :var original_user_map: mapping of user IDs to user objects
-        :type original_user_map: dict
-        :var author: user object of the original tweet author
-        :type author: :class:`tweepy.models.User`
         :return: tuple of (contribution_url, contributor_username, contribution)
         :rtype: tuple
         """
+        contribution_url = f"https://twitter.com/i/web/status/{original_tweet.id}"
+        contributor = original_user_map.get(original_tweet.author_id, "")
+        contribution = original_tweet.text or ""
+
+        return contribution_url, contributor, contribution
+
+    def _get_cached_original_tweet_info(self, referenced_tweet_id):
+        """Return cached original tweet information and mark it as recently used.
+
+        Information cached longer than `ORIGINAL_TWEETS_CACHE_TTL` seconds ago
+        is evicted and treated as missing.
+
+        :param referenced_tweet_id: ID of the referenced tweet
+        :type referenced_tweet_id: str
+        :var cached: monotonic caching time and original tweet information
+        :type cached: tuple
+        :return: tuple of (contribution_url, contributor_username, contribution)
+        :rtype: tuple or None
+        """
+        cached = self._original_tweets_cache.get(referenced_tweet_id)
+        if cached is None:
+            return None
+
+        if time.monotonic() - cached[0] > ORIGINAL_TWEETS_CACHE_TTL:
+            del self._original_tweets_cache[referenced_tweet_id]
+            return None
+
+        self._original_tweets_cache.move_to_end(referenced_tweet_id)
+        return cached[1]
+
+    def _cache_original_tweet_info(self, referenced_tweet_id, info):
+        """Cache original tweet information, evicting the least recently used one.
+
+        :param referenced_tweet_id: ID of the referenced tweet
+        :type referenced_tweet_id: str
+        :param info: tuple of (contribution_url, contributor_username, contribution)
+        :type info: tuple
+        """
+        self._original_tweets_cache[referenced_tweet_id] = (time.monotonic(), info)
+        self._original_tweets_cache.move_to_end(referenced_tweet_id)
+        if len(self._original_tweets_cache) > ORIGINAL_TWEETS_CACHE_SIZE:
+            self._original_tweets_cache.popitem(last=False)
+
+    def _get_original_tweet_info(self, referenced_tweet_id):
+        """Get original tweet information for reply mentions.
+
+        :param referenced_tweet_id: ID of the referenced tweet
+        :type referenced_tweet_id: str
+        :var info: original tweet information
+        :type info: tuple
+        :var original_tweet: response from Twitter API for the referenced tweet
+        :type original_tweet: :class:`tweepy.models.Response`
+        :return: tuple of (contribution_url, contributor_username, contribution)
+        :rtype: tuple
+        """
+        info = self._get_cached_original_tweet_info(referenced_tweet_id)
+        if info:
+            return info
+
         try:
             original_tweet = self.client.get_tweet(
                 referenced_tweet_id,
-                tweet_fields=["created_at", "author_id", "text"],
+                tweet_fields=TWEET_FIELDS_ORIGINAL,
                 expansions=["author_id"],
             )
 
             if not original_tweet.data:
                 return "", "", ""
 
-            contribution_url = (
-                f"https://twitter.com/i/web/status/{original_tweet.data.id}"
+            info = self._original_tweet_info(
+                original_tweet.data, self._user_map(original_tweet.includes)
             )
-            contribution = original_tweet.data.text or ""
-
-            contributor = ""
-            if original_tweet.includes and "users" in original_tweet.includes:
-                users = original_tweet.includes["users"]
-                original_user_map = {u.id: u.username for u in users}
-                author_id = original_tweet.data.author_id
-                contributor = original_user_map.get(author_id, "")
-
-            return contribution_url, contributor, contribution
+            self._cache_original_tweet_info(referenced_tweet_id, info)
+            return info
 
         except Exception as e:
             self.logger.warning(
@@ -91,37 +205,97 @@ class TwitterTracker(BaseMentionTracker):
             )
             return "", "", ""
 
-    def _extract_reply_mention_data(self, tweet, user_map):
+    def _get_original_tweets_info(self, tweets):
+        """Get original tweets information for all given reply mentions.
+
+        Cached original tweets aren't requested again, the rest are fetched in
+        batches of up to :data:`TWEETS_LOOKUP_LIMIT` tweets per request.
+
+        :param tweets: Twitter tweet objects
+        :type tweets: list of :class:`tweepy.models.Tweet`
+        :var referenced_tweet_ids: unique IDs of the replied tweets
+        :type referenced_tweet_ids: list
+        :var original_tweets: original tweets information by their IDs
+        :type original_tweets: dict
+        :var missing_ids: IDs of the replied tweets that aren't cached
+        :type missing_ids: list
+        :var start: index of the first ID in current batch
+        :type start: int
+        :var response: response from Twitter API for current batch
+        :type response: :class:`tweepy.models.Response`
+        :var original_user_map: mapping of user IDs to usernames from response
+        :type original_user_map: dict
+        :var original_tweet: individual original tweet from response
+        :type original_tweet: :class:`tweepy.models.Tweet`
+        :var info: original tweet information
+        :type info: tuple
+        :return: original tweets information by their IDs or None if fetching failed
+        :rtype: dict or None
+        """
+        referenced_tweet_ids = list(
+            dict.fromkeys(
+                ref.id
+                for tweet in tweets
+                for ref in tweet.referenced_tweets or []
+                if ref.type == "replied_to"
+            )
+        )
+        original_tweets = {}
+        for referenced_tweet_id in referenced_tweet_ids:
+            info = self._get_cached_original_tweet_info(referenced_tweet_id)
+            if info:
+                original_tweets[referenced_tweet_id] = info
+
+        missing_ids = [
+            referenced_tweet_id
+            for referenced_tweet_id in referenced_tweet_ids
+            if referenced_tweet_id not in original_tweets
+        ]
+        for start in range(0, len(missing_ids), TWEETS_LOOKUP_LIMIT):
+            try:
+                response = self.client.get_tweets(
+                    ids=missing_ids[start : start + TWEETS_LOOKUP_LIMIT],
+                    tweet_fields=TWEET_FIELDS_ORIGINAL,
+                    expansions=["author_id"],
+                )
+
+            except Exception as e:
+                self.logger.warning(f"Failed to get original tweets: {e}")
+                return None
+
+            original_user_map = self._user_map(response.includes)
+            for original_tweet in response.data or []:
+                info = self._original_tweet_info(original_tweet, original_user_map)
+                self._cache_original_tweet_info(original_tweet.id, info)
+                original_tweets[original_tweet.id] = info
+
+        return original_tweets
+
+    def _extract_reply_mention_data(self, tweet, user_map, original_tweets=None):
         """Extract data for reply mentions.
 
         :param tweet: Twitter tweet object
         :type tweet: :class:`tweepy.models.Tweet`
         :param user_map: mapping of user IDs to usernames
         :type user_map: dict
-        :var contribution_url: URL to the contribution tweet
-        :type contribution_url: str
-        :var contributor: username of the contributor
-        :type contributor: str
-        :var contribution: text of the original tweet
-        :type contribution: str
-        :var ref: referenced tweet object
-        :type ref: :class:`tweepy.models.ReferencedTweet`
+        :param original_tweets: already fetched original tweets information
+        :type original_tweets: dict or None
+        :var ref: replied to tweet reference
+        :type ref: :class:`tweepy.models.ReferencedTweet` or None
         :return: tuple of (contribution_url, contributor, contribution)
         :rtype: tuple
         """
-        contribution_url, contributor, contribution = "", "", ""
-
-        if tweet.referenced_tweets:
-            for ref in tweet.referenced_tweets:
-                if ref.type == "replied_to":
-                    (
-                        contribution_url,
-                        contributor,
-                        contribution,
-                    ) = self._get_original_tweet_info(ref.id)
-                    break
+        ref = next(
+            (ref for ref in tweet.referenced_tweets or () if ref.type == "replied_to"),
+            None,
+        )
+        if ref is None:
+            return "", "", ""
 
-        return contribution_url, contributor, contribution
+        if original_tweets is not None:
+            return original_tweets.get(ref.id, ("", "", ""))
+
+        return self._get_original_tweet_info(ref.id)
 
     def _get_content(self, tweet):
         """Safely get content preview from tweet text.
@@ -131,41 +305,46 @@ class TwitterTracker(BaseMentionTracker):
         :return: content preview string
         :rtype: str
         """
-        if hasattr(tweet, "text") and tweet.text:
-            return tweet.text
-
-        return ""
+        return getattr(tweet, "text", "") or ""
 
     def _get_timestamp(self, tweet):
         """Safely get timestamp from tweet.
 
+        Twitter creation times are in UTC, so naive datetimes are treated as UTC
+        regardless of the server's local timezone.
+
         :param tweet: Twitter tweet object
         :type tweet: :class:`tweepy.models.Tweet`
+        :var created_at: tweet's creation time
+        :type created_at: :class:`datetime.datetime`
         :return: seconds since epoch
         :rtype: int
         """
-        if hasattr(tweet, "created_at") and tweet.created_at:
-            return int(tweet.created_at.timestamp())
+        created_at = getattr(tweet, "created_at", None)
+        if created_at:
+            return calendar.timegm(created_at.utctimetuple())
 
-        return int(datetime.now().timestamp())
+        return int(time.time())
 
-    def extract_mention_data(self, tweet, user_map):
+    def extract_mention_data(self, tweet, user_map, original_tweets=None):
         """Extract standardized data from Twitter mention.
 
         :param tweet: Twitter tweet object
         :type tweet: :class:`tweepy.models.Tweet`
         :param user_map: mapping of user IDs to usernames
         :type user_map: dict
+        :param original_tweets: already fetched original tweets information
+        :type original_tweets: dict or None
         :var suggester_username: username of the user who mentioned the bot
         :type suggester_username: str
+        :var suggestion_url: URL to the suggestion tweet
+        :type suggestion_url: str
         :var contribution_url: URL to the contribution tweet
         :type contribution_url: str
         :var contributor: username of the contributor
         :type contributor: str
         :var contribution: text of the original tweet
         :type contribution: str
-        :var suggestion_url: URL to the suggestion tweet
-        :type suggestion_url: str
         :var data: extracted data dictionary
         :type data: dict
         :return: standardized mention data
@@ -173,19 +352,18 @@ class TwitterTracker(BaseMentionTracker):
         """
         # Get suggester username from user_map
         suggester_username = user_map.get(tweet.author_id, "")
+        suggestion_url = f"https://twitter.com/i/web/status/{tweet.id}"
 
         # Handle reply mentions
         contribution_url, contributor, contribution = self._extract_reply_mention_data(
-            tweet, user_map
+            tweet, user_map, original_tweets
         )
 
         # If not a reply, use current tweet as contribution
         if not contribution_url:
-            contribution_url = f"https://twitter.com/i/web/status/{tweet.id}"
+            contribution_url = suggestion_url
             contributor = suggester_username
 
-        suggestion_url = f"https://twitter.com/i/web/status/{tweet.id}"
-
         data = {
             "suggester": suggester_username,
             "suggestion_url": suggestion_url,
@@ -203,57 +381,109 @@ class TwitterTracker(BaseMentionTracker):
     def check_mentions(self):
         """Check for new mentions on Twitter.
 
+        Only mentions newer than the newest one fetched by previous check are
+        requested from Twitter API, or newer than the oldest mention that failed
+        to be processed. On the first check, the newest processed mention stored
+        in the database is used instead.
+
         :var mention_count: number of new mentions found
         :type mention_count: int
         :var mentions: recent mentions from Twitter API
         :type mentions: :class:`tweepy.models.Response`
         :var user_map: mapping of user IDs to usernames from API response
         :type user_map: dict
+        :var processed: IDs of already processed tweets from mentions
+        :type processed: frozenset
+        :var tweets: unprocessed tweets from mentions
+        :type tweets: list
+        :var original_tweets: original tweets information for reply mentions
+        :type original_tweets: dict or None
+        :var failed_ids: IDs of mentions that failed to be processed
+        :type failed_ids: list
         :var tweet: individual tweet from mentions
         :type tweet: :class:`tweepy.models.Tweet`
         :var data: extracted mention data
         :type data: dict
+        :var username: mentioned username
+        :type username: str
         :return: number of new mentions processed
         :rtype: int
         """
         mention_count = 0
 
         try:
+            if self._since_id is None:
+                self._since_id = Mention.objects.last_processed_item_id(
+                    self.platform_name
+                )
+
             # Get recent mentions
             mentions = self.client.get_users_mentions(
                 self.target_user_id,
-                tweet_fields=[
-                    "created_at",
-                    "conversation_id",
-                    "author_id",
-                    "text",
-                    "referenced_tweets",
-                ],
+                since_id=self._since_id,
+                tweet_fields=TWEET_FIELDS_MENTIONS,
                 expansions=["author_id"],
                 max_results=20,
             )
 
             if mentions.data:
-                user_map = {
-                    u.id: u.username for u in mentions.includes.get("users", [])
-                }
-
-                for tweet in mentions.data:
-                    if not self.is_processed(tweet.id):
-                        data = self.extract_mention_data(tweet, user_map)
-                        if self.process_mention(
-                            tweet.id, data, f"@{data.get('contributor')}"
-                        ):
-                            mention_count += 1
-
+                user_map = self._user_map(mentions.includes)
+
+                processed = self.already_processed_ids(
+                    [tweet.id for tweet in mentions.data]
+                )
+                tweets = [
+                    tweet for tweet in mentions.data if str(tweet.id) not in processed
+                ]
+                original_tweets = self._get_original_tweets_info(tweets)
+
+                failed_ids = []
+                for tweet in tweets:
+                    data = self.extract_mention_data(tweet, user_map, original_tweets)
+                    username = f"@{data.get('contributor')}"
+                    if self.process_mention(tweet.id, data, username):
+                        mention_count += 1
+
+                    elif username in data.get("content", ""):
+                        # failed to process mention, so fetch it again next time
+                        failed_ids.append(int(tweet.id))
+
+                self._since_id = (
+                    str(min(failed_ids) - 1)
+                    if failed_ids
+                    else mentions.meta.get("newest_id", self._since_id)
+                )
+
+            self._rate_limit_delay = 0
+            self._rate_limit_attempts = 0
             self.log_action("mentions_checked", f"Found {mention_count} new mentions")
 
+        except tweepy.errors.TooManyRequests as e:
+            self._rate_limit_delay = self._rate_limit_delay_seconds(e)
+            self._rate_limit_attempts += 1
+            self.logger.warning(
+                f"Twitter rate limit reached, next poll in at least "
+                f"{self._rate_limit_delay:.0f} seconds"
+            )
+            self.log_action("twitter_rate_limited", f"Error: {str(e)}")
+
         except Exception as e:
             self.logger.error(f"Error checking Twitter mentions: {e}")
             self.log_action("twitter_check_error", f"Error: {str(e)}")
 
         return mention_count
 
+    def poll_delay(self, poll_interval_minutes):
+        """Return number of seconds to sleep before the next poll.
+
+        Poll interval is extended while Twitter API is rate limiting us.
+
+        :param poll_interval_minutes: how often to check for mentions
+        :type poll_interval_minutes: int or float
+        :return: int or float
+        """
+        return max(super().poll_delay(poll_interval_minutes), self._rate_limit_delay)
+
     def run(self, poll_interval_minutes=15, max_iterations=None):
         """Run Twitter mentions tracker.
 
@@ -1,9 +1,14 @@
 """Module containing class for sending Discord messages."""
 
 import logging
+import random
 import re
+import threading
+import time
+from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from rewardsbot.config import DISCORD_TOKEN, GUILD_IDS
 from updaters.base import BaseUpdater
@@ -11,23 +16,142 @@ from utils.constants.core import DISCORD_EMOJIS
 
 logger = logging.getLogger(__name__)
 
+DISCORD_URL_PATTERN = re.compile(r"^https://discord\.com/channels/(\d+)/(\d+)/(\d+)$")
+DISCORD_MAX_RETRIES = 3
+DISCORD_MAX_RETRY_WAIT = 5
+DISCORD_CHANNEL_INTERVAL = 0.25
+DISCORD_EMOJI_PATHS = {
+    name: quote(emoji, safe=":") for name, emoji in DISCORD_EMOJIS.items()
+}
+
 
 class DiscordUpdater(BaseUpdater):
-    """Discord updater."""
+    """Discord updater.
+
+    :var DiscordUpdater.guild_ids: IDs of the Discord servers/guilds we track
+    :type DiscordUpdater.guild_ids: frozenset
+    :var DiscordUpdater.discord_token: Discord bot token
+    :type DiscordUpdater.discord_token: str
+    :var DiscordUpdater.session: HTTP session keeping Discord API connections alive
+    :type DiscordUpdater.session: :class:`requests.Session`
+    :var DiscordUpdater._channels_lock: lock guarding channels' request schedule
+    :type DiscordUpdater._channels_lock: :class:`threading.Lock`
+    :var DiscordUpdater._channels_next_request: monotonic time of the next allowed
+                                                request by channel ID, shared by
+                                                all updater instances
+    :type DiscordUpdater._channels_next_request: dict
+    """
+
+    _channels_lock = threading.Lock()
+    _channels_next_request = {}
 
     def __init__(self, *args, **kwargs):
         """Initialize updater."""
         super().__init__(*args, **kwargs)
-        self.guild_ids = GUILD_IDS
+        self.guild_ids = frozenset((GUILD_IDS or "").split(","))
         self.discord_token = DISCORD_TOKEN
+        self.session = self._create_session()
+
+    def _create_session(self):
+        """Return HTTP session authorized with bot token and pooled connections.
+
+        :var session: HTTP session instance
+        :type session: :class:`requests.Session`
+        :return: :class:`requests.Session`
+        """
+        session = requests.Session()
+        session.headers.update({"Authorization": f"Bot {self.discord_token}"})
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        return session
+
+    def _throttle(self, channel_id):
+        """Wait until the next request to provided channel is allowed.
+
+        Requests to the same channel are spaced at least `DISCORD_CHANNEL_INTERVAL`
+        seconds apart, so bursts don't exhaust Discord's per-route rate limits.
+        The wait is never longer than `DISCORD_MAX_RETRY_WAIT` seconds and the
+        channels whose scheduled time has passed are removed from the schedule.
+
+        :param channel_id: ID of the channel the request is targeting
+        :type channel_id: str
+        :var now: current monotonic time
+        :type now: float
+        :var expired: IDs of the channels allowed to be requested right away
+        :type expired: list
+        :var scheduled: monotonic time reserved for this request
+        :type scheduled: float
+        """
+        with self._channels_lock:
+            now = time.monotonic()
+            expired = [
+                channel
+                for channel, next_request in self._channels_next_request.items()
+                if next_request <= now
+            ]
+            for channel in expired:
+                del self._channels_next_request[channel]
+
+            scheduled = min(
+                max(now, self._channels_next_request.get(channel_id, now)),
+                now + DISCORD_MAX_RETRY_WAIT,
+            )
+            self._channels_next_request[channel_id] = (
+                scheduled + DISCORD_CHANNEL_INTERVAL
+            )
+
+        if scheduled > now:
+            time.sleep(scheduled - now)
+
+    def _request(self, method, url, channel_id, **kwargs):
+        """Send HTTP request and retry it while Discord responds with rate limit.
+
+        Request is throttled per channel first. Rate limited request is retried
+        after waiting for the jittered Retry-After header value, at most
+        `DISCORD_MAX_RETRIES` times and for `DISCORD_MAX_RETRY_WAIT` seconds in
+        total, as requests are sent synchronously from views.
+
+        :param method: HTTP method name (e.g. "put")
+        :type method: str
+        :param url: Discord API URL
+        :type url: str
+        :param channel_id: ID of the channel the request is targeting
+        :type channel_id: str
+        :var waited: total number of seconds already waited for retries
+        :type waited: float
+        :var attempt: zero-based retry attempt counter
+        :type attempt: int
+        :var response: HTTP response instance
+        :type response: :class:`requests.Response`
+        :var retry_after: number of seconds to wait before retrying
+        :type retry_after: float
+        :return: :class:`requests.Response`
+        """
+        self._throttle(channel_id)
+        waited = 0.0
+        for attempt in range(DISCORD_MAX_RETRIES + 1):
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code != 429 or attempt == DISCORD_MAX_RETRIES:
+                return response
+
+            retry_after = float(
+                response.headers.get("Retry-After", "1")
+            ) + random.uniform(0, 0.5)
+            if waited + retry_after > DISCORD_MAX_RETRY_WAIT:
+                logger.warning(
+                    f"Discord rate limit wait of {retry_after:.2f}s is too long, "
+                    "giving up"
+                )
+                return response
+
+            logger.warning(f"Discord rate limit hit, retrying after {retry_after:.2f}s")
+            time.sleep(retry_after)
+            waited += retry_after
 
     def _parse_discord_url(self, url):
         """Return Discord server, channel, and message IDs parsed from provided `url`.
 
         :param url: URL of the Discord message to validate
         :type url: str
-        :var pattern: Discord URL regex pattern
-        :type pattern: str
         :var match: regex match instance
         :type match: :class:`re.Match`
         :var guild_id: ID of the Discord server/guild containing the message
@@ -38,13 +162,12 @@ class DiscordUpdater(BaseUpdater):
         :type message_id: str
         :return: two-tuple
         """
-        pattern = r"^https://discord\.com/channels/(\d+)/(\d+)/(\d+)$"
-        match = re.match(pattern, url)
+        match = DISCORD_URL_PATTERN.match(url)
         if not match:
             return False, False
 
         guild_id, channel_id, message_id = match.groups()
-        if guild_id not in self.guild_ids.split(","):
+        if guild_id not in self.guild_ids:
             return False, False
 
         return channel_id, message_id
@@ -60,8 +183,8 @@ class DiscordUpdater(BaseUpdater):
         :type channel_id: str
         :var message_id: ID of the message to react to
         :type message_id: str
-        :var headers: headers instance carrying bot token
-        :type headers: dict
+        :var emoji_path: URL-encoded emoji for the reactions endpoint
+        :type emoji_path: str
         :var api_url: fully formatted API URL to add reaction to the message
         :type api_url: str
         :var response: HTTP response instance
@@ -72,17 +195,16 @@ class DiscordUpdater(BaseUpdater):
         if not channel_id:
             return False
 
-        emoji = DISCORD_EMOJIS.get(reaction_name)
-        if not emoji:
+        emoji_path = DISCORD_EMOJI_PATHS.get(reaction_name)
+        if not emoji_path:
             logger.error(f"Invalid reaction name: {reaction_name}")
             return False
 
-        headers = {"Authorization": f"Bot {self.discord_token}"}
         url = (
             f"https://discord.com/api/v10/channels/{channel_id}/"
-            f"messages/{message_id}/reactions/{emoji}/@me"
+            f"messages/{message_id}/reactions/{emoji_path}/@me"
         )
-        response = requests.put(url, headers=headers)
+        response = self._request("put", url, channel_id)
         if response.status_code == 204:
             logger.info(f"Emoji {reaction_name} added successfully!")
             return True
@@ -100,8 +222,6 @@ class DiscordUpdater(BaseUpdater):
         :type url: str
         :param comment: reply message content
         :type comment: str
-        :var headers: headers instance carrying bot token and content type
-        :type headers: dict
         :var api_url: fully formatted API URL to create message in channel
         :type api_url: str
         :var payload: request payload containing reply message data
@@ -115,10 +235,6 @@ class DiscordUpdater(BaseUpdater):
         if not channel_id:
             return False
 
-        headers = {
-            "Authorization": f"Bot {self.discord_token}",
-            "Content-Type": "application/json",
-        }
         api_url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
 
         payload = {
@@ -126,7 +242,7 @@ class DiscordUpdater(BaseUpdater):
             "message_reference": {"channel_id": channel_id, "message_id": message_id},
         }
 
-        response = requests.post(api_url, headers=headers, json=payload)
+        response = self._request("post", api_url, channel_id, json=payload)
         if response.status_code == 200:
             logger.info(f"Reply added successfully to message {message_id}!")
             return True
@@ -143,8 +259,6 @@ class DiscordUpdater(BaseUpdater):
         :type channel_id: str
         :param message_id: ID of the message to react to
         :type message_id: str
-        :var headers: headers instance carrying bot token
-        :type headers: dict
         :var api_url: fully formatted API URL to retrieve message
         :type api_url: str
         :var response: HTTP response instance
@@ -157,12 +271,11 @@ class DiscordUpdater(BaseUpdater):
         if not channel_id:
             return {"success": False, "error": "Invalid URL"}
 
-        headers = {"Authorization": f"Bot {self.discord_token}"}
         api_url = (
             f"https://discord.com/api/v10/channels/{channel_id}/messages/{message_id}"
         )
 
-        response = requests.get(api_url, headers=headers)
+        response = self._request("get", api_url, channel_id)
         if response.status_code == 200:
             message_data = response.json()
             return {
@@ -1,7 +1,7 @@
 """Module containing class for adding replies to Reddit posts and comments."""
 
 import logging
-import re
+from functools import cached_property
 from urllib.parse import urlparse
 
 from praw import Reddit
@@ -21,16 +21,16 @@ class RedditUpdater(BaseUpdater):
     :type RedditUpdater.client: :class:`praw.Reddit`
     """
 
-    def __init__(self, *args, **kwargs):
-        """Initialize Twitter/X updater.
+    @cached_property
+    def client(self):
+        """Return Reddit client authenticated on first use.
 
         :var config: configuration dictionary for Reddit API
         :type config: dict
+        :return: :class:`praw.Reddit`
         """
-        super().__init__(*args, **kwargs)
-
         config = reddit_config()
-        self.client = Reddit(
+        return Reddit(
             client_id=config["client_id"],
             client_secret=config["client_secret"],
             user_agent=config["user_agent"],
@@ -51,10 +51,10 @@ class RedditUpdater(BaseUpdater):
         :type parsed: namedtuple
         :var hostname: provided URL's host name
         :type hostname: str
-        :var clean_url: Reddit URL without domain
-        :type clean_url: str
         :var parts: Reddit URL parts collection
         :type parts: list
+        :var index: position of the 'comments' part in the URL parts
+        :type index: int
         :var submission_id: Reddit post/submission identifier
         :type submission_id: str
         :var comment_id: Reddit comment identifier
@@ -64,27 +64,28 @@ class RedditUpdater(BaseUpdater):
         """
         parsed = urlparse(url)
         hostname = parsed.hostname.lower() if parsed.hostname else None
-        if hostname and (hostname == "reddit.com" or hostname.endswith(".reddit.com")):
-            clean_url = parsed.path
-            parts = [p for p in clean_url.split("/") if p]
-
-            # Find the 'comments' section
-            for i, part in enumerate(parts):
-                if part == "comments" and i + 1 < len(parts):
-                    submission_id = parts[i + 1]
-
-                    # Check if there's a comment_id (2 parts after submission_id)
-                    if len(parts) > i + 3:
-                        comment_id = parts[i + 3]
-                        # Basic validation: comment IDs are base36, usually 4+ chars
-                        if len(comment_id) >= 4 and re.match(
-                            r"^[a-z0-9]+$", comment_id, re.IGNORECASE
-                        ):
-                            return submission_id, comment_id
-
-                    return submission_id, None
-
-        return None, None
+        if not hostname or (
+            hostname != "reddit.com" and not hostname.endswith(".reddit.com")
+        ):
+            return None, None
+
+        parts = [p for p in parsed.path.split("/") if p]
+        if "comments" not in parts:
+            return None, None
+
+        index = parts.index("comments")
+        if index + 1 >= len(parts):
+            return None, None
+
+        submission_id = parts[index + 1]
+        # Check if there's a comment_id (2 parts after submission_id)
+        if len(parts) > index + 3:
+            comment_id = parts[index + 3]
+            # Basic validation: comment IDs are base36, usually 4+ chars
+            if len(comment_id) >= 4 and comment_id.isascii() and comment_id.isalnum():
+                return submission_id, comment_id
+
+        return submission_id, None
 
     def add_reaction_to_message(self, url, reaction_name):
         """Add reaction to Reddit message.
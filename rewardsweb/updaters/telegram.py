@@ -1,18 +1,30 @@
 """Module containing class for sending Telegram replies and emoji reactions."""
 
 import asyncio
+import inspect
 import logging
+import re
 from pathlib import Path
 
 from telethon import TelegramClient
-from telethon.errors import SessionPasswordNeededError
+from telethon.errors import (
+    FloodWaitError,
+    RPCError,
+    SessionPasswordNeededError,
+)
 
 from trackers.config import telegram_config
 from trackers.models import Mention
+from trackers.telegram import AsyncTokenBucket
 from updaters.base import BaseUpdater
 
 logger = logging.getLogger(__name__)
 
+TELEGRAM_MESSAGE_URL_PATTERN = re.compile(r"/(-?\d+)/(\d+)/?$")
+TELEGRAM_MAX_CONCURRENT_REPLIES = 30
+TELEGRAM_MAX_REPLIES_RATE = 30
+TELEGRAM_MAX_FLOOD_WAIT = 5
+
 
 class TelegramUpdater(BaseUpdater):
     """Main class for retrieving and adding Telegram messages.
@@ -21,10 +33,40 @@ class TelegramUpdater(BaseUpdater):
     :type TelegramUpdater.client: :class:`telethon.TelegramClient`
     :var TelegramUpdater._is_connected: is client connected or not
     :type TelegramUpdater._is_connected: Boolean
+    :var TelegramUpdater._limiter: rate limiter for sent messages
+    :type TelegramUpdater._limiter: :class:`trackers.telegram.AsyncTokenBucket`
+    :var TelegramUpdater._credentials_provider: callable returning credential for
+                                                provided prompt, `input` if None
+    :type TelegramUpdater._credentials_provider: callable or None
     """
 
     def __init__(self, *args, **kwargs):
-        """Initialize Twitter/X updater.
+        """Initialize Telegram updater.
+
+        Sync or async callable used to obtain phone number, login code and 2FA
+        password may be provided by `credentials_provider` keyword argument.
+        """
+        self._credentials_provider = kwargs.pop("credentials_provider", None)
+        super().__init__(*args, **kwargs)
+        self.client = self._create_client()
+        self._is_connected = False
+        self._limiter = AsyncTokenBucket(TELEGRAM_MAX_REPLIES_RATE)
+
+    async def __aenter__(self):
+        """Connect Telegram client when entering the async context.
+
+        :return: :class:`TelegramUpdater`
+        """
+        await self._ensure_connected()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Disconnect Telegram client when leaving the async context."""
+        await self.client.disconnect()
+        self._is_connected = False
+
+    def _create_client(self):
+        """Return Telegram client using configured credentials and session.
 
         :var config: configuration dictionary for Telegram API
         :type config: dict
@@ -32,9 +74,8 @@ class TelegramUpdater(BaseUpdater):
         :type session_name: str
         :var session_path: full path on disk to session database file
         :type session_path: :class:`pathlib.PosixPath`
+        :return: :class:`telethon.TelegramClient`
         """
-        super().__init__(*args, **kwargs)
-
         config = telegram_config()
         session_name = config.get("session_name", "telegram_tracker")
         session_path = (
@@ -42,16 +83,19 @@ class TelegramUpdater(BaseUpdater):
             / "fixtures"
             / f"{session_name}.session"
         )
-        self.client = TelegramClient(
+        return TelegramClient(
             session=session_path,
             api_id=config["api_id"],
             api_hash=config["api_hash"],
         )
-        self._is_connected = False
 
     async def _add_reply_async(self, url, text):
         """Async implementation of adding reply to message.
 
+        Sending is retried once after the requested wait if Telegram responds
+        with flood wait error not longer than `TELEGRAM_MAX_FLOOD_WAIT` seconds,
+        as replies are sent synchronously from views.
+
         :param url: URL of the message
         :type url: str
         :param text: text to reply with
@@ -66,16 +110,86 @@ class TelegramUpdater(BaseUpdater):
         try:
             await self._ensure_connected()
             chat_id, message_id = self._parse_message_url(url)
-            await self.client.send_message(
-                entity=chat_id, message=text, reply_to=message_id
-            )
+            try:
+                await self._send_reply(chat_id, message_id, text)
+
+            except FloodWaitError as e:
+                if e.seconds > TELEGRAM_MAX_FLOOD_WAIT:
+                    logger.error(
+                        f"Flood wait of {e.seconds} seconds for {url} is too long, "
+                        "giving up"
+                    )
+                    return False
+
+                logger.warning(f"Flood wait of {e.seconds} seconds for {url}")
+                await asyncio.sleep(e.seconds)
+                await self._send_reply(chat_id, message_id, text)
+
             logger.info(f"Added reply to message: {url}")
             return True
 
+        except RPCError as e:
+            logger.warning(f"Error adding reply to {url}: {e}")
+            return False
+
         except Exception as e:
             logger.error(f"Error adding reply to {url}: {e}")
             return False
 
+    async def _add_replies_async(self, pairs):
+        """Async implementation of adding replies to multiple messages at once.
+
+        Replies are sent concurrently over the client connected for the action,
+        with at most `TELEGRAM_MAX_CONCURRENT_REPLIES` of them in flight.
+
+        :param pairs: collection of (url, text) two-tuples
+        :type pairs: list
+        :var semaphore: semaphore limiting the number of concurrent replies
+        :type semaphore: :class:`asyncio.Semaphore`
+        :return: list of booleans indicating success for each pair
+        :rtype: list
+        """
+        semaphore = asyncio.Semaphore(TELEGRAM_MAX_CONCURRENT_REPLIES)
+
+        async def add_reply(url, text):
+            async with semaphore:
+                return await self._add_reply_async(url, text)
+
+        return list(await asyncio.gather(*(add_reply(*pair) for pair in pairs)))
+
+    async def _send_reply(self, chat_id, message_id, text):
+        """Send `text` as reply to message once rate limiter allows it.
+
+        :param chat_id: unique chat identifier
+        :type chat_id: int
+        :param message_id: unique message identifier in the chat
+        :type message_id: int
+        :param text: text to reply with
+        :type text: str
+        """
+        async with self._limiter:
+            await self.client.send_message(
+                entity=chat_id, message=text, reply_to=message_id
+            )
+
+    async def _credential(self, prompt):
+        """Return credential obtained from credentials provider for `prompt`.
+
+        Sync providers (`input` by default) are run in a separate thread so they
+        don't block the event loop.
+
+        :param prompt: text describing requested credential
+        :type prompt: str
+        :var provider: callable returning credential for provided prompt
+        :type provider: callable
+        :return: str
+        """
+        provider = self._credentials_provider or input
+        if inspect.iscoroutinefunction(provider):
+            return await provider(prompt)
+
+        return await asyncio.to_thread(provider, prompt)
+
     async def _ensure_connected(self):
         """Ensure Telegram client is connected.
 
@@ -90,15 +204,17 @@ class TelegramUpdater(BaseUpdater):
             try:
                 await self.client.connect()
                 if not await self.client.is_user_authorized():
-                    phone = input("Please enter your phone number: ")
+                    phone = await self._credential("Please enter your phone number: ")
                     await self.client.send_code_request(phone)
-                    code = input("Please enter the code you received: ")
+                    code = await self._credential(
+                        "Please enter the code you received: "
+                    )
                     await self.client.sign_in(phone, code)
 
                 self._is_connected = True
 
             except SessionPasswordNeededError:
-                password = input("Please enter your 2FA password: ")
+                password = await self._credential("Please enter your 2FA password: ")
                 await self.client.sign_in(password=password)
                 self._is_connected = True
 
@@ -111,29 +227,37 @@ class TelegramUpdater(BaseUpdater):
 
         :param url: URL of the message
         :type url: str
-        :var parts: message URL's parts
-        :type parts: list
-        :var chat_id: unique chat identifier
-        :type chat_id: int
-        :var message_id: unique message identifier in the chat
-        :type message_id: int
+        :var match: regex match instance
+        :type match: :class:`re.Match`
         :return: tuple of (chat_id, message_id)
         :rtype: two-tuple
         """
-        parts = url.split("/")
-        chat_id = int(parts[-2])
-        message_id = int(parts[-1])
-        return chat_id, message_id
+        match = TELEGRAM_MESSAGE_URL_PATTERN.search(url)
+        if not match:
+            raise ValueError(f"Invalid Telegram message URL: {url}")
+
+        return int(match.group(1)), int(match.group(2))
+
+    async def _run_connected(self, action_callback, *args):
+        """Await `action_callback` with `args` while Telegram client is connected.
+
+        :param action_callback: coroutine function to await
+        :type action_callback: object
+        :return: result of `action_callback`
+        """
+        async with self:
+            return await action_callback(*args)
 
     def _process_action(self, action_callback, *args):
         """Run `action_callback` with `args` in an asynchronous loop.
 
+        Client is connected for the action only, as updaters are created per
+        request, and the loop is closed afterwards.
+
         :param action_callback: method to call
         :type action_callback: object
         :var loop: asyncio event loop
         :type loop: :class:`asyncio.events.AbstractEventLoop`
-        :var result: future's result
-        :type result: object
         :return: True for success, False otherwise
         :rtype: bool
         """
@@ -143,9 +267,8 @@ class TelegramUpdater(BaseUpdater):
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
 
-            # Run the async method
-            result = loop.run_until_complete(action_callback(*args))
-            return result
+            # Run the async method while the client is connected
+            return loop.run_until_complete(self._run_connected(action_callback, *args))
 
         except Exception as e:
             logger.error(f"Error raised for {action_callback.__name__}: {e}")
@@ -186,6 +309,20 @@ class TelegramUpdater(BaseUpdater):
         """
         return self._process_action(self._add_reply_async, url, text)
 
+    def add_replies_to_messages(self, pairs):
+        """Add replies to multiple messages in a single event loop run.
+
+        :param pairs: collection of (url, text) two-tuples
+        :type pairs: list
+        :var results: success flags for each pair or False if the run failed
+        :type results: list or bool
+        :return: list of booleans indicating success for each pair
+        :rtype: list
+        """
+        pairs = list(pairs)
+        results = self._process_action(self._add_replies_async, pairs)
+        return results if results is not False else [False] * len(pairs)
+
     def message_from_url(self, url):
         """Retrieve message content from provided Telegram `url`.
 
@@ -1,12 +1,21 @@
 """Testing module for :py:mod:`updaters.discord` module."""
 
 from unittest import mock
+from urllib.parse import quote
 
 import pytest
+import requests
+from requests.adapters import HTTPAdapter
 
 from rewardsbot.config import DISCORD_TOKEN, GUILD_IDS
 from updaters.base import BaseUpdater
-from updaters.discord import DiscordUpdater
+from updaters.discord import (
+    DISCORD_CHANNEL_INTERVAL,
+    DISCORD_EMOJI_PATHS,
+    DISCORD_MAX_RETRIES,
+    DISCORD_MAX_RETRY_WAIT,
+    DiscordUpdater,
+)
 from utils.constants.core import DISCORD_EMOJIS
 
 
@@ -16,10 +25,168 @@ class TestUpdatersDiscordDiscordupdater:
     def setup_method(self):
         """Set up test method."""
         self.updater = DiscordUpdater()
+        DiscordUpdater._channels_next_request.clear()
 
     def test_updaters_discord_discordupdater_is_subclass_of_baseupdater(self):
         assert issubclass(DiscordUpdater, BaseUpdater)
 
+    def test_updaters_discord_discordupdater_emoji_paths_constant(self):
+        assert DISCORD_EMOJI_PATHS.keys() == DISCORD_EMOJIS.keys()
+        for name, emoji in DISCORD_EMOJIS.items():
+            assert DISCORD_EMOJI_PATHS[name] == quote(emoji, safe=":")
+
+    # # __init__
+    def test_updaters_discord_discordupdater_init_functionality(self):
+        assert self.updater.guild_ids == frozenset(GUILD_IDS.split(","))
+        assert self.updater.discord_token == DISCORD_TOKEN
+        assert isinstance(self.updater.session, requests.Session)
+
+    def test_updaters_discord_discordupdater_init_without_guild_ids(self):
+        with mock.patch("updaters.discord.GUILD_IDS", None):
+            updater = DiscordUpdater()
+
+        assert updater.guild_ids == frozenset({""})
+        assert updater._parse_discord_url(
+            "https://discord.com/channels/1028021510453084160/1028021510453084161/1"
+        ) == (False, False)
+
+    # # _create_session
+    def test_updaters_discord_discordupdater_create_session_functionality(self):
+        session = self.updater._create_session()
+        assert isinstance(session, requests.Session)
+        assert session.headers["Authorization"] == "Bot " + DISCORD_TOKEN
+        adapter = session.get_adapter("https://discord.com/api/v10/channels")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 16
+
+    # # _throttle
+    def test_updaters_discord_discordupdater_throttle_first_request(self):
+        with mock.patch(
+            "updaters.discord.time.monotonic", return_value=100.0
+        ), mock.patch("updaters.discord.time.sleep") as mocked_sleep:
+            self.updater._throttle("1028021510453084161")
+            mocked_sleep.assert_not_called()
+            assert DiscordUpdater._channels_next_request == {
+                "1028021510453084161": 100.0 + DISCORD_CHANNEL_INTERVAL
+            }
+
+    def test_updaters_discord_discordupdater_throttle_spaces_channel_requests(self):
+        with mock.patch(
+            "updaters.discord.time.monotonic", return_value=100.0
+        ), mock.patch("updaters.discord.time.sleep") as mocked_sleep:
+            self.updater._throttle("1028021510453084161")
+            DiscordUpdater()._throttle("1028021510453084161")
+            DiscordUpdater()._throttle("1028021510453084161")
+            self.updater._throttle("1020298428061847612")
+            assert mocked_sleep.call_args_list == [
+                mock.call(DISCORD_CHANNEL_INTERVAL),
+                mock.call(2 * DISCORD_CHANNEL_INTERVAL),
+            ]
+
+    def test_updaters_discord_discordupdater_throttle_removes_expired_channels(self):
+        DiscordUpdater._channels_next_request.update(
+            {"1028021510453084161": 99.0, "1020298428061847612": 100.5}
+        )
+        with mock.patch(
+            "updaters.discord.time.monotonic", return_value=100.0
+        ), mock.patch("updaters.discord.time.sleep") as mocked_sleep:
+            self.updater._throttle("1028021510453084162")
+            mocked_sleep.assert_not_called()
+            assert DiscordUpdater._channels_next_request == {
+                "1020298428061847612": 100.5,
+                "1028021510453084162": 100.0 + DISCORD_CHANNEL_INTERVAL,
+            }
+
+    def test_updaters_discord_discordupdater_throttle_bounds_wait(self):
+        DiscordUpdater._channels_next_request["1028021510453084161"] = 200.0
+        with mock.patch(
+            "updaters.discord.time.monotonic", return_value=100.0
+        ), mock.patch("updaters.discord.time.sleep") as mocked_sleep:
+            self.updater._throttle("1028021510453084161")
+            mocked_sleep.assert_called_once_with(DISCORD_MAX_RETRY_WAIT)
+            assert DiscordUpdater._channels_next_request == {
+                "1028021510453084161": 100.0
+                + DISCORD_MAX_RETRY_WAIT
+                + DISCORD_CHANNEL_INTERVAL
+            }
+
+    # # _request
+    def test_updaters_discord_discordupdater_request_functionality(self):
+        api_url = "https://discord.com/api/v10/channels/1028021510453084161/messages"
+        with mock.patch.object(
+            self.updater.session, "request"
+        ) as mocked_request, mock.patch("updaters.discord.time.sleep") as mocked_sleep:
+            mocked_request.return_value.status_code = 200
+            returned = self.updater._request(
+                "post", api_url, "1028021510453084161", json={"content": "a"}
+            )
+            assert returned == mocked_request.return_value
+            mocked_request.assert_called_once_with(
+                "post", api_url, json={"content": "a"}
+            )
+            mocked_sleep.assert_not_called()
+
+    def test_updaters_discord_discordupdater_request_retries_rate_limited(self):
+        api_url = "https://discord.com/api/v10/channels/1028021510453084161/messages"
+        limited, success = mock.MagicMock(), mock.MagicMock()
+        limited.status_code, limited.headers = 429, {"Retry-After": "1"}
+        success.status_code = 200
+        with mock.patch.object(
+            self.updater.session, "request", side_effect=[limited, limited, success]
+        ) as mocked_request, mock.patch(
+            "updaters.discord.time.sleep"
+        ) as mocked_sleep, mock.patch(
+            "updaters.discord.random.uniform", return_value=0.25
+        ), mock.patch(
+            "updaters.discord.logger"
+        ) as mocked_logger:
+            returned = self.updater._request("get", api_url, "1028021510453084161")
+            assert returned == success
+            assert mocked_request.call_count == 3
+            assert mocked_sleep.call_args_list == [mock.call(1.25), mock.call(1.25)]
+            assert mocked_logger.warning.call_count == 2
+
+    def test_updaters_discord_discordupdater_request_gives_up_after_max_retries(self):
+        api_url = "https://discord.com/api/v10/channels/1028021510453084161/messages"
+        limited = mock.MagicMock()
+        limited.status_code, limited.headers = 429, {"Retry-After": "0"}
+        with mock.patch.object(
+            self.updater.session, "request", return_value=limited
+        ) as mocked_request, mock.patch(
+            "updaters.discord.time.sleep"
+        ) as mocked_sleep, mock.patch(
+            "updaters.discord.random.uniform", return_value=0
+        ), mock.patch(
+            "updaters.discord.logger"
+        ):
+            returned = self.updater._request("put", api_url, "1028021510453084161")
+            assert returned == limited
+            assert mocked_request.call_count == DISCORD_MAX_RETRIES + 1
+            assert mocked_sleep.call_count == DISCORD_MAX_RETRIES
+
+    def test_updaters_discord_discordupdater_request_gives_up_for_long_wait(self):
+        api_url = "https://discord.com/api/v10/channels/1028021510453084161/messages"
+        limited, success = mock.MagicMock(), mock.MagicMock()
+        limited.status_code, limited.headers = 429, {"Retry-After": "3"}
+        success.status_code = 200
+        with mock.patch.object(
+            self.updater.session, "request", side_effect=[limited, limited, success]
+        ) as mocked_request, mock.patch(
+            "updaters.discord.time.sleep"
+        ) as mocked_sleep, mock.patch(
+            "updaters.discord.random.uniform", return_value=0.5
+        ), mock.patch(
+            "updaters.discord.logger"
+        ) as mocked_logger:
+            returned = self.updater._request("put", api_url, "1028021510453084161")
+            assert returned == limited
+            assert mocked_request.call_count == 2
+            mocked_sleep.assert_called_once_with(3.5)
+            mocked_logger.warning.assert_called_with(
+                "Discord rate limit wait of 3.50s is too long, giving up"
+            )
+
     # # _parse_discord_url
     @pytest.mark.parametrize(
         "url",
@@ -67,7 +234,7 @@ class TestUpdatersDiscordDiscordupdater:
         url = (
             f"https://discord.com/channels/906917846754418770/{channel_id}/{message_id}"
         )
-        with mock.patch("updaters.discord.requests.put") as mocked_put, mock.patch(
+        with mock.patch.object(self.updater, "_request") as mocked_put, mock.patch(
             "updaters.discord.logger"
         ) as mocked_logger:
             returned = self.updater.add_reaction_to_message(url, reaction_name)
@@ -84,7 +251,7 @@ class TestUpdatersDiscordDiscordupdater:
             "duplicate",
         )
         url = f"https://discord.com/channels/{channel_id}/{message_id}"
-        with mock.patch("updaters.discord.requests.put") as mocked_put, mock.patch(
+        with mock.patch.object(self.updater, "_request") as mocked_put, mock.patch(
             "updaters.discord.logger"
         ) as mocked_logger:
             returned = self.updater.add_reaction_to_message(url, reaction_name)
@@ -101,19 +268,18 @@ class TestUpdatersDiscordDiscordupdater:
         url = (
             f"https://discord.com/channels/906917846754418770/{channel_id}/{message_id}"
         )
-        headers = {"Authorization": "Bot " + DISCORD_TOKEN}
         api_url = (
             f"https://discord.com/api/v10/channels/{channel_id}/"
-            f"messages/{message_id}/reactions/{DISCORD_EMOJIS[reaction_name]}/@me"
+            f"messages/{message_id}/reactions/{DISCORD_EMOJI_PATHS[reaction_name]}/@me"
         )
-        with mock.patch("updaters.discord.requests.put") as mocked_put, mock.patch(
+        with mock.patch.object(self.updater, "_request") as mocked_put, mock.patch(
             "updaters.discord.logger"
         ) as mocked_logger:
             mocked_put.return_value.status_code = 505
             mocked_put.return_value.text = "error text"
             returned = self.updater.add_reaction_to_message(url, reaction_name)
             assert returned is False
-            mocked_put.assert_called_once_with(api_url, headers=headers)
+            mocked_put.assert_called_once_with("put", api_url, channel_id)
             mocked_logger.error.assert_called_once_with(
                 "Failed to add reaction: 505 - error text"
             )
@@ -129,18 +295,17 @@ class TestUpdatersDiscordDiscordupdater:
         url = (
             f"https://discord.com/channels/906917846754418770/{channel_id}/{message_id}"
         )
-        headers = {"Authorization": "Bot " + DISCORD_TOKEN}
         api_url = (
             f"https://discord.com/api/v10/channels/{channel_id}/"
-            f"messages/{message_id}/reactions/{DISCORD_EMOJIS[reaction_name]}/@me"
+            f"messages/{message_id}/reactions/{DISCORD_EMOJI_PATHS[reaction_name]}/@me"
         )
-        with mock.patch("updaters.discord.requests.put") as mocked_put, mock.patch(
+        with mock.patch.object(self.updater, "_request") as mocked_put, mock.patch(
             "updaters.discord.logger"
         ) as mocked_logger:
             mocked_put.return_value.status_code = 204
             returned = self.updater.add_reaction_to_message(url, reaction_name)
             assert returned is True
-            mocked_put.assert_called_once_with(api_url, headers=headers)
+            mocked_put.assert_called_once_with("put", api_url, channel_id)
             mocked_logger.info.assert_called_once_with(
                 f"Emoji {reaction_name} added successfully!"
             )
@@ -150,7 +315,7 @@ class TestUpdatersDiscordDiscordupdater:
         """Test add_reply_to_message returns False for invalid Discord URL."""
         message_id, comment = ("1353382023309562020", "This is a test reply")
         url = f"https://discord.com/channels/906917846754418770/{message_id}"
-        with mock.patch("updaters.discord.requests.post") as mocked_post, mock.patch(
+        with mock.patch.object(self.updater, "_request") as mocked_post, mock.patch(
             "updaters.discord.logger"
         ) as mocked_logger:
             returned = self.updater.add_reply_to_message(url, comment)
@@ -167,23 +332,21 @@ class TestUpdatersDiscordDiscordupdater:
             "This is a test reply",
         )
         url = f"https://discord.com/channels/{guild_id}/{channel_id}/{message_id}"
-        headers = {
-            "Authorization": "Bot " + DISCORD_TOKEN,
-            "Content-Type": "application/json",
-        }
         api_url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
         payload = {
             "content": comment,
             "message_reference": {"channel_id": channel_id, "message_id": message_id},
         }
-        with mock.patch("updaters.discord.requests.post") as mocked_post, mock.patch(
+        with mock.patch.object(self.updater, "_request") as mocked_post, mock.patch(
             "updaters.discord.logger"
         ) as mocked_logger:
             mocked_post.return_value.status_code = 403
             mocked_post.return_value.text = "Forbidden"
             returned = self.updater.add_reply_to_message(url, comment)
             assert returned is False
-            mocked_post.assert_called_once_with(api_url, headers=headers, json=payload)
+            mocked_post.assert_called_once_with(
+                "post", api_url, channel_id, json=payload
+            )
             mocked_logger.error.assert_called_once_with(
                 "Failed to add reply: 403 - Forbidden"
             )
@@ -197,22 +360,20 @@ class TestUpdatersDiscordDiscordupdater:
             "This is a test reply",
         )
         url = f"https://discord.com/channels/{guild_id}/{channel_id}/{message_id}"
-        headers = {
-            "Authorization": "Bot " + DISCORD_TOKEN,
-            "Content-Type": "application/json",
-        }
         api_url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
         payload = {
             "content": comment,
             "message_reference": {"channel_id": channel_id, "message_id": message_id},
         }
-        with mock.patch("updaters.discord.requests.post") as mocked_post, mock.patch(
+        with mock.patch.object(self.updater, "_request") as mocked_post, mock.patch(
             "updaters.discord.logger"
         ) as mocked_logger:
             mocked_post.return_value.status_code = 200
             returned = self.updater.add_reply_to_message(url, comment)
             assert returned is True
-            mocked_post.assert_called_once_with(api_url, headers=headers, json=payload)
+            mocked_post.assert_called_once_with(
+                "post", api_url, channel_id, json=payload
+            )
             mocked_logger.info.assert_called_once_with(
                 f"Reply added successfully to message {message_id}!"
             )
@@ -230,7 +391,7 @@ class TestUpdatersDiscordDiscordupdater:
         url = f"https://discord.com/channels/{guild_id}/{channel_id}/{message_id}"
 
         # Test with 201 status code (should return False as we expect 200)
-        with mock.patch("updaters.discord.requests.post") as mocked_post, mock.patch(
+        with mock.patch.object(self.updater, "_request") as mocked_post, mock.patch(
             "updaters.discord.logger"
         ) as mocked_logger:
             mocked_post.return_value.status_code = 201
@@ -243,7 +404,7 @@ class TestUpdatersDiscordDiscordupdater:
     def test_updaters_discord_discordupdater_message_from_url_for_wrong_url(self):
         channel_id, message_id = "1028021510453084161", "1353382023309562020"
         url = f"https://discord.com/channels/{channel_id}/{message_id}"
-        with mock.patch("updaters.discord.requests.get") as mocked_get:
+        with mock.patch.object(self.updater, "_request") as mocked_get:
             returned = self.updater.message_from_url(url)
             assert returned == {"success": False, "error": "Invalid URL"}
             mocked_get.assert_not_called()
@@ -253,11 +414,10 @@ class TestUpdatersDiscordDiscordupdater:
         url = (
             f"https://discord.com/channels/906917846754418770/{channel_id}/{message_id}"
         )
-        headers = {"Authorization": "Bot " + DISCORD_TOKEN}
         api_url = (
             f"https://discord.com/api/v10/channels/{channel_id}/messages/{message_id}"
         )
-        with mock.patch("updaters.discord.requests.get") as mocked_get:
+        with mock.patch.object(self.updater, "_request") as mocked_get:
             mocked_get.return_value.status_code = 505
             mocked_get.return_value.text = "error text"
             returned = self.updater.message_from_url(url)
@@ -266,7 +426,7 @@ class TestUpdatersDiscordDiscordupdater:
                 "error": "API Error: 505",
                 "response_text": "error text",
             }
-            mocked_get.assert_called_once_with(api_url, headers=headers)
+            mocked_get.assert_called_once_with("get", api_url, channel_id)
 
     def test_updaters_discord_discordupdater_message_from_url_for_deafult_message_data(
         self,
@@ -275,7 +435,6 @@ class TestUpdatersDiscordDiscordupdater:
         url = (
             f"https://discord.com/channels/906917846754418770/{channel_id}/{message_id}"
         )
-        headers = {"Authorization": "Bot " + DISCORD_TOKEN}
         api_url = (
             f"https://discord.com/api/v10/channels/{channel_id}/messages/{message_id}"
         )
@@ -283,7 +442,7 @@ class TestUpdatersDiscordDiscordupdater:
             "channel_id": channel_id,
             "message_id": message_id,
         }
-        with mock.patch("updaters.discord.requests.get") as mocked_get:
+        with mock.patch.object(self.updater, "_request") as mocked_get:
             mocked_get.return_value.status_code = 200
             mocked_get.return_value.json.return_value = message_data
             returned = self.updater.message_from_url(url)
@@ -296,14 +455,13 @@ class TestUpdatersDiscordDiscordupdater:
                 "message_id": message_id,
                 "raw_data": message_data,
             }
-            mocked_get.assert_called_once_with(api_url, headers=headers)
+            mocked_get.assert_called_once_with("get", api_url, channel_id)
 
     def test_updaters_discord_discordupdater_message_from_url_functionality(self):
         channel_id, message_id = "1028021510453084161", "1353382023309562020"
         url = (
             f"https://discord.com/channels/906917846754418770/{channel_id}/{message_id}"
         )
-        headers = {"Authorization": "Bot " + DISCORD_TOKEN}
         api_url = (
             f"https://discord.com/api/v10/channels/{channel_id}/messages/{message_id}"
         )
@@ -314,7 +472,7 @@ class TestUpdatersDiscordDiscordupdater:
             "channel_id": channel_id,
             "message_id": message_id,
         }
-        with mock.patch("updaters.discord.requests.get") as mocked_get:
+        with mock.patch.object(self.updater, "_request") as mocked_get:
             mocked_get.return_value.status_code = 200
             mocked_get.return_value.json.return_value = message_data
             returned = self.updater.message_from_url(url)
@@ -327,4 +485,4 @@ class TestUpdatersDiscordDiscordupdater:
                 "message_id": message_id,
                 "raw_data": message_data,
             }
-            mocked_get.assert_called_once_with(api_url, headers=headers)
+            mocked_get.assert_called_once_with("get", api_url, channel_id)
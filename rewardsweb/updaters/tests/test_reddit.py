@@ -1,5 +1,6 @@
 """Testing module for :py:mod:`updaters.reddit` module."""
 
+import pytest
 from praw.exceptions import ClientException, RedditAPIException
 
 from updaters.base import BaseUpdater
@@ -12,8 +13,16 @@ class TestUpdatersRedditRedditUpdater:
     def test_updaters_reddit_redditupdater_is_subclass_of_baseupdater(self):
         assert issubclass(RedditUpdater, BaseUpdater)
 
-    # __init__
-    def test_updaters_reddit_redditupdater_init_functionality(self, mocker):
+    # # client
+    def test_updaters_reddit_redditupdater_client_not_created_on_init(self, mocker):
+        mock_config = mocker.patch("updaters.reddit.reddit_config")
+        mock_client = mocker.patch("updaters.reddit.Reddit")
+        instance = RedditUpdater()
+        assert "client" not in vars(instance)
+        mock_config.assert_not_called()
+        mock_client.assert_not_called()
+
+    def test_updaters_reddit_redditupdater_client_functionality(self, mocker):
         reddit_config = {
             "client_id": "test_client_id",
             "client_secret": "test_client_secret",
@@ -22,13 +31,13 @@ class TestUpdatersRedditRedditUpdater:
             "password": "test_password",
             "poll_interval": 15,
         }
-        mock_init = mocker.patch("updaters.reddit.BaseUpdater.__init__")
         mock_config = mocker.patch(
             "updaters.reddit.reddit_config", return_value=reddit_config
         )
         mock_client = mocker.patch("updaters.reddit.Reddit")
-        instance = RedditUpdater(1, 2, foo="bar")
-        mock_init.assert_called_once_with(1, 2, foo="bar")
+        instance = RedditUpdater()
+        assert instance.client == mock_client.return_value
+        assert instance.client == mock_client.return_value
         mock_config.assert_called_once_with()
         mock_client.assert_called_once_with(
             client_id="test_client_id",
@@ -37,7 +46,6 @@ class TestUpdatersRedditRedditUpdater:
             username="test_username",
             password="test_password",
         )
-        assert instance.client == mock_client.return_value
 
     # # _ids_from_url
     def test_updaters_reddit_redditupdater_ids_from_url_submission_permalink(self):
@@ -148,6 +156,19 @@ class TestUpdatersRedditRedditUpdater:
         assert submission_id == "abc123def"
         assert comment_id == "xyz789ghi"
 
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://old.reddit.com/r/test/comments/abc123/", ("abc123", None)),
+            ("https://reddit.com/r/test/comments/", (None, None)),
+            ("https://notreddit.com/r/test/comments/abc123/", (None, None)),
+            ("https://reddit.com/r/test/comments/abc123/post/déf4/", ("abc123", None)),
+            ("https://reddit.com/r/test/comments/abc123/post/de-f4/", ("abc123", None)),
+        ],
+    )
+    def test_updaters_reddit_redditupdater_ids_from_url_edge_cases(self, url, expected):
+        assert RedditUpdater()._ids_from_url(url) == expected
+
     # # add_reaction_to_message
     def test_updaters_reddit_redditupdater_add_reaction_to_message_functionality(
         self,
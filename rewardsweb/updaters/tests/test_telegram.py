@@ -4,11 +4,35 @@ import asyncio
 from pathlib import Path
 
 import pytest
-from telethon.errors import SessionPasswordNeededError
+from telethon.errors import (
+    FloodWaitError,
+    RPCError,
+    SessionPasswordNeededError,
+)
 
 import updaters.telegram
+from trackers.telegram import AsyncTokenBucket
 from updaters.base import BaseUpdater
-from updaters.telegram import TelegramUpdater
+from updaters.telegram import (
+    TELEGRAM_MAX_FLOOD_WAIT,
+    TELEGRAM_MAX_REPLIES_RATE,
+    TelegramUpdater,
+)
+
+
+def _updater_with_async_client(mocker, instance=None):
+    """Return updater with Telegram client's coroutine methods mocked.
+
+    :param mocker: pytest-mock fixture
+    :param instance: updater to set the client's methods to, new one if None
+    :type instance: :class:`TelegramUpdater`
+    :return: :class:`TelegramUpdater`
+    """
+    instance = instance or TelegramUpdater()
+    instance.client.connect = mocker.AsyncMock()
+    instance.client.is_user_authorized = mocker.AsyncMock(return_value=True)
+    instance.client.disconnect = mocker.AsyncMock()
+    return instance
 
 
 class TestUpdatersTelegramTelegramUpdater:
@@ -46,6 +70,59 @@ class TestUpdatersTelegramTelegramUpdater:
         )
         assert instance.client == mock_client.return_value
         assert instance._is_connected is False
+        assert isinstance(instance._limiter, AsyncTokenBucket)
+        assert instance._limiter.max_rate == TELEGRAM_MAX_REPLIES_RATE
+        assert instance._credentials_provider is None
+
+    def test_updaters_telegram_telegramtracker_init_credentials_provider(self, mocker):
+        mock_init = mocker.patch("updaters.telegram.BaseUpdater.__init__")
+        mocker.patch("updaters.telegram.TelegramClient")
+        provider = mocker.MagicMock()
+        instance = TelegramUpdater(1, credentials_provider=provider, foo="bar")
+        mock_init.assert_called_once_with(1, foo="bar")
+        assert instance._credentials_provider == provider
+
+    # # __aenter__
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_aenter_functionality(self, mocker):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        mock_ensure_connected = mocker.AsyncMock()
+        instance._ensure_connected = mock_ensure_connected
+        returned = await instance.__aenter__()
+        assert returned is instance
+        mock_ensure_connected.assert_awaited_once_with()
+
+    # # __aexit__
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_aexit_functionality(self, mocker):
+        mock_client_class = mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        instance.client.disconnect = mocker.AsyncMock()
+        instance._is_connected = True
+        await instance.__aexit__(None, None, None)
+        instance.client.disconnect.assert_awaited_once_with()
+        assert instance._is_connected is False
+        assert instance.client == mock_client_class.return_value
+
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_async_context_manager(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        instance.client.disconnect = mocker.AsyncMock()
+
+        async def mock_ensure_connected():
+            instance._is_connected = True
+
+        instance._ensure_connected = mock_ensure_connected
+        async with instance as updater:
+            assert updater is instance
+            assert instance._is_connected is True
+
+        instance.client.disconnect.assert_awaited_once_with()
+        assert instance._is_connected is False
 
     # updaters/tests/test_telegram.py (continued)
 
@@ -80,6 +157,26 @@ class TestUpdatersTelegramTelegramUpdater:
         mock_logger.info.assert_called_once_with("Added reply to message: test_url")
         mock_logger.error.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_add_reply_async_rate_limited(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        instance._ensure_connected = mocker.AsyncMock()
+        instance._parse_message_url = mocker.Mock(return_value=(-123456, 789))
+        calls = []
+        mock_acquire = mocker.AsyncMock(side_effect=lambda: calls.append("acquire"))
+        instance._limiter.acquire = mock_acquire
+        instance.client.send_message = mocker.AsyncMock(
+            side_effect=lambda **kwargs: calls.append("send")
+        )
+        mocker.patch("updaters.telegram.logger")
+        result = await instance._add_reply_async("test_url", "Test reply")
+        assert result is True
+        mock_acquire.assert_awaited_once_with()
+        assert calls == ["acquire", "send"]
+
     @pytest.mark.asyncio
     async def test_updaters_telegram_telegramupdater_add_reply_async_positive_chat_id(
         self, mocker
@@ -140,6 +237,7 @@ class TestUpdatersTelegramTelegramUpdater:
         mock_client_class = mocker.patch("updaters.telegram.TelegramClient")
         instance = TelegramUpdater()
         instance.client = mock_client_class.return_value
+        instance._is_connected = True
         # Mock methods
         mock_ensure_connected = mocker.AsyncMock()
         mock_parse_message_url = mocker.Mock(return_value=(-123456, 789))
@@ -164,6 +262,7 @@ class TestUpdatersTelegramTelegramUpdater:
             "Error adding reply to test_url: Failed to send message"
         )
         mock_logger.info.assert_not_called()
+        assert instance._is_connected is True
 
     @pytest.mark.asyncio
     async def test_updaters_telegram_telegramupdater_add_reply_async_empty_text(
@@ -191,6 +290,195 @@ class TestUpdatersTelegramTelegramUpdater:
         )
         mock_logger.info.assert_called_once_with("Added reply to message: test_url")
 
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_add_reply_async_flood_wait_retry(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        instance._is_connected = True
+        instance._ensure_connected = mocker.AsyncMock()
+        instance._parse_message_url = mocker.Mock(return_value=(-123456, 789))
+        flood_error = FloodWaitError(request=mocker.MagicMock(), capture=3)
+        mock_send_reply = mocker.AsyncMock(side_effect=[flood_error, None])
+        instance._send_reply = mock_send_reply
+        mock_sleep = mocker.patch(
+            "updaters.telegram.asyncio.sleep", new_callable=mocker.AsyncMock
+        )
+        mock_logger = mocker.patch("updaters.telegram.logger")
+        result = await instance._add_reply_async("test_url", "Test reply")
+        assert result is True
+        mock_sleep.assert_awaited_once_with(3)
+        assert mock_send_reply.await_args_list == [
+            mocker.call(-123456, 789, "Test reply"),
+            mocker.call(-123456, 789, "Test reply"),
+        ]
+        mock_logger.warning.assert_called_once_with(
+            "Flood wait of 3 seconds for test_url"
+        )
+        mock_logger.info.assert_called_once_with("Added reply to message: test_url")
+        mock_logger.error.assert_not_called()
+        assert instance._is_connected is True
+
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_add_reply_async_long_flood_wait(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        instance._is_connected = True
+        instance._ensure_connected = mocker.AsyncMock()
+        instance._parse_message_url = mocker.Mock(return_value=(-123456, 789))
+        flood_error = FloodWaitError(
+            request=mocker.MagicMock(), capture=TELEGRAM_MAX_FLOOD_WAIT + 1
+        )
+        mock_send_reply = mocker.AsyncMock(side_effect=flood_error)
+        instance._send_reply = mock_send_reply
+        mock_sleep = mocker.patch(
+            "updaters.telegram.asyncio.sleep", new_callable=mocker.AsyncMock
+        )
+        mock_logger = mocker.patch("updaters.telegram.logger")
+        result = await instance._add_reply_async("test_url", "Test reply")
+        assert result is False
+        mock_send_reply.assert_awaited_once()
+        mock_sleep.assert_not_called()
+        mock_logger.error.assert_called_once_with(
+            f"Flood wait of {TELEGRAM_MAX_FLOOD_WAIT + 1} seconds for test_url "
+            "is too long, giving up"
+        )
+        mock_logger.warning.assert_not_called()
+        assert instance._is_connected is True
+
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_add_reply_async_rpc_error(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        instance._is_connected = True
+        instance._ensure_connected = mocker.AsyncMock()
+        instance._parse_message_url = mocker.Mock(return_value=(-123456, 789))
+        rpc_error = RPCError(request=mocker.MagicMock(), message="CHAT_WRITE_FORBIDDEN")
+        instance._send_reply = mocker.AsyncMock(side_effect=rpc_error)
+        mock_logger = mocker.patch("updaters.telegram.logger")
+        result = await instance._add_reply_async("test_url", "Test reply")
+        assert result is False
+        mock_logger.warning.assert_called_once_with(
+            f"Error adding reply to test_url: {rpc_error}"
+        )
+        mock_logger.error.assert_not_called()
+        mock_logger.info.assert_not_called()
+        assert instance._is_connected is True
+
+    # # _send_reply
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_send_reply_functionality(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        instance._limiter.acquire = mocker.AsyncMock()
+        instance.client.send_message = mocker.AsyncMock()
+        await instance._send_reply(-123456, 789, "Test reply")
+        instance._limiter.acquire.assert_awaited_once_with()
+        instance.client.send_message.assert_awaited_once_with(
+            entity=-123456, message="Test reply", reply_to=789
+        )
+
+    # # _add_replies_async
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_add_replies_async_functionality(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        mock_add_reply = mocker.AsyncMock(side_effect=[True, False, True])
+        instance._add_reply_async = mock_add_reply
+        pairs = [("url1", "text1"), ("url2", "text2"), ("url3", "text3")]
+        returned = await instance._add_replies_async(pairs)
+        assert returned == [True, False, True]
+        assert mock_add_reply.await_args_list == [
+            mocker.call("url1", "text1"),
+            mocker.call("url2", "text2"),
+            mocker.call("url3", "text3"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_add_replies_async_for_no_pairs(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        assert await instance._add_replies_async([]) == []
+
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_add_replies_async_max_concurrent(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        mocker.patch("updaters.telegram.TELEGRAM_MAX_CONCURRENT_REPLIES", 2)
+        instance = TelegramUpdater()
+        in_flight, peak = 0, 0
+
+        async def add_reply(url, text):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return True
+
+        instance._add_reply_async = add_reply
+        returned = await instance._add_replies_async([("url", "text")] * 5)
+        assert returned == [True] * 5
+        assert peak == 2
+
+    # # _credential
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_credential_for_default_input(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        mock_input = mocker.patch("builtins.input", return_value="123456789")
+        mock_to_thread = mocker.patch(
+            "updaters.telegram.asyncio.to_thread",
+            new_callable=mocker.AsyncMock,
+            return_value="123456789",
+        )
+        returned = await instance._credential("Phone: ")
+        assert returned == "123456789"
+        mock_to_thread.assert_awaited_once_with(mock_input, "Phone: ")
+
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_credential_for_sync_provider(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        provider = mocker.MagicMock(return_value="12345")
+        instance = TelegramUpdater(credentials_provider=provider)
+        returned = await instance._credential("Code: ")
+        assert returned == "12345"
+        provider.assert_called_once_with("Code: ")
+
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_credential_for_async_provider(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        prompts = []
+
+        async def provider(prompt):
+            prompts.append(prompt)
+            return "2fapassword"
+
+        instance = TelegramUpdater(credentials_provider=provider)
+        mock_to_thread = mocker.patch("updaters.telegram.asyncio.to_thread")
+        returned = await instance._credential("Password: ")
+        assert returned == "2fapassword"
+        assert prompts == ["Password: "]
+        mock_to_thread.assert_not_called()
+
     # # _ensure_connected
     @pytest.mark.asyncio
     async def test_updaters_telegram_telegramupdater_ensure_connected_success(
@@ -307,6 +595,28 @@ class TestUpdatersTelegramTelegramUpdater:
         instance.client.connect.assert_called_once()
         instance.client.is_user_authorized.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_ensure_connected_uses_provider(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        provider = mocker.MagicMock(side_effect=["123456789", "12345"])
+        instance = TelegramUpdater(credentials_provider=provider)
+        instance.client.connect = mocker.AsyncMock()
+        instance.client.is_user_authorized = mocker.AsyncMock(return_value=False)
+        instance.client.send_code_request = mocker.AsyncMock()
+        instance.client.sign_in = mocker.AsyncMock()
+        mock_input = mocker.patch("builtins.input")
+        await instance._ensure_connected()
+        assert instance._is_connected is True
+        assert provider.call_args_list == [
+            mocker.call("Please enter your phone number: "),
+            mocker.call("Please enter the code you received: "),
+        ]
+        instance.client.send_code_request.assert_awaited_once_with("123456789")
+        instance.client.sign_in.assert_awaited_once_with("123456789", "12345")
+        mock_input.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_updaters_telegram_telegramupdater_ensure_connected_session_password(
         self, mocker
@@ -369,69 +679,83 @@ class TestUpdatersTelegramTelegramUpdater:
         returned = instance._parse_message_url("https://t.me/c/-1234/567")
         assert returned == (-1234, 567)
 
-    # # _process_action
-    def test_updaters_telegram_telegramupdater_process_action_success(self, mocker):
-        # Mock the TelegramClient
-        mock_client_class = mocker.patch("updaters.telegram.TelegramClient")
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://t.me/c/1234/567", (1234, 567)),
+            ("https://t.me/c/-1234/567/", (-1234, 567)),
+            ("https://t.me/-1001234567890/42", (-1001234567890, 42)),
+        ],
+    )
+    def test_updaters_telegram_telegramupdater_parse_message_url_for_variants(
+        self, mocker, url, expected
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
         instance = TelegramUpdater()
-        instance.client = mock_client_class.return_value
-        action_callback = mocker.MagicMock()
-        # Mock asyncio loop
-        mock_loop = mocker.MagicMock()
-        mock_loop.is_closed.return_value = False  # Add this line
-        mock_new_event_loop = mocker.patch(
-            "asyncio.new_event_loop", return_value=mock_loop
-        )
-        mock_set_event_loop = mocker.patch("asyncio.set_event_loop")
-        # Mock logger
-        mock_logger = mocker.patch("updaters.telegram.logger")
-        # Call the method
-        result = instance._process_action(action_callback, "test_url", "Test reply")
-        # Assertions
-        assert result == mock_loop.run_until_complete.return_value
-        mock_new_event_loop.assert_called_once()
-        mock_set_event_loop.assert_called_once_with(mock_loop)
-        mock_loop.run_until_complete.assert_called_once_with(
-            action_callback("test_url", "Test reply")
-        )
-        # loop.close() should be called since loop.is_closed() returns False
-        mock_loop.close.assert_called_once()
-        mock_logger.error.assert_not_called()
+        assert instance._parse_message_url(url) == expected
 
-    def test_updaters_telegram_telegramupdater_process_action_with_connected_client(
+    def test_updaters_telegram_telegramupdater_parse_message_url_error_message(
         self, mocker
     ):
-        # Mock the TelegramClient
-        mock_client_class = mocker.patch("updaters.telegram.TelegramClient")
+        mocker.patch("updaters.telegram.TelegramClient")
         instance = TelegramUpdater()
-        instance.client = mock_client_class.return_value
-        instance._is_connected = True  # Client is connected
+        with pytest.raises(ValueError, match="Invalid Telegram message URL: foo"):
+            instance._parse_message_url("foo")
 
-        # Create a real async function for the callback
-        async def mock_action_callback(*args):
+    # # _run_connected
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_run_connected_functionality(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        calls = []
+        instance._ensure_connected = mocker.AsyncMock(
+            side_effect=lambda: calls.append("connect")
+        )
+        instance.client.disconnect = mocker.AsyncMock(
+            side_effect=lambda: calls.append("disconnect")
+        )
+
+        async def action_callback(url, text):
+            calls.append((url, text))
             return True
 
-        # Mock asyncio loop
-        mock_loop = mocker.MagicMock()
-        # Set the return value to True
-        mock_loop.run_until_complete.return_value = True
-        mock_loop.is_closed.return_value = False
-        mock_new_event_loop = mocker.patch(
-            "asyncio.new_event_loop", return_value=mock_loop
-        )
+        returned = await instance._run_connected(action_callback, "url", "text")
+        assert returned is True
+        assert calls == ["connect", ("url", "text"), "disconnect"]
+
+    @pytest.mark.asyncio
+    async def test_updaters_telegram_telegramupdater_run_connected_action_error(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = TelegramUpdater()
+        instance._ensure_connected = mocker.AsyncMock()
+        instance.client.disconnect = mocker.AsyncMock()
+        action_callback = mocker.AsyncMock(side_effect=ValueError("Action error"))
+        with pytest.raises(ValueError, match="Action error"):
+            await instance._run_connected(action_callback, "url")
+
+        instance.client.disconnect.assert_awaited_once_with()
+        assert instance._is_connected is False
+
+    # # _process_action
+    def test_updaters_telegram_telegramupdater_process_action_success(self, mocker):
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = _updater_with_async_client(mocker)
+        mock_new_event_loop = mocker.spy(asyncio, "new_event_loop")
         mocker.patch("asyncio.set_event_loop")
-        # Mock logger
         mock_logger = mocker.patch("updaters.telegram.logger")
-        # Call the method
-        result = instance._process_action(
-            mock_action_callback, "test_url", "Test reply"
-        )
-        # Assertions
+        action_callback = mocker.AsyncMock(return_value=True)
+        result = instance._process_action(action_callback, "test_url", "Test reply")
         assert result is True
-        mock_new_event_loop.assert_called_once()
-        # Check that run_until_complete was called only once
-        assert mock_loop.run_until_complete.call_count == 1
-        mock_loop.close.assert_called_once()
+        action_callback.assert_awaited_once_with("test_url", "Test reply")
+        instance.client.connect.assert_awaited_once_with()
+        instance.client.disconnect.assert_awaited_once_with()
+        # neither event loop nor client are left open after the action
+        assert mock_new_event_loop.spy_return.is_closed()
+        assert instance._is_connected is False
         mock_logger.error.assert_not_called()
 
     def test_updaters_telegram_telegramupdater_process_action_loop_creation_error(
@@ -457,88 +781,34 @@ class TestUpdatersTelegramTelegramUpdater:
             "Error raised for creation1: Loop creation failed"
         )
 
-    def test_updaters_telegram_telegramupdater_process_action_with_existing_loop_error(
+    def test_updaters_telegram_telegramupdater_process_action_connection_error(
         self, mocker
     ):
-        # Mock the TelegramClient
-        mock_client_class = mocker.patch("updaters.telegram.TelegramClient")
-        instance = TelegramUpdater()
-        instance.client = mock_client_class.return_value
-        action_callback = mocker.MagicMock()
-        action_callback.__name__ = "execution1"
-        # Mock asyncio with a loop that raises an exception
-        mock_loop = mocker.MagicMock()
-        mock_loop.run_until_complete.side_effect = Exception("Loop execution error")
-        mock_loop.is_closed.return_value = False  # Add this line
-        mock_loop.close = mocker.MagicMock()
-        mocker.patch("asyncio.new_event_loop", return_value=mock_loop)
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = _updater_with_async_client(mocker)
+        instance.client.connect.side_effect = Exception("Connection failed")
+        mock_new_event_loop = mocker.spy(asyncio, "new_event_loop")
         mocker.patch("asyncio.set_event_loop")
-        # Mock logger
         mock_logger = mocker.patch("updaters.telegram.logger")
-        # Call the method
-        result = instance._process_action(action_callback, "test_url", "Test reply")
-        # Assertions
-        assert result is False
-        mock_loop.run_until_complete.assert_called_once_with(
-            action_callback("test_url", "Test reply")
-        )
-        # Should still close the loop even on error
-        mock_loop.close.assert_called_once()
-        mock_logger.error.assert_called_once_with(
-            "Error raised for execution1: Loop execution error"
-        )
 
-    def test_updaters_telegram_telegramupdater_process_action_close_error(self, mocker):
-        """Test that exception in finally block doesn't override successful result."""
-        # Mock the TelegramClient
-        mock_client_class = mocker.patch("updaters.telegram.TelegramClient")
-        instance = TelegramUpdater()
-        instance.client = mock_client_class.return_value
-
-        # Create a real async function for the callback
-        async def mock_action_callback(*args):
+        async def action_callback(url, text):
             return True
 
-        # Mock asyncio loop that succeeds but has error on close
-        mock_loop = mocker.MagicMock()
-        # Action succeeds
-        mock_loop.run_until_complete.return_value = True
-        mock_loop.is_closed.return_value = False
-        # Close fails
-        mock_loop.close.side_effect = Exception("Close error")
-        mocker.patch("asyncio.new_event_loop", return_value=mock_loop)
-        mocker.patch("asyncio.set_event_loop")
-        # Mock logger
-        mock_logger = mocker.patch("updaters.telegram.logger")
-        # Call the method - should return True even though close fails
-        result = instance._process_action(
-            mock_action_callback, "test_url", "Test reply"
-        )
-        # Assertions
-        # The action succeeded, so result should be True despite close error
-        assert result is True
-        # Loop should have been attempted to close
-        mock_loop.close.assert_called_once()
-        # Error during close is caught and logged as warning
-        mock_logger.warning.assert_called_once_with(
-            "Error closing event loop: Close error"
+        result = instance._process_action(action_callback, "test_url", "Test reply")
+        assert result is False
+        mock_logger.error.assert_called_with(
+            "Error raised for action_callback: Connection failed"
         )
-        mock_logger.error.assert_not_called()  # No error from the action itself
+        instance.client.disconnect.assert_not_called()
+        assert mock_new_event_loop.spy_return.is_closed()
 
     def test_updaters_telegram_telegramupdater_process_action_url_on_exception(
         self, mocker
     ):
-        # Mock the TelegramClient
-        mock_client_class = mocker.patch("updaters.telegram.TelegramClient")
-        instance = TelegramUpdater()
-        instance.client = mock_client_class.return_value
-        # Mock asyncio
-        mock_loop = mocker.MagicMock()
-        mock_loop.run_until_complete.side_effect = ValueError("Invalid URL format")
-        mock_loop.is_closed.return_value = False  # Add this line
-        mocker.patch("asyncio.new_event_loop", return_value=mock_loop)
+        mocker.patch("updaters.telegram.TelegramClient")
+        instance = _updater_with_async_client(mocker)
+        mock_new_event_loop = mocker.spy(asyncio, "new_event_loop")
         mocker.patch("asyncio.set_event_loop")
-        # Mock logger
         mock_logger = mocker.patch("updaters.telegram.logger")
 
         # Create action callback that will raise an exception
@@ -554,32 +824,32 @@ class TestUpdatersTelegramTelegramUpdater:
         mock_logger.error.assert_called_once_with(
             "Error raised for name2: Invalid URL format"
         )
-        # Loop should still be closed
-        mock_loop.close.assert_called_once()
+        instance.client.disconnect.assert_awaited_once_with()
+        assert mock_new_event_loop.spy_return.is_closed()
 
-    def test_updaters_telegram_telegramupdater_process_action_loop_already_closed(
+    def test_updaters_telegram_telegramupdater_process_action_loop_close_error(
         self, mocker
     ):
-        """Test when loop is already closed in finally block."""
-        # Mock the TelegramClient
-        mock_client_class = mocker.patch("updaters.telegram.TelegramClient")
+        mocker.patch("updaters.telegram.TelegramClient")
         instance = TelegramUpdater()
-        instance.client = mock_client_class.return_value
-        action_callback = mocker.MagicMock()
-        # Mock asyncio with a loop that is already closed
         mock_loop = mocker.MagicMock()
-        mock_loop.is_closed.return_value = True  # Loop is already closed
+        mock_loop.run_until_complete.return_value = True
+        mock_loop.is_closed.return_value = False
+        mock_loop.close.side_effect = Exception("Close error")
         mocker.patch("asyncio.new_event_loop", return_value=mock_loop)
         mocker.patch("asyncio.set_event_loop")
-        # Mock logger
+        instance._run_connected = mocker.MagicMock()
         mock_logger = mocker.patch("updaters.telegram.logger")
-        # Call the method
+        action_callback = mocker.MagicMock()
         result = instance._process_action(action_callback, "test_url", "Test reply")
-        # Assertions
-        assert result == mock_loop.run_until_complete.return_value
-        # Should not try to close an already closed loop
-        mock_loop.close.assert_not_called()
-        mock_logger.error.assert_not_called()
+        assert result is True
+        instance._run_connected.assert_called_once_with(
+            action_callback, "test_url", "Test reply"
+        )
+        mock_loop.close.assert_called_once_with()
+        mock_logger.warning.assert_called_once_with(
+            "Error closing event loop: Close error"
+        )
 
     # # add_reaction_to_message
     def test_updaters_telegram_telegramupdater_add_reaction_to_message_functionality(
@@ -605,6 +875,34 @@ class TestUpdatersTelegramTelegramUpdater:
         assert returned == mocked_process.return_value
         mocked_process.assert_called_once_with(updater._add_reply_async, url, text)
 
+    # # add_replies_to_messages
+    def test_updaters_telegram_telegramupdater_add_replies_to_messages_functionality(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        mocked_process = mocker.patch(
+            "updaters.telegram.TelegramUpdater._process_action",
+            return_value=[True, False],
+        )
+        updater = TelegramUpdater()
+        pairs = (pair for pair in [("url1", "text1"), ("url2", "text2")])
+        returned = updater.add_replies_to_messages(pairs)
+        assert returned == [True, False]
+        mocked_process.assert_called_once_with(
+            updater._add_replies_async, [("url1", "text1"), ("url2", "text2")]
+        )
+
+    def test_updaters_telegram_telegramupdater_add_replies_to_messages_for_failure(
+        self, mocker
+    ):
+        mocker.patch("updaters.telegram.TelegramClient")
+        mocker.patch(
+            "updaters.telegram.TelegramUpdater._process_action", return_value=False
+        )
+        updater = TelegramUpdater()
+        returned = updater.add_replies_to_messages([("url1", "t1"), ("url2", "t2")])
+        assert returned == [False, False]
+
     # # message_from_url
     def test_updaters_telegram_telegramupdater_message_from_url_for_no_message_found(
         self, mocker